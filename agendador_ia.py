@@ -0,0 +1,119 @@
+"""
+agendador_ia.py - nível de detalhe (LOD) da IA dos inimigos
+
+Nem todo inimigo precisa pensar a cada tick. O agendador separa os inimigos
+em níveis pela distância até o jogador e pelo estado:
+  - nível cheio (todo tick): quem persegue, investiga, está revelado (marcado
+    pelo ping ou dentro da luz de um ping) ou está a até 'raio_cheio' do jogador;
+  - os demais (patrulha longe) rodam a cada 'periodo' ticks, conforme a faixa
+    de distância. Cada um roda num tick diferente (fatias de tempo), então a
+    carga fica espalhada pelos quadros em vez de cair toda no mesmo.
+O dt que um inimigo "pulou" fica acumulado e é entregue inteiro na vez dele,
+então a patrulha anda a mesma distância por segundo em qualquer nível. Para
+o desenho, fracoes() espalha esse passo maior pelos ticks que ele cobre.
+Uso: dts, ativos = agendador.agendar(motor, dt, pos_jogador, agora)
+     motor.guardar_anteriores(ativos); motor.step(dts, pos_jogador, ativos=ativos)
+"""
+
+import numpy as np
+
+from motor_inimigos import PATRULHA
+
+
+class AgendadorIA:
+    """
+    Parâmetros:
+      raio_cheio: até esta distância do jogador o inimigo roda todo tick
+      niveis: faixas (distancia_max, periodo) em ordem crescente de distância
+      periodo_longe: período de quem está além da última faixa
+    """
+    def __init__(self, raio_cheio, niveis=((900, 2), (1800, 4)), periodo_longe=8):
+        self.raio_cheio = raio_cheio
+        self.niveis = tuple(niveis)
+        self.periodo_longe = periodo_longe
+        self.tick = 0
+        self.acumulado = np.zeros(0)   # dt ainda não entregue a cada inimigo
+        self.passos = np.ones(0)       # ticks cobertos pelo último passo de cada inimigo
+        self.desde = np.zeros(0)       # ticks desde o último passo
+        self.geracao = np.zeros(0, dtype=np.int64)   # motor.geracao de quem ocupava cada vaga
+        self.contagem = {}             # período -> inimigos vivos nesse nível (1 = cheio)
+        self.atualizados = 0           # inimigos que rodaram no último tick
+
+    def limpar(self):
+        self.tick = 0
+        self.acumulado[:] = 0.0
+        self.passos[:] = 1.0
+        self.desde[:] = 0.0
+        self.geracao[:] = 0
+        self.contagem = {}
+        self.atualizados = 0
+
+    def _crescer(self, n):
+        capacidade = max(n, 2 * len(self.acumulado))
+        for nome, valor in (("acumulado", 0.0), ("passos", 1.0), ("desde", 0.0), ("geracao", 0)):
+            antigo = getattr(self, nome)
+            novo = np.full(capacidade, valor, dtype=antigo.dtype)
+            novo[:len(antigo)] = antigo
+            setattr(self, nome, novo)
+
+    def agendar(self, motor, dt, pos_jogador, agora, todos=False, revelados=None):
+        """
+        Decide quem roda neste tick.
+        todos: força o nível cheio para todos (ex.: pings atraindo a horda inteira)
+        revelados: máscara (n,) opcional de quem está na luz de um ping (nível cheio)
+        Retorna (dts, ativos): dt acumulado por inimigo e a máscara para motor.step().
+        """
+        n = motor.n
+        if len(self.acumulado) < n:
+            self._crescer(n)
+        acumulado = self.acumulado[:n]
+        vivo = motor.vivo[:n]
+        # vaga que ganhou outro inimigo desde o último tick (mesmo removido e recriado no
+        # meio do caminho, ex.: troca de chunks) começa sem atraso e sem o passo do anterior
+        novos = motor.geracao[:n] != self.geracao[:n]
+        if novos.any():
+            acumulado[novos] = 0.0
+            self.passos[:n][novos] = 1.0
+            self.desde[:n][novos] = 0.0
+            self.geracao[:n][novos] = motor.geracao[:n][novos]
+        acumulado[vivo] += dt
+
+        px, py = pos_jogador
+        d2 = (motor.x[:n] - px) ** 2 + (motor.y[:n] - py) ** 2
+        periodo = np.full(n, self.periodo_longe, dtype=np.int64)
+        for dist_max, p in reversed(self.niveis):
+            periodo[d2 <= dist_max * dist_max] = p
+        if todos:
+            periodo[:] = 1
+        else:
+            cheio = ((motor.estado[:n] != PATRULHA) | (d2 <= self.raio_cheio * self.raio_cheio)
+                     | (motor.revelado_ate[:n] >= agora))
+            if revelados is not None:
+                cheio |= revelados
+            periodo[cheio] = 1
+
+        # fatia de tempo: o inimigo i roda nos ticks em que (tick + i) é múltiplo do período dele
+        ativos = vivo & ((self.tick + np.arange(n)) % periodo == 0)
+        dts = acumulado.copy()
+        acumulado[ativos] = 0.0
+        # o desenho de quem rodou vai de x_ant a x ao longo dos ticks que o passo cobriu
+        desde = self.desde[:n]
+        desde[vivo] += 1.0
+        desde[ativos] = 0.0
+        self.passos[:n][ativos] = np.maximum(1.0, np.round(dts[ativos] / dt))
+        self.tick += 1
+
+        niveis, qtd = np.unique(periodo[vivo], return_counts=True)
+        self.contagem = dict(zip(niveis.tolist(), qtd.tolist()))
+        self.atualizados = int(np.count_nonzero(ativos))
+        return dts, ativos
+
+    def fracoes(self, interp, n):
+        """
+        Fração da interpolação do desenho (x_ant -> x) de cada um dos n inimigos.
+        interp: fração do tick atual (a mesma do jogador); quem roda todo tick usa ela mesma
+        """
+        fr = np.full(n, float(interp))
+        k = min(n, len(self.passos))
+        np.minimum((self.desde[:k] + interp) / self.passos[:k], 1.0, out=fr[:k])
+        return fr
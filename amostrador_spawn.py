@@ -0,0 +1,102 @@
+"""
+amostrador_spawn.py - escolha de posições livres para o respawn de itens
+
+Em vez de sortear pontos e testar um por um (tentativa e erro), o mapa é
+dividido em células e cada obstáculo (jogador, inimigos, itens vivos) bloqueia
+as células que o disco dele pode tocar. Sorteia-se então uma célula entre as
+livres e um ponto dentro dela: qualquer ponto devolvido respeita todas as
+distâncias mínimas (como num Poisson-disk), e quando não sobra célula livre a
+resposta é sempre None, sem depender da sorte.
+A grade cobre uma janela do mundo (largura x altura) a partir de 'origem'.
+Uso: pos = amostrador.amostrar(rng, [(xs, ys, raio), ...], origem=(cam_x, cam_y))
+"""
+
+import numpy as np
+
+
+class AmostradorSpawn:
+    """
+    Parâmetros:
+      largura, altura: tamanho da área amostrada
+      celula: lado da célula de ocupação em pixels
+      margem: distância mínima até a borda da área
+    """
+    def __init__(self, largura, altura, celula=20, margem=40):
+        self.celula = float(celula)
+        self.colunas = int(np.ceil(largura / celula))
+        self.linhas = int(np.ceil(altura / celula))
+        # células inteiramente dentro da área permitida (longe das bordas)
+        x0 = np.arange(self.colunas) * self.celula
+        y0 = np.arange(self.linhas) * self.celula
+        dentro_x = (x0 >= margem) & (x0 + self.celula <= largura - margem)
+        dentro_y = (y0 >= margem) & (y0 + self.celula <= altura - margem)
+        self.area = dentro_y[:, None] & dentro_x[None, :]
+        self._estenceis = {}   # raio -> deslocamentos (dl, dc) bloqueados
+        self.livres_ultima = 0
+
+    def _estencil(self, raio):
+        # deslocamentos de célula em que algum ponto da célula de destino pode ficar
+        # a menos de 'raio' de algum ponto da célula do obstáculo (bloqueio conservador)
+        e = self._estenceis.get(raio)
+        if e is None:
+            k = int(np.ceil(raio / self.celula)) + 1
+            d = np.arange(-k, k + 1)
+            dl, dc = np.meshgrid(d, d, indexing="ij")
+            gap_l = np.maximum(np.abs(dl) - 1, 0) * self.celula
+            gap_c = np.maximum(np.abs(dc) - 1, 0) * self.celula
+            perto = gap_l * gap_l + gap_c * gap_c < raio * raio
+            e = (dl[perto], dc[perto])
+            self._estenceis[raio] = e
+        return e
+
+    def ocupacao(self, bloqueios, origem=(0, 0), permitido=None):
+        """
+        Máscara (linhas x colunas) das células livres.
+        bloqueios: lista de (xs, ys, raio); xs/ys podem ser números ou arrays
+        origem: posição no mundo do canto superior esquerdo da área
+        permitido: máscara (linhas x colunas) opcional, ex.: células sem parede
+        """
+        livre = self.area.copy()
+        if permitido is not None:
+            livre &= permitido
+        for xs, ys, raio in bloqueios:
+            xs = np.atleast_1d(np.asarray(xs, dtype=np.float64)) - origem[0]
+            ys = np.atleast_1d(np.asarray(ys, dtype=np.float64)) - origem[1]
+            if len(xs) == 0:
+                continue
+            dls, dcs = self._estencil(float(raio))
+            # borda extra de k células: obstáculos logo fora da área também bloqueiam por dentro
+            k = int(np.abs(dls).max())
+            linhas, colunas = self.linhas + 2 * k, self.colunas + 2 * k
+            c = np.floor(xs / self.celula).astype(np.intp) + k
+            l = np.floor(ys / self.celula).astype(np.intp) + k
+            # marca as células dos centros e espalha pelo estêncil do raio,
+            # uma operação por deslocamento (não por obstáculo)
+            centros = np.zeros((linhas, colunas), dtype=bool)
+            ok = (c >= 0) & (c < colunas) & (l >= 0) & (l < linhas)
+            centros[l[ok], c[ok]] = True
+            if not centros.any():
+                continue
+            bloqueado = np.zeros_like(centros)
+            for dl, dc in zip(dls, dcs):
+                origem_l = slice(max(0, -dl), linhas - max(0, dl))
+                origem_c = slice(max(0, -dc), colunas - max(0, dc))
+                destino_l = slice(max(0, dl), linhas - max(0, -dl))
+                destino_c = slice(max(0, dc), colunas - max(0, -dc))
+                bloqueado[destino_l, destino_c] |= centros[origem_l, origem_c]
+            bloqueado = bloqueado[k:k + self.linhas, k:k + self.colunas]
+            livre &= ~bloqueado
+        return livre
+
+    def amostrar(self, rng, bloqueios, origem=(0, 0), permitido=None):
+        """
+        Ponto (x, y) sorteado uniformemente entre as células livres, ou None se não houver espaço.
+        rng: random.Random usado no sorteio (mesma semente = mesmo ponto)
+        """
+        livres = np.flatnonzero(self.ocupacao(bloqueios, origem, permitido))
+        self.livres_ultima = len(livres)
+        if len(livres) == 0:
+            return None
+        l, c = divmod(int(livres[rng.randrange(len(livres))]), self.colunas)
+        return (origem[0] + c * self.celula + rng.uniform(0.0, self.celula),
+                origem[1] + l * self.celula + rng.uniform(0.0, self.celula))
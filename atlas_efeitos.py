@@ -0,0 +1,91 @@
+"""
+atlas_efeitos.py - cache LRU de sprites de brilho (anéis e halos) pré-renderizados
+
+Os anéis do ping, o círculo central, o halo dos itens e o anel de revelação dos
+inimigos só variam em raio e transparência. Em vez de criar uma Surface SRCALPHA
+nova por efeito a cada quadro, o raio e o alpha são quantizados e o sprite
+correspondente é desenhado uma vez e reaproveitado.
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+PASSO_RAIO = 4                    # raios arredondados para múltiplos de 4 px
+PASSO_ALPHA = 16                  # alpha arredondado para múltiplos de 16
+ORCAMENTO_BYTES = 32 * 1024 * 1024  # memória máxima ocupada pelos sprites
+
+
+def _quantizar(valor, passo):
+    return int(round(valor / passo)) * passo
+
+
+class AtlasEfeitos:
+    """
+    Cache LRU limitado por memória (bytes de pixels) e por quantidade de sprites.
+    Os contadores 'acertos' e 'falhas' mostram a eficiência do cache.
+    """
+    def __init__(self, orcamento_bytes=ORCAMENTO_BYTES, max_sprites=512):
+        self.orcamento_bytes = orcamento_bytes
+        self.max_sprites = max_sprites
+        self._sprites = OrderedDict()   # chave -> Surface
+        self.bytes_usados = 0
+        self.acertos = 0
+        self.falhas = 0
+
+    def __len__(self):
+        return len(self._sprites)
+
+    def estatisticas(self):
+        total = self.acertos + self.falhas
+        return {
+            "sprites": len(self._sprites),
+            "bytes": self.bytes_usados,
+            "acertos": self.acertos,
+            "falhas": self.falhas,
+            "taxa_acerto": (self.acertos / total) if total else 0.0,
+        }
+
+    def limpar(self):
+        self._sprites.clear()
+        self.bytes_usados = 0
+
+    def _obter(self, chave):
+        s = self._sprites.get(chave)
+        if s is not None:
+            self._sprites.move_to_end(chave)
+            self.acertos += 1
+            return s
+        self.falhas += 1
+        raio, alpha, largura, cor = chave
+        s = pygame.Surface((raio*2, raio*2), pygame.SRCALPHA)
+        pygame.draw.circle(s, (*cor, alpha), (raio, raio), raio, width=largura)
+        self._sprites[chave] = s
+        self.bytes_usados += raio * raio * 16
+        # descarta os menos usados até caber no orçamento
+        while self._sprites and (self.bytes_usados > self.orcamento_bytes or len(self._sprites) > self.max_sprites):
+            (r, _, _, _), _ = self._sprites.popitem(last=False)
+            self.bytes_usados -= r * r * 16
+        return s
+
+    def anel(self, raio, alpha, largura, cor):
+        """Sprite de um anel (contorno de círculo). Retorna None se o raio arredondado for zero."""
+        raio = _quantizar(raio, PASSO_RAIO) if raio >= PASSO_RAIO else int(raio)
+        if raio < 1:
+            return None
+        alpha = max(0, min(255, _quantizar(alpha, PASSO_ALPHA)))
+        return self._obter((raio, alpha, int(largura), tuple(cor)))
+
+    def halo(self, raio, alpha, cor):
+        """Sprite de um círculo preenchido (halo)."""
+        return self.anel(raio, alpha, 0, cor)
+
+    def desenhar(self, tela, sprite, x, y):
+        """Desenha o sprite centralizado em (x, y)."""
+        if sprite is not None:
+            meio = sprite.get_width() // 2
+            tela.blit(sprite, (int(x) - meio, int(y) - meio))
+
+
+# atlas compartilhado pelo jogo (os sprites só são criados no primeiro uso)
+atlas = AtlasEfeitos()
@@ -7,17 +7,10 @@ Compatível com o main.py que te enviei.
 import time
 from pathlib import Path
 
-# tenta importar pygame.mixer (pode falhar em headless)
-try:
-    import pygame
-    try:
-        pygame.mixer.init()
-        PYGAME_MIXER_OK = True
-    except Exception:
-        PYGAME_MIXER_OK = False
-except Exception:
-    pygame = None
-    PYGAME_MIXER_OK = False
+import pygame
+
+# o mixer só é inicializado no primeiro som carregado (nada acontece no import)
+from subsistemas import mixer_ok
 
 # Silent fallback simples 
 class SilentChannel:
@@ -38,18 +31,24 @@ class SilentSound:
 def load_sound_safe(path_like):
     """Tenta carregar um som via pygame; se falhar, retorna SilentSound"""
     p = Path(path_like)
-    if not p.exists() or not PYGAME_MIXER_OK:
+    if not p.exists() or not mixer_ok():
         return SilentSound(p.name)
     try:
         return pygame.mixer.Sound(str(p))
     except Exception:
         return SilentSound(p.name)
 
+def _som(sound, nome):
+    # aceita caminho (carrega) ou um Sound já carregado (ex.: vindo do banco de sons)
+    if not sound:
+        return SilentSound(nome)
+    return load_sound_safe(sound) if isinstance(sound, (str, Path)) else sound
+
 # --- AudioManager simples com try_step() ---
 class AudioManager:
     def __init__(self, movement_sound=None, step_sound=None, step_cooldown=0.32):
-        self.movement_sound = load_sound_safe(movement_sound) if movement_sound else SilentSound("movement")
-        self.step_sound = load_sound_safe(step_sound) if step_sound else SilentSound("step")
+        self.movement_sound = _som(movement_sound, "movement")
+        self.step_sound = _som(step_sound, "step")
         self.step_cooldown = float(step_cooldown)
         self._last_step = 0.0
         self._movement_channel = None
@@ -0,0 +1,138 @@
+"""
+banco_sons.py - banco de sons em memória, com pré-carregamento e limite de bytes
+
+Os WAVs conhecidos (assets/sons/*.wav) são decodificados uma vez na
+inicialização. Depois disso, tocar um efeito pega o Sound (ou SilentSound) do
+cache pelo caminho absoluto, sem ler o disco. O cache é LRU e respeita um
+orçamento de bytes; para cada som ficam registrados o tempo de decodificação
+e a memória ocupada.
+"""
+
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+from audio_fallback import load_sound_safe
+
+ORCAMENTO_BYTES = 16 * 1024 * 1024   # memória máxima ocupada pelas amostras decodificadas
+
+
+def _chave(caminho):
+    # caminho absoluto normalizado, sem consultar o sistema de arquivos
+    return os.path.abspath(os.fspath(caminho))
+
+
+def _bytes_som(snd):
+    # amostras decodificadas = duração * frequência * canais * bytes por amostra
+    try:
+        import pygame
+        init = pygame.mixer.get_init()
+        if not init:
+            return 0
+        freq, formato, canais = init
+        return int(round(snd.get_length() * freq)) * canais * (abs(formato) // 8)
+    except Exception:
+        return 0
+
+
+class BancoSons:
+    """
+    Parâmetros:
+      orcamento_bytes: memória máxima das amostras em cache (os menos usados saem primeiro)
+      carregar: função caminho -> Sound/SilentSound (padrão: load_sound_safe)
+    """
+    def __init__(self, orcamento_bytes=ORCAMENTO_BYTES, carregar=load_sound_safe):
+        self.orcamento_bytes = orcamento_bytes
+        self.carregar = carregar
+        self._sons = OrderedDict()   # caminho absoluto -> Sound
+        self._info = {}              # caminho absoluto -> {"bytes", "decodificacao_ms"}
+        self.bytes_usados = 0
+        self.acertos = 0
+        self.falhas = 0
+        self.descartes = 0
+
+    def __len__(self):
+        return len(self._sons)
+
+    def __contains__(self, caminho):
+        return _chave(caminho) in self._sons
+
+    def obter(self, caminho):
+        """Sound (ou SilentSound) do arquivo; só decodifica se ainda não estiver em cache."""
+        chave = _chave(caminho)
+        snd = self._sons.get(chave)
+        if snd is not None:
+            self._sons.move_to_end(chave)
+            self.acertos += 1
+            return snd
+        self.falhas += 1
+        inicio = time.perf_counter()
+        snd = self.carregar(chave)
+        return self.guardar(chave, snd, (time.perf_counter() - inicio) * 1000.0)
+
+    def guardar(self, caminho, snd, decodificacao_ms=0.0):
+        """Coloca no cache um som já decodificado (ex.: numa thread de carregamento) e o retorna."""
+        chave = _chave(caminho)
+        antigo = self._info.pop(chave, None)
+        if antigo is not None:
+            self.bytes_usados -= antigo["bytes"]
+        tamanho = _bytes_som(snd)
+        self._sons[chave] = snd
+        self._info[chave] = {"bytes": tamanho, "decodificacao_ms": decodificacao_ms}
+        self.bytes_usados += tamanho
+        # descarta os menos usados até caber no orçamento (o recém-carregado fica)
+        while self.bytes_usados > self.orcamento_bytes and len(self._sons) > 1:
+            antiga, _ = self._sons.popitem(last=False)
+            self.bytes_usados -= self._info.pop(antiga)["bytes"]
+            self.descartes += 1
+        return snd
+
+    def precarregar(self, pasta, padrao="*.wav"):
+        """Decodifica todos os arquivos de 'pasta' que casam com 'padrao'. Retorna quantos."""
+        pasta = Path(pasta)
+        if not pasta.is_dir():
+            return 0
+        arquivos = sorted(pasta.glob(padrao))
+        for p in arquivos:
+            self.obter(p)
+        return len(arquivos)
+
+    def relatorio(self):
+        """Lista (nome, bytes, ms de decodificação) dos sons em cache, do mais pesado ao mais leve."""
+        linhas = [(Path(c).name, i["bytes"], i["decodificacao_ms"]) for c, i in self._info.items()]
+        return sorted(linhas, key=lambda l: -l[1])
+
+    def estatisticas(self):
+        total = self.acertos + self.falhas
+        return {
+            "sons": len(self._sons),
+            "bytes": self.bytes_usados,
+            "decodificacao_ms": sum(i["decodificacao_ms"] for i in self._info.values()),
+            "acertos": self.acertos,
+            "falhas": self.falhas,
+            "descartes": self.descartes,
+            "taxa_acerto": (self.acertos / total) if total else 0.0,
+        }
+
+    def limpar(self):
+        self._sons.clear()
+        self._info.clear()
+        self.bytes_usados = 0
+
+
+# banco compartilhado pelo jogo
+banco = BancoSons()
+
+
+if __name__ == "__main__":
+    # relatório de decodificação: python banco_sons.py [pasta]
+    import sys
+    from subsistemas import iniciar_audio
+    iniciar_audio()
+    pasta = sys.argv[1] if len(sys.argv) > 1 else Path("assets") / "sons"
+    banco.precarregar(pasta)
+    for nome, tamanho, ms in banco.relatorio():
+        print(f"{nome:<20} {tamanho / 1024:9.1f} KiB  {ms:7.2f} ms")
+    e = banco.estatisticas()
+    print(f"{e['sons']} sons, {e['bytes'] / 1024:.1f} KiB, {e['decodificacao_ms']:.2f} ms de decodificação")
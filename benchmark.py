@@ -0,0 +1,211 @@
+"""
+benchmark.py - cenários de desempenho para os laços de atualização e desenho
+
+Monta cenários fora da tela (driver "dummy"), variando a quantidade de
+inimigos, pings ativos, partículas vivas e itens não coletados, e mede
+separadamente JogoEco.atualizar, desenhar_jogo e desenhar_fim.
+Mostra quadros/s e percentis de latência por chamada, grava JSON e pode
+comparar com um resultado salvo (baseline), falhando se piorar além do limite.
+
+Uso:
+  python benchmark.py --saida base.json
+  python benchmark.py --baseline base.json --limite 0.15
+  python benchmark.py --cenario horda --quadros 300
+  python benchmark.py --inimigos 800 --pings 3 --particulas 2000 --itens 50
+"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+
+import numpy as np
+
+import main
+from simulacao import criar_jogo_headless, TeclasSimuladas
+
+DT = 1.0 / main.FPS
+
+# nome -> (inimigos, pings, partículas, itens)
+CENARIOS = {
+    "base":       (3,    0, 0,    2),
+    "pings":      (3,    4, 0,    2),
+    "particulas": (3,    0, 3000, 2),
+    "itens":      (3,    2, 0,    300),
+    "horda":      (2000, 0, 0,    2),
+    "misto":      (500,  2, 1000, 100),
+}
+
+
+def montar_cenario(jogo, inimigos, pings, particulas, itens, seed=0):
+    """Reinicia o jogo e povoa com as quantidades pedidas (posições reprodutíveis pela seed)."""
+    rng = random.Random(seed)
+    jogo.rng.seed(seed)
+    # só as quantidades pedidas: os chunks do mundo não geram inimigos/itens extras
+    jogo.mundo.povoar = False
+    jogo.reiniciar_jogo()
+    jogo.estado = main.EstadoJogo.JOGANDO
+    jogo.vida_jogador = 10**9   # o cenário não pode terminar no meio da medição
+    m = jogo.motor_inimigos
+    for _ in range(max(0, inimigos - len(jogo.inimigos))):
+        x = rng.uniform(20, main.LARGURA - 20)
+        y = rng.uniform(20, main.ALTURA - 20)
+        pontos = [(x, y), (x + rng.uniform(-120, 120), y + rng.uniform(-80, 80))]
+        jogo.inimigos.append(main.Inimigo(x, y, jogo.img_inimigo, pontos, motor=m, cronometro=jogo.cronometro))
+    jogo.itens.limpar()
+    for _ in range(itens):
+        jogo.itens.adicionar(rng.randint(40, main.LARGURA - 40), rng.randint(40, main.ALTURA - 40))
+    # pings em posições fixas; renovados a cada quadro para ficarem sempre ativos
+    posicoes_ping = [(rng.uniform(100, main.LARGURA - 100), rng.uniform(100, main.ALTURA - 100)) for _ in range(pings)]
+    return posicoes_ping
+
+
+def _manter_carga(jogo, posicoes_ping, particulas):
+    agora = jogo.cronometro.agora()
+    n = len(posicoes_ping)
+    # idades espalhadas ao longo da duração do ping
+    jogo.pings = [(x, y, agora - main.PING_DURACAO * 0.9 * (k + 0.5) / n) for k, (x, y) in enumerate(posicoes_ping)]
+    falta = particulas - len(jogo.particulas)
+    if falta > 0:
+        jogo.particulas.emitir(main.LARGURA / 2, main.ALTURA / 2, falta)
+
+
+def _estatisticas(amostras):
+    ms = np.asarray(amostras) * 1000.0
+    return {
+        "media_ms": float(ms.mean()),
+        "p50_ms": float(np.percentile(ms, 50)),
+        "p90_ms": float(np.percentile(ms, 90)),
+        "p99_ms": float(np.percentile(ms, 99)),
+        "max_ms": float(ms.max()),
+    }
+
+
+def medir(jogo, inimigos, pings, particulas, itens, quadros=240, aquecimento=30):
+    """Mede atualizar, desenhar_jogo e desenhar_fim num cenário. Retorna o dicionário de resultados."""
+    posicoes_ping = montar_cenario(jogo, inimigos, pings, particulas, itens)
+    cron = jogo.cronometro
+    teclas = TeclasSimuladas()
+    t_update = []
+    t_render = []
+    relogio = time.perf_counter
+    for q in range(aquecimento + quadros):
+        _manter_carga(jogo, posicoes_ping, particulas)
+        cron.avancar(DT)
+        t0 = relogio()
+        jogo.atualizar(DT, teclas)
+        t1 = relogio()
+        jogo.estado = main.EstadoJogo.JOGANDO
+        jogo.desenhar_jogo()
+        t2 = relogio()
+        if q >= aquecimento:
+            t_update.append(t1 - t0)
+            t_render.append(t2 - t1)
+
+    # tela final (independe do cenário, mas usa a pontuação atual)
+    jogo._fim_started = False
+    t_fim = []
+    for q in range(aquecimento + quadros):
+        cron.avancar(DT)
+        t0 = relogio()
+        jogo.desenhar_fim()
+        if q >= aquecimento:
+            t_fim.append(relogio() - t0)
+
+    quadro_medio = float(np.mean(t_update) + np.mean(t_render))
+    return {
+        "parametros": {"inimigos": inimigos, "pings": pings, "particulas": particulas, "itens": itens, "quadros": quadros},
+        "fps": 1.0 / quadro_medio if quadro_medio > 0 else float("inf"),
+        "atualizar": _estatisticas(t_update),
+        "desenhar_jogo": _estatisticas(t_render),
+        "desenhar_fim": _estatisticas(t_fim),
+        # inimigos por nível do agendador de IA (período em ticks -> quantidade) no último tick
+        "ia": {str(p): q for p, q in jogo.agendador_ia.contagem.items()},
+    }
+
+
+def comparar(resultados, baseline, limite):
+    """
+    Compara o p50 de cada etapa com o baseline.
+    Retorna a lista de regressões (textos); vazia se nada piorou mais que 'limite' (ex.: 0.15 = 15%).
+    """
+    regressoes = []
+    for nome, atual in resultados["cenarios"].items():
+        antigo = baseline.get("cenarios", {}).get(nome)
+        if not antigo:
+            continue
+        for etapa in ("atualizar", "desenhar_jogo", "desenhar_fim"):
+            a = antigo[etapa]["p50_ms"]
+            b = atual[etapa]["p50_ms"]
+            if a > 0 and (b - a) / a > limite:
+                regressoes.append(f"{nome}/{etapa}: p50 {a:.3f} ms -> {b:.3f} ms (+{(b - a) / a * 100:.0f}%)")
+    return regressoes
+
+
+def _imprimir(nome, r):
+    print(f"{nome:<12} {r['fps']:8.1f} fps", end="")
+    for etapa in ("atualizar", "desenhar_jogo", "desenhar_fim"):
+        e = r[etapa]
+        print(f" | {etapa} p50 {e['p50_ms']:7.3f} p99 {e['p99_ms']:7.3f}", end="")
+    if r.get("ia"):
+        print(" | ia " + " ".join(f"1/{p}:{q}" for p, q in r["ia"].items()), end="")
+    print()
+
+
+def main_benchmark(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark dos laços de atualização e desenho do ECO")
+    parser.add_argument("--cenario", action="append", choices=sorted(CENARIOS), help="cenário (pode repetir); padrão: todos")
+    parser.add_argument("--inimigos", type=int, help="cenário personalizado: quantidade de inimigos")
+    parser.add_argument("--pings", type=int, default=0)
+    parser.add_argument("--particulas", type=int, default=0)
+    parser.add_argument("--itens", type=int, default=2)
+    parser.add_argument("--quadros", type=int, default=240, help="quadros medidos por cenário")
+    parser.add_argument("--saida", help="grava os resultados em JSON")
+    parser.add_argument("--baseline", help="JSON de uma execução anterior para comparar")
+    parser.add_argument("--limite", type=float, default=0.15, help="piora máxima aceita no p50 (fração)")
+    args = parser.parse_args(argv)
+
+    if args.inimigos is not None:
+        cenarios = {"personalizado": (args.inimigos, args.pings, args.particulas, args.itens)}
+    else:
+        cenarios = {n: CENARIOS[n] for n in (args.cenario or CENARIOS)}
+
+    jogo = criar_jogo_headless()
+    resultados = {
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "data": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "cenarios": {},
+    }
+    for nome, params in cenarios.items():
+        r = medir(jogo, *params, quadros=args.quadros)
+        resultados["cenarios"][nome] = r
+        _imprimir(nome, r)
+
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as f:
+            json.dump(resultados, f, indent=2, ensure_ascii=False)
+        print("resultados gravados em", args.saida)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressoes = comparar(resultados, baseline, args.limite)
+        if regressoes:
+            print(f"REGRESSÃO (limite {args.limite * 100:.0f}%):")
+            for r in regressoes:
+                print("  " + r)
+            return 1
+        print(f"sem regressões acima de {args.limite * 100:.0f}% em relação a {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_benchmark())
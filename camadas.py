@@ -0,0 +1,35 @@
+"""
+camadas.py - camadas estáticas pré-compostas (menu, HUD, botões da tela final)
+
+Cada camada é desenhada uma vez numa Surface própria e guardada junto com
+uma "chave" que descreve tudo o que ela depende (tamanho da janela, textos,
+valores do HUD...). Enquanto a chave não muda, desenhar a camada é um único
+blit; quando muda, a camada é reconstruída.
+Uso: surf = camadas.camada("menu", (tamanho, textos), construir_menu)
+"""
+
+
+class CacheCamadas:
+    def __init__(self):
+        self._camadas = {}   # nome -> (chave, Surface)
+        self.reconstrucoes = 0
+
+    def camada(self, nome, chave, construir):
+        """
+        Retorna a Surface da camada 'nome'.
+        construir: função sem argumentos que cria a Surface (chamada só quando a chave muda)
+        """
+        atual = self._camadas.get(nome)
+        if atual is not None and atual[0] == chave:
+            return atual[1]
+        surf = construir()
+        self._camadas[nome] = (chave, surf)
+        self.reconstrucoes += 1
+        return surf
+
+    def invalidar(self, nome=None):
+        """Descarta uma camada (ou todas, se nome for None)."""
+        if nome is None:
+            self._camadas.clear()
+        else:
+            self._camadas.pop(nome, None)
@@ -0,0 +1,82 @@
+"""
+carregador_assets.py - leitura e decodificação de assets em segundo plano
+
+Imagens e sons são lidos e decodificados num pool de threads enquanto o menu
+já está sendo desenhado. Cada asset vira um Future; quando fica pronto, a
+função 'finalizar' (conversão de formato de pixel, registro no banco de sons,
+etc.) roda na thread principal, dentro de receber(). Quem precisa de um
+asset agora chama receber(nomes, bloquear=True) e espera só por ele.
+
+Os arquivos existentes são indexados uma vez (uma varredura da pasta de
+assets), então procurar entre vários nomes candidatos não toca o disco.
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+
+class CarregadorAssets:
+    """
+    Parâmetros:
+      raiz: pasta de assets a indexar
+      threads: quantidade de threads de leitura/decodificação
+    """
+    def __init__(self, raiz=Path("assets"), threads=4):
+        self.inicio = time.perf_counter()
+        self._indice = set()
+        for pasta, _, arquivos in os.walk(raiz):
+            for a in arquivos:
+                self._indice.add(Path(pasta) / a)
+        self._pool = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="assets")
+        self._pendentes = {}   # nome -> (Future, finalizar)
+        self.resultados = {}   # nome -> valor já finalizado
+        self.concluido_ms = None
+
+    def existe(self, caminho):
+        return Path(caminho) in self._indice
+
+    def encontrar(self, candidatos):
+        """Primeiro caminho de 'candidatos' que existe (consulta o índice, não o disco)."""
+        for p in candidatos:
+            if Path(p) in self._indice:
+                return Path(p)
+        return None
+
+    def arquivos(self, pasta, sufixo=""):
+        """Arquivos indexados diretamente dentro de 'pasta' (em ordem)."""
+        pasta = Path(pasta)
+        return sorted(p for p in self._indice if p.parent == pasta and p.name.endswith(sufixo))
+
+    def carregar(self, nome, ler, finalizar=None):
+        """
+        Agenda ler() numa thread. O resultado passa por finalizar(valor) na thread
+        principal e fica em resultados[nome].
+        """
+        self._pendentes[nome] = (self._pool.submit(ler), finalizar)
+
+    @property
+    def pendentes(self):
+        return len(self._pendentes)
+
+    def pronto(self, nome):
+        return nome in self.resultados
+
+    def receber(self, nomes=None, bloquear=False):
+        """
+        Finaliza os assets cujas leituras já terminaram (ou espera por elas, se bloquear).
+        nomes: limita a espera/finalização a estes assets (padrão: todos)
+        Retorna quantos ainda estão pendentes.
+        """
+        alvo = list(self._pendentes) if nomes is None else [n for n in nomes if n in self._pendentes]
+        for nome in alvo:
+            futuro, finalizar = self._pendentes[nome]
+            if not bloquear and not futuro.done():
+                continue
+            del self._pendentes[nome]
+            valor = futuro.result()
+            self.resultados[nome] = finalizar(valor) if finalizar else valor
+        if not self._pendentes and self.concluido_ms is None:
+            self.concluido_ms = (time.perf_counter() - self.inicio) * 1000.0
+        return len(self._pendentes)
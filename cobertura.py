@@ -0,0 +1,84 @@
+"""
+cobertura.py - grade de cobertura de luz (baixa resolução) montada uma vez por quadro
+
+Cada célula guarda quais luzes a iluminam: o ping (que revela itens e
+inimigos) e a luz própria do jogador (que só clareia a névoa). A grade é
+construída a partir de self.pings e da posição do jogador; depois disso
+"este ponto está revelado?" é uma consulta O(1). A grade cobre só a região
+do mundo em volta da câmera (origem informada em reconstruir). A névoa escura (mapa_luz.py)
+usa as mesmas luzes e raios, então o que aparece na tela e o que a lógica
+considera revelado continuam sendo a mesma coisa.
+"""
+
+import numpy as np
+
+LUZ_PING = 1       # célula dentro do raio de algum ping ativo
+LUZ_JOGADOR = 2    # célula dentro da luz do jogador
+
+
+class GradeCobertura:
+    """
+    Parâmetros:
+      largura, altura: tamanho da área coberta (pixels), a partir da origem
+      celula: lado de cada célula em pixels
+    """
+    def __init__(self, largura, altura, celula=8):
+        self.largura = largura
+        self.altura = altura
+        self.celula = celula
+        self.colunas = -(-largura // celula)
+        self.linhas = -(-altura // celula)
+        self.grade = np.zeros((self.linhas, self.colunas), dtype=np.uint8)
+        # centro de cada coluna / linha em pixels
+        self._cx = (np.arange(self.colunas) + 0.5) * celula
+        self._cy = (np.arange(self.linhas) + 0.5) * celula
+        self._chave = None
+        self.ox = self.oy = 0   # canto superior esquerdo da área coberta, em coordenadas do mundo
+
+    def _carimbar(self, x, y, raio, bit):
+        # marca as células cujo centro está a até 'raio' de (x, y)
+        c = self.celula
+        c0 = max(0, int((x - raio) // c)); c1 = min(self.colunas, int((x + raio) // c) + 1)
+        l0 = max(0, int((y - raio) // c)); l1 = min(self.linhas, int((y + raio) // c) + 1)
+        if c0 >= c1 or l0 >= l1:
+            return
+        dx = self._cx[c0:c1] - x
+        dy = self._cy[l0:l1] - y
+        dentro = (dy[:, None] ** 2 + dx[None, :] ** 2) <= raio * raio
+        self.grade[l0:l1, c0:c1] |= (dentro * bit).astype(np.uint8)
+
+    def reconstruir(self, pings, raio_ping, pos_jogador, raio_jogador, origem=(0, 0)):
+        """
+        Refaz a grade. Se nenhuma luz mudou desde a última chamada, não faz nada.
+        pings: lista de (x, y, t)
+        origem: posição no mundo do canto superior esquerdo da grade
+        """
+        jx, jy = pos_jogador
+        ox, oy = int(origem[0]), int(origem[1])
+        # o raio do ping é fixo, então só a posição de cada ping importa
+        chave = (tuple((x, y) for (x, y, t) in pings), int(jx), int(jy), raio_ping, raio_jogador, ox, oy)
+        if chave == self._chave:
+            return False
+        self._chave = chave
+        self.ox, self.oy = ox, oy
+        self.grade[:] = 0
+        for (x, y, t) in pings:
+            self._carimbar(x - ox, y - oy, raio_ping, LUZ_PING)
+        self._carimbar(jx - ox, jy - oy, raio_jogador, LUZ_JOGADOR)
+        return True
+
+    def revelado(self, x, y):
+        """True se (x, y) está iluminado por algum ping."""
+        c = int((x - self.ox) // self.celula); l = int((y - self.oy) // self.celula)
+        if 0 <= c < self.colunas and 0 <= l < self.linhas:
+            return bool(self.grade[l, c] & LUZ_PING)
+        return False
+
+    def revelados(self, xs, ys):
+        """Versão vetorizada de revelado() para arrays de posições."""
+        c = ((np.asarray(xs) - self.ox) // self.celula).astype(np.intp)
+        l = ((np.asarray(ys) - self.oy) // self.celula).astype(np.intp)
+        dentro = (c >= 0) & (c < self.colunas) & (l >= 0) & (l < self.linhas)
+        res = np.zeros(len(c), dtype=bool)
+        res[dentro] = (self.grade[l[dentro], c[dentro]] & LUZ_PING) != 0
+        return res
@@ -0,0 +1,32 @@
+"""
+cronometro.py - fonte de tempo do jogo
+
+Toda a lógica pergunta o horário atual para um cronômetro em vez de chamar
+time.time() diretamente. No jogo normal é o relógio do sistema; na simulação
+headless é um relógio que só anda quando alguém chama avancar(dt), o que
+permite rodar horas de jogo em segundos.
+"""
+
+import time
+
+
+class CronometroReal:
+    """Relógio de parede (time.time())."""
+    def agora(self):
+        return time.time()
+
+    def avancar(self, dt):
+        # o tempo real anda sozinho
+        pass
+
+
+class CronometroSimulado:
+    """Relógio manual: começa em 'inicio' e só muda com avancar(dt)."""
+    def __init__(self, inicio=0.0):
+        self.tempo = float(inicio)
+
+    def agora(self):
+        return self.tempo
+
+    def avancar(self, dt):
+        self.tempo += dt
@@ -0,0 +1,195 @@
+"""
+efeitos_fim.py - efeitos da tela final (confetes, explosões, brilhos, fundo pulsante)
+
+Todo o estado fica em arrays NumPy de tamanho fixo, atualizados de uma vez
+por quadro. Nada é alocado durante o desenho: os confetes usam sprites já
+rotacionados (por ângulo, cor e tamanho), as explosões e os brilhos usam
+sprites por nível de transparência, e o fundo em degradê é guardado por
+passo do pulso. Tudo é enviado para a tela com Surface.blits().
+"""
+
+import math
+
+import numpy as np
+import pygame
+
+CORES = [(255, 90, 90), (255, 200, 70), (120, 220, 140), (120, 180, 255), (200, 120, 255)]
+QTD_CONFETES = 60
+QTD_EXPLOSOES = 3
+PEDACOS_EXPLOSAO = 18
+MAX_BRILHOS = 8
+ANGULOS_CONFETE = 24     # um retângulo se repete a cada 180°: passos de 7,5°
+TAMANHOS_CONFETE = (6, 8, 10, 12, 14)
+NIVEIS_ALPHA = 16
+PASSOS_PULSO = 12        # degradês diferentes guardados para o fundo pulsante
+COR_FUNDO = (8, 6, 18)
+
+
+class EfeitosFim:
+    """
+    Parâmetros:
+      largura, altura: tamanho da área da tela final
+      rng: numpy.random.Generator usado nas variações aleatórias
+    """
+    def __init__(self, largura, altura, rng=None):
+        self.largura = largura
+        self.altura = altura
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self._sprites_confete = {}   # (cor, tamanho, ângulo) -> Surface
+        self._sprites_ponto = {}     # (lado, cor RGB, nível) -> Surface
+        self._fundos = {}            # passo do pulso -> Surface opaca
+        self._selos = {}             # lado -> Surface
+        self.reiniciar()
+
+    def reiniciar(self):
+        """Sorteia confetes e explosões novos (início da tela final)."""
+        rng = self.rng
+        w, h = self.largura, self.altura
+        n = QTD_CONFETES
+        self.cx = rng.uniform(0, w, n)
+        self.cy = rng.uniform(-80, -10, n)
+        self.cvx = rng.uniform(-60, 60, n)
+        self.cvy = rng.uniform(80, 240, n)
+        self.crot = rng.uniform(0, math.pi*2, n)
+        self.cvrot = rng.uniform(-4, 4, n)
+        self.ccor = rng.integers(0, len(CORES), n)
+        self.ctam = rng.integers(0, len(TAMANHOS_CONFETE), n)
+
+        # explosões: PEDACOS_EXPLOSAO pedaços saindo de cada centro
+        centros_x = np.repeat(rng.uniform(w*0.25, w*0.75, QTD_EXPLOSOES), PEDACOS_EXPLOSAO)
+        centros_y = np.repeat(rng.uniform(h*0.25, h*0.45, QTD_EXPLOSOES), PEDACOS_EXPLOSAO)
+        m = len(centros_x)
+        ang = rng.uniform(0, math.pi*2, m)
+        vel = rng.uniform(80, 260, m)
+        self.ex = centros_x
+        self.ey = centros_y
+        self.evx = np.cos(ang) * vel
+        self.evy = np.sin(ang) * vel
+        self.evida = rng.uniform(0.6, 1.3, m)
+        self.eidade = np.zeros(m)
+        self.ecor = rng.integers(0, len(CORES), m)
+
+        # brilhos flutuantes perto da borda direita (slots fixos; alpha 0 = livre)
+        self.bx = np.zeros(MAX_BRILHOS)
+        self.by = np.zeros(MAX_BRILHOS)
+        self.bvy = np.zeros(MAX_BRILHOS)
+        self.balpha = np.zeros(MAX_BRILHOS)
+
+    def atualizar(self, dt):
+        rng = self.rng
+        w, h = self.largura, self.altura
+
+        # confetes: gravidade, rotação e reaparecimento no topo
+        self.cvy += 320 * dt
+        self.cx += self.cvx * dt
+        self.cy += self.cvy * dt
+        self.crot += self.cvrot * dt
+        caiu = self.cy > h + 40
+        k = int(caiu.sum())
+        if k:
+            self.cy[caiu] = rng.uniform(-60, -10, k)
+            self.cx[caiu] = rng.uniform(0, w, k)
+            self.cvy[caiu] = rng.uniform(80, 180, k)
+            self.cvx[caiu] = rng.uniform(-60, 60, k)
+
+        # explosões: desaceleram e somem ao fim da vida
+        self.eidade += dt
+        self.ex += self.evx * dt
+        self.ey += self.evy * dt
+        self.evx *= (1.0 - 2.0*dt)
+        self.evy *= (1.0 - 2.0*dt)
+
+        # brilhos: sobem devagar e apagam; às vezes nasce um novo num slot livre
+        self.by += self.bvy * dt
+        self.balpha = np.maximum(0.0, self.balpha - 80 * dt)
+        self.balpha[self.balpha <= 6] = 0.0
+        livres = np.flatnonzero(self.balpha == 0)
+        if len(livres) and rng.random() < 0.08:
+            i = livres[0]
+            self.bx[i] = rng.uniform(w*0.78, w*0.94)
+            self.by[i] = rng.uniform(h*0.25, h*0.6)
+            self.bvy[i] = rng.uniform(-30, -8)
+            self.balpha[i] = 255.0
+
+    # --- sprites pré-renderizados ---
+
+    def _confete(self, cor, tam, ang):
+        chave = (cor, tam, ang)
+        s = self._sprites_confete.get(chave)
+        if s is None:
+            tamanho = TAMANHOS_CONFETE[tam]
+            base = pygame.Surface((max(2, int(tamanho*1.6)), max(2, int(tamanho*0.9))), pygame.SRCALPHA)
+            base.fill(CORES[cor])
+            s = pygame.transform.rotate(base, ang * 180.0 / ANGULOS_CONFETE)
+            self._sprites_confete[chave] = s
+        return s
+
+    def _ponto(self, lado, cor, nivel):
+        chave = (lado, cor, nivel)
+        s = self._sprites_ponto.get(chave)
+        if s is None:
+            s = pygame.Surface((lado, lado), pygame.SRCALPHA)
+            s.fill((*cor, int(255 * (nivel + 1) / NIVEIS_ALPHA)))
+            self._sprites_ponto[chave] = s
+        return s
+
+    def fundo(self, pulso):
+        """Fundo com o degradê pulsante; um por passo do pulso (0.92 .. 1.08)."""
+        passo = int(round((pulso - 0.92) / 0.16 * (PASSOS_PULSO - 1)))
+        passo = max(0, min(PASSOS_PULSO - 1, passo))
+        s = self._fundos.get(passo)
+        if s is None:
+            w, h = self.largura, self.altura
+            grad = pygame.Surface((w, h), pygame.SRCALPHA)
+            p = 0.92 + 0.16 * passo / (PASSOS_PULSO - 1)
+            grd_r = int(max(w, h) * 0.6 * p)
+            pygame.draw.circle(grad, (30,30,80,160), (w//2, int(h*0.38)), grd_r)
+            pygame.draw.circle(grad, (40,18,30,120), (w//2, int(h*0.75)), int(grd_r*0.6))
+            # já composto sobre a cor de fundo: vira um blit opaco por quadro
+            s = pygame.Surface((w, h))
+            s.fill(COR_FUNDO)
+            s.blit(grad, (0, 0))
+            self._fundos[passo] = s
+        return s
+
+    def selo(self, lado):
+        s = self._selos.get(lado)
+        if s is None:
+            s = pygame.Surface((lado, lado), pygame.SRCALPHA)
+            pygame.draw.circle(s, (255,240,200,140), (lado//2, lado//2), lado//2)
+            pygame.draw.circle(s, (255,200,70,200), (lado//2, lado//2), lado//2 - 8, width=6)
+            self._selos[lado] = s
+        return s
+
+    # --- desenho ---
+
+    def desenhar_confetes(self, tela):
+        angs = ((self.crot % math.pi) / math.pi * ANGULOS_CONFETE).astype(np.int32) % ANGULOS_CONFETE
+        lista = []
+        for cor, tam, ang, x, y in zip(self.ccor.tolist(), self.ctam.tolist(), angs.tolist(),
+                                       self.cx.tolist(), self.cy.tolist()):
+            s = self._confete(cor, tam, ang)
+            lista.append((s, (int(x - s.get_width()/2), int(y - s.get_height()/2))))
+        tela.blits(lista, doreturn=False)
+
+    def desenhar_explosoes(self, tela):
+        vivos = np.flatnonzero(self.eidade < self.evida)
+        if len(vivos) == 0:
+            return
+        frac = 1.0 - self.eidade[vivos] / self.evida[vivos]
+        niveis = np.clip((frac * NIVEIS_ALPHA).astype(np.int32), 0, NIVEIS_ALPHA - 1).tolist()
+        xs = (self.ex[vivos].astype(np.int32) - 3).tolist()
+        ys = (self.ey[vivos].astype(np.int32) - 3).tolist()
+        cores = self.ecor[vivos].tolist()
+        tela.blits([(self._ponto(6, CORES[c], a), (x, y)) for c, a, x, y in zip(cores, niveis, xs, ys)],
+                   doreturn=False)
+
+    def desenhar_brilhos(self, tela):
+        vivos = np.flatnonzero(self.balpha > 0)
+        if len(vivos) == 0:
+            return
+        niveis = np.clip((self.balpha[vivos] / 255.0 * NIVEIS_ALPHA).astype(np.int32), 0, NIVEIS_ALPHA - 1).tolist()
+        xs = self.bx[vivos].astype(np.int32).tolist()
+        ys = self.by[vivos].astype(np.int32).tolist()
+        tela.blits([(self._ponto(8, (255,230,150), a), (x, y)) for a, x, y in zip(niveis, xs, ys)],
+                   doreturn=False)
@@ -0,0 +1,165 @@
+"""
+espacial.py - índice espacial em grade uniforme (spatial hash)
+
+Divide o mapa em células quadradas e guarda cada objeto no balde da célula
+onde ele está. Uma consulta por raio só olha as células que o círculo toca,
+em vez de percorrer todos os objetos com math.hypot.
+Uso: grade = GradeEspacial(48); grade.reconstruir(inimigos); grade.consultar(x, y, 48)
+Para muitos pontos em arrays NumPy, pares_proximos() faz a mesma busca vetorizada.
+"""
+
+import numpy as np
+
+
+class GradeEspacial:
+    """
+    Grade uniforme reconstruída (ou atualizada) a cada quadro.
+    Parâmetros:
+      tamanho_celula: lado da célula em pixels (idealmente próximo do raio de consulta mais comum)
+    """
+    def __init__(self, tamanho_celula):
+        self.tamanho_celula = float(tamanho_celula)
+        self.celulas = {}   # (cx, cy) -> lista de (obj, x, y)
+        self._qtd = 0
+
+    def __len__(self):
+        return self._qtd
+
+    def limpar(self):
+        self.celulas.clear()
+        self._qtd = 0
+
+    def inserir(self, obj, x, y):
+        """Guarda obj na célula de (x, y). A posição fica registrada como estava no momento da inserção."""
+        c = self.tamanho_celula
+        chave = (int(x // c), int(y // c))
+        balde = self.celulas.get(chave)
+        if balde is None:
+            self.celulas[chave] = [(obj, x, y)]
+        else:
+            balde.append((obj, x, y))
+        self._qtd += 1
+
+    def remover(self, obj, x, y):
+        """Tira obj da célula de (x, y) (a mesma posição usada em inserir)."""
+        c = self.tamanho_celula
+        chave = (int(x // c), int(y // c))
+        balde = self.celulas.get(chave)
+        if not balde:
+            return False
+        for k, (o, _, _) in enumerate(balde):
+            if o is obj or o == obj:
+                balde[k] = balde[-1]
+                balde.pop()
+                if not balde:
+                    del self.celulas[chave]
+                self._qtd -= 1
+                return True
+        return False
+
+    def reconstruir(self, objetos, posicao=None):
+        """
+        Esvazia a grade e insere todos os objetos de novo.
+        posicao: função obj -> (x, y); por padrão usa obj.x e obj.y
+        """
+        self.limpar()
+        if posicao is None:
+            for obj in objetos:
+                self.inserir(obj, obj.x, obj.y)
+        else:
+            for obj in objetos:
+                x, y = posicao(obj)
+                self.inserir(obj, x, y)
+
+    def _baldes(self, x, y, raio):
+        # percorre só as células cobertas pelo quadrado que envolve o círculo
+        c = self.tamanho_celula
+        cx0 = int((x - raio) // c); cx1 = int((x + raio) // c)
+        cy0 = int((y - raio) // c); cy1 = int((y + raio) // c)
+        celulas = self.celulas
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                balde = celulas.get((cx, cy))
+                if balde:
+                    yield balde
+
+    def consultar(self, x, y, raio):
+        """Retorna a lista de objetos a uma distância <= raio de (x, y)."""
+        r2 = raio * raio
+        encontrados = []
+        for balde in self._baldes(x, y, raio):
+            for obj, ox, oy in balde:
+                dx = ox - x
+                dy = oy - y
+                if dx*dx + dy*dy <= r2:
+                    encontrados.append(obj)
+        return encontrados
+
+    def existe_proximo(self, x, y, raio):
+        """Como consultar(), mas para no primeiro objeto encontrado (útil para testes de espaço livre)."""
+        r2 = raio * raio
+        for balde in self._baldes(x, y, raio):
+            for obj, ox, oy in balde:
+                dx = ox - x
+                dy = oy - y
+                if dx*dx + dy*dy <= r2:
+                    return True
+        return False
+
+    def reconstruir_arrays(self, objetos, xs, ys):
+        """Como reconstruir(), mas lendo as posições de arrays paralelos (ex.: MotorInimigos)."""
+        self.limpar()
+        for obj, x, y in zip(objetos, xs.tolist(), ys.tolist()):
+            self.inserir(obj, x, y)
+
+
+def pares_proximos(xs, ys, raio):
+    """
+    Versão vetorizada (NumPy) da consulta por raio para muitos pontos de uma vez.
+    Agrupa os pontos em células de lado 'raio' e compara cada ponto só com as
+    9 células vizinhas.
+    Retorna (i, j, dx, dy, dist) para todos os pares ordenados i != j com dist < raio,
+    onde dx = xs[i] - xs[j] e dy = ys[i] - ys[j].
+    """
+    n = len(xs)
+    if n < 2:
+        vazio_i = np.zeros(0, dtype=np.intp)
+        vazio_f = np.zeros(0, dtype=np.float64)
+        return vazio_i, vazio_i, vazio_f, vazio_f, vazio_f
+
+    cx = np.floor(xs / raio).astype(np.int64)
+    cy = np.floor(ys / raio).astype(np.int64)
+    cx -= cx.min()
+    cy -= cy.min()
+    # margem de 1 célula de cada lado para que os vizinhos nunca "deem a volta" na chave linear
+    largura = int(cx.max()) + 3
+    chave = (cy + 1) * largura + (cx + 1)
+    ordem = np.argsort(chave, kind="stable")
+    chaves_ord = chave[ordem]
+    indices = np.arange(n)
+
+    lista_i = []
+    lista_j = []
+    for oy in (-1, 0, 1):
+        for ox in (-1, 0, 1):
+            vizinha = chave + oy * largura + ox
+            ini = np.searchsorted(chaves_ord, vizinha, "left")
+            cont = np.searchsorted(chaves_ord, vizinha, "right") - ini
+            total = int(cont.sum())
+            if total == 0:
+                continue
+            # expande cada ponto i em 'cont[i]' pares com os pontos da célula vizinha
+            i = np.repeat(indices, cont)
+            desloc = np.arange(total) - np.repeat(np.cumsum(cont) - cont, cont)
+            j = ordem[np.repeat(ini, cont) + desloc]
+            lista_i.append(i)
+            lista_j.append(j)
+
+    # a própria célula (0, 0) sempre contém o ponto, então as listas nunca ficam vazias
+    i = np.concatenate(lista_i)
+    j = np.concatenate(lista_j)
+    dx = xs[i] - xs[j]
+    dy = ys[i] - ys[j]
+    dist = np.hypot(dx, dy)
+    ok = (i != j) & (dist < raio)
+    return i[ok], j[ok], dx[ok], dy[ok], dist[ok]
@@ -6,21 +6,13 @@ Uso: from audio_fallback import AudioManager, load_sound_safe
 import time
 from pathlib import Path
 
-# Tenta importar e inicializar pygame.mixer
-try:
-    import pygame
-    try:
-        pygame.mixer.init()
-        PYGAME_MIXER_OK = True
-    except Exception as e:
-        # mixer não inicializou (ex.: ambiente headless / sem áudio)
-        PYGAME_MIXER_OK = False
-        print("Aviso: pygame.mixer não pôde inicializar:", e)
-except Exception as e:
-    pygame = None
-    PYGAME_MIXER_OK = False
-    # não imprimir muito em produção
-    print("Aviso: pygame não disponível:", e)
+# sons decodificados uma vez e reaproveitados (play_once não relê o disco)
+from banco_sons import banco
+
+import pygame
+
+# pygame.mixer é inicializado no primeiro uso (mixer_ok), não no import
+from subsistemas import mixer_ok
 
 
 # Fallback silencioso 
@@ -65,7 +57,7 @@ def load_sound_safe(path_like):
     if not path.exists():
         # arquivo não existe -> fallback silencioso
         return SilentSound(path.name)
-    if not PYGAME_MIXER_OK:
+    if not mixer_ok():
         # mixer indisponível -> fallback silencioso
         return SilentSound(path.name)
     try:
@@ -88,13 +80,20 @@ class AudioManager:
     """
     def __init__(self, movement_sound=None, step_sound=None, step_cooldown=0.12):
         # Carrega com fallback
-        self.movement_sound = load_sound_safe(movement_sound) if movement_sound else SilentSound("movement_none")
-        self.step_sound = load_sound_safe(step_sound) if step_sound else SilentSound("step_none")
+        self.movement_sound = self._carregar(movement_sound, "movement_none")
+        self.step_sound = self._carregar(step_sound, "step_none")
         self.step_cooldown = float(step_cooldown)
         self._last_step_time = 0.0
 
         self._movement_channel = None
 
+    @staticmethod
+    def _carregar(sound, nome):
+        # caminho -> Sound via banco de sons; um Sound já carregado é usado direto
+        if not sound:
+            return SilentSound(nome)
+        return banco.obter(sound) if isinstance(sound, (str, Path)) else sound
+
     # Controle loop while moving
     def start_movement(self, volume=0.25):
         """
@@ -102,7 +101,7 @@ class AudioManager:
         Se o resultado for SilentSound, as chamadas são seguras e silenciosas.
         """
         try:
-            if PYGAME_MIXER_OK:
+            if mixer_ok():
                 # se já estiver ocupado, não reinicia
                 if self._movement_channel is None or not self._movement_channel.get_busy():
                     self._movement_channel = self.movement_sound.play(loops=-1)
@@ -163,8 +162,9 @@ class AudioManager:
     def play_once(self, sound):
         """
         Toca uma instância única de som passado (caminho ou Sound). Seguro.
+        Caminhos são resolvidos pelo banco de sons: o arquivo só é decodificado na primeira vez.
         """
-        snd = load_sound_safe(sound) if isinstance(sound, (str, Path)) else sound
+        snd = banco.obter(sound) if isinstance(sound, (str, Path)) else sound
         try:
             snd.play()
         except Exception:
@@ -0,0 +1,95 @@
+"""
+itens.py - armazenamento compacto dos itens coletáveis
+
+Os itens ficam em arrays paralelos (x, y, vivo) com uma lista de índices
+livres: coletar um item devolve o índice para a lista e o próximo item criado
+reaproveita a vaga, então os arrays não crescem ao longo da sessão. Um
+contador de vivos responde len() em O(1), e uma grade espacial própria é
+atualizada na criação e na remoção (não é refeita a cada quadro).
+Uso: i = itens.adicionar(x, y); for i in itens: ...; itens.remover(i)
+"""
+
+import numpy as np
+
+from espacial import GradeEspacial
+
+
+class ArmazemItens:
+    """
+    Parâmetros:
+      tamanho_celula: lado da célula da grade espacial dos itens
+      capacidade: vagas alocadas de início (dobra quando acabam)
+    """
+    def __init__(self, tamanho_celula=50, capacidade=16):
+        self.grade = GradeEspacial(tamanho_celula)
+        self.x = np.zeros(capacidade, dtype=np.float64)
+        self.y = np.zeros(capacidade, dtype=np.float64)
+        self.vivo = np.zeros(capacidade, dtype=np.bool_)
+        self.n = 0          # vagas já usadas alguma vez (vivas ou livres)
+        self._livres = []   # índices < n que podem ser reaproveitados
+        self._vivos = 0
+
+    def __len__(self):
+        return self._vivos
+
+    def __iter__(self):
+        """Índices dos itens vivos, em ordem crescente."""
+        return iter(self.indices().tolist())
+
+    @property
+    def capacidade(self):
+        return len(self.x)
+
+    def limpar(self):
+        """Remove todos os itens (mantém a memória já alocada)."""
+        self.n = 0
+        self._livres.clear()
+        self._vivos = 0
+        self.vivo[:] = False
+        self.grade.limpar()
+
+    def adicionar(self, x, y):
+        """Cria um item e retorna o índice dele nos arrays."""
+        if self._livres:
+            i = self._livres.pop()
+        else:
+            if self.n >= self.capacidade:
+                self._crescer(self.capacidade * 2)
+            i = self.n
+            self.n += 1
+        self.x[i] = x
+        self.y[i] = y
+        self.vivo[i] = True
+        self._vivos += 1
+        self.grade.inserir(i, x, y)
+        return i
+
+    def remover(self, i):
+        """Tira o item i do mapa (coletado); a vaga volta para a lista de livres."""
+        if not self.vivo[i]:
+            return
+        self.vivo[i] = False
+        self._vivos -= 1
+        self._livres.append(i)
+        self.grade.remover(i, self.x[i], self.y[i])
+
+    def _crescer(self, capacidade):
+        for nome in ("x", "y", "vivo"):
+            antigo = getattr(self, nome)
+            novo = np.zeros(capacidade, dtype=antigo.dtype)
+            novo[:self.n] = antigo[:self.n]
+            setattr(self, nome, novo)
+
+    def indices(self):
+        """Array com os índices dos itens vivos."""
+        return np.flatnonzero(self.vivo[:self.n])
+
+    def pos(self, i):
+        return (float(self.x[i]), float(self.y[i]))
+
+    def consultar(self, x, y, raio):
+        """Índices dos itens vivos a uma distância <= raio de (x, y)."""
+        return self.grade.consultar(x, y, raio)
+
+    def existe_proximo(self, x, y, raio):
+        return self.grade.existe_proximo(x, y, raio)
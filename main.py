@@ -3,20 +3,70 @@ main.py - ECO
 
 """
 
+import time
+_INICIO_IMPORT = time.perf_counter()   # para o --profile-startup medir os imports
+
 import pygame
 import sys
 import math
-import time
 import random
+import argparse
+import hashlib
+import struct
 from enum import Enum
+import numpy as np
 from pathlib import Path
 
 # Integração com fallback de áudio
-from audio_fallback import AudioManager, load_sound_safe, PYGAME_MIXER_OK
+from audio_fallback import AudioManager, load_sound_safe, SilentSound
+# Inicialização preguiçosa de vídeo/fontes/áudio e perfil da partida a frio
+from subsistemas import iniciar_video, iniciar_audio
+from perfil import perfil_inicio, perfilador
+# Sons decodificados uma vez e servidos da memória (cache LRU)
+from banco_sons import banco
+# Leitura/decodificação de imagens e sons em threads, com índice dos arquivos
+from carregador_assets import CarregadorAssets
+# Fonte de tempo injetável (relógio real ou simulado)
+from cronometro import CronometroReal, CronometroSimulado
+# Índice espacial para consultas por raio (separação, colisão, coleta, ping)
+from espacial import GradeEspacial
+# Simulação vetorizada dos inimigos (struct-of-arrays)
+from motor_inimigos import MotorInimigos
+# Itens em arrays com lista de vagas livres (coletados saem do mapa)
+from itens import ArmazemItens
+# Sorteio de posições livres (grade de ocupação) para o respawn
+from amostrador_spawn import AmostradorSpawn
+# Pool de partículas vetorizado
+from particulas import SistemaParticulas
+# Sprites de anéis/halos pré-renderizados (cache LRU)
+from atlas_efeitos import atlas
+# Fontes resolvidas uma vez e textos renderizados em cache
+from textos import texto
+# Grade de cobertura de luz: revelação O(1) a partir dos mesmos pings e raios da névoa
+from cobertura import GradeCobertura
+# Máscara de escuridão em baixa resolução com borda suave
+from mapa_luz import MapaLuz
+# Atualização parcial da janela (dirty rects)
+from regioes_sujas import RegioesSujas
+# Camadas estáticas desenhadas uma vez e reaproveitadas
+from camadas import CacheCamadas
+# Efeitos da tela final em arrays, com sprites e fundos pré-renderizados
+from efeitos_fim import EfeitosFim
+# Câmera e chunks do mundo (população e fundo gerados sob demanda)
+from mundo import Camera, Mundo
+# Paredes em tiles e campos de fluxo compartilhados para os inimigos
+from navegacao import MapaObstaculos, CamposFluxo
+# Nível de detalhe da IA: patrulheiros longe rodam em fatias de tempo
+from agendador_ia import AgendadorIA
+
+perfil_inicio.registrar("imports", (time.perf_counter() - _INICIO_IMPORT) * 1000.0)
 
 #configuração
 LARGURA, ALTURA = 900, 640   # tamanho da janela do jogo
 FPS = 60                     # taxa de quadros por segundo (velocidade do jogo)
+PASSO_SIM = 1.0 / FPS        # duração fixa de cada tick da simulação
+MAX_PASSOS_POR_QUADRO = 5    # ticks máximos de "recuperação" num único quadro (o resto é descartado)
+FPS_RENDER = FPS             # limite de quadros desenhados por segundo (0 = sem limite)
 
 # Diretórios principais para guardar imagens e sons
 DIR_ASSETS = Path("assets")          # pasta raiz dos assets
@@ -38,15 +88,72 @@ VEL_INIMIGO = 70               # velocidade normal
 VEL_INIMIGO_ALERTA = 120       # velocidade quando estão em alerta
 DIST_SEPARACAO_INIMIGO = 48    # distância mínima entre inimigos
 FORCA_SEPARACAO_INIMIGO = 40   # força que os afasta quando muito próximos
+# IA por nível de detalhe: patrulheiros longe do jogador rodam a cada N ticks
+# (quem persegue, investiga, está revelado ou a até PING_RAIO roda sempre)
+NIVEIS_IA = ((LARGURA, 2), (2 * LARGURA, 4))   # (distância máxima, período em ticks)
+PERIODO_IA_LONGE = 8           # período além da última faixa
 
 # Partículas (efeitos visuais)
 QTD_PARTICULAS = 14            # quantidade de partículas geradas
 VIDA_PARTICULA = 0.6           # tempo de vida de cada partícula (segundos)
 
+# Respawn de itens: distâncias mínimas de um item recém-surgido
+DIST_SPAWN_JOGADOR = 140       # até o jogador
+DIST_SPAWN_INIMIGO = 100       # até qualquer inimigo
+DIST_SPAWN_ITEM = 60           # até outro item
+
+# Mundo: maior que a tela, dividido em chunks gerados a partir da semente
+TAM_CHUNK = 512                # lado de cada chunk (pixels)
+CHUNKS_MUNDO = (16, 16)        # colunas x linhas de chunks
+MUNDO_LARGURA = TAM_CHUNK * CHUNKS_MUNDO[0]
+MUNDO_ALTURA = TAM_CHUNK * CHUNKS_MUNDO[1]
+RAIO_CARGA_CHUNKS = 1          # chunks além da tela que mantêm inimigos/itens carregados
+MAX_FUNDOS_CHUNK = 24          # fundos de chunk guardados em memória (LRU)
+TAM_TILE = 32                  # lado do tile de parede (pixels)
+RAIO_CAMPO_TILES = 48          # alcance (tiles) de cada campo de fluxo em volta do alvo (cobre os chunks carregados)
+RAIO_COLISAO = 14              # meia largura da caixa de colisão com paredes
+
 # Vida e invulnerabilidade do jogador
 VIDA_INICIAL = 3               # quantidade inicial de vidas
 INVULNERABILIDADE_INICIAL = 1.8  # tempo de invulnerabilidade ao iniciar
 COOLDOWN_DANO = 1.4              # tempo de invulnerabilidade após levar dano
+RAIO_LUZ_JOGADOR = 28            # luz própria do jogador (só clareia a névoa)
+FRACAO_MAPA_LUZ = 0.25           # resolução da máscara de escuridão (fração da tela)
+SUAVIDADE_LUZ = 16               # largura da borda suave das luzes (pixels)
+
+# Assets usados na partida: atributo -> (arquivo, tamanho, opaco) / atributo -> arquivo
+# (reiniciar_jogo espera só por estes; o resto do pré-carregamento continua em segundo plano)
+IMAGENS_JOGO = {
+    "img_jogador": ("jogador.png", (48,48), False),
+    "img_inimigo": ("inimigo.png", (48,48), False),
+    "img_fundo": ("fundo.png", (TAM_CHUNK, TAM_CHUNK), True),   # base do fundo de cada chunk
+    "img_item": ("item.png", (24,24), False),
+}
+SONS_JOGO = {
+    "snd_ping": "ping.wav",
+    "snd_ambiente": "ambiente.wav",
+    "snd_perigo": "perigo.wav",
+    "snd_passo": "passo.wav",
+    "snd_movimento": "movimento.wav",
+}
+
+
+# Textos do menu
+LINHAS_MENU = [
+    "Objetivo: Explore emitindo ecos (clarões) para revelar itens e inimigos.",
+    "Itens revelados têm um brilho e uma seta aponta para o item mais próximo.",
+    "",
+    "Controles:",
+    "  - Mover: WASD ou setas",
+    "  - Ping / Clarão/ Eco: ESPAÇO",
+    "  - Iniciar jogo: ENTER",
+    "  - Sair: ESC no menu",
+    "",
+    "Vida: começa com 3 vidas. ",
+
+    "Após levar dano há um curto tempo sem levar dano, para evitar perdas rápidas.",
+]
+RODAPE_MENU = "Pressione ENTER para começar  —  ESPAÇO para emitir eco durante o jogo"
 
 
 # ESTADOS 
@@ -66,6 +173,11 @@ class EstadoInimigo(Enum):
 
 # funções
 
+# Cria o motor de inimigos com as regras configuradas acima
+def novo_motor_inimigos():
+    return MotorInimigos(MUNDO_LARGURA, MUNDO_ALTURA, VEL_INIMIGO, VEL_INIMIGO_ALERTA,
+                         DIST_SEPARACAO_INIMIGO, FORCA_SEPARACAO_INIMIGO)
+
 # Procura possíveis caminhos para imagens, considerando traduções de nomes
 def _possible_image_paths(nome):
     traducoes = {
@@ -101,88 +213,31 @@ def _possible_sound_paths(nome):
         paths.append(DIR_ASSETS / "sounds" / n)   # pasta alternativa 'assets/sounds'
     return paths
 
-# Carrega imagem, se não encontrar cria um quadrado vermelho como fallback
-def carregar_imagem(nome, fallback_rect=None):
-    for p in _possible_image_paths(nome):
-        try:
-            if p.exists():
-                img = pygame.image.load(str(p)).convert_alpha()
-                return img
-        except Exception:
-            pass
+# Deixa a imagem pronta para desenhar: no tamanho final e no formato de pixel da tela
+# (convert() para imagens opacas; convert_alpha() + RLE para sprites com transparência)
+def preparar_imagem(img, tamanho=None, opaco=False):
+    if tamanho and img.get_size() != tuple(tamanho):
+        img = pygame.transform.scale(img, tamanho)
+    if opaco:
+        return img.convert()
+    img = img.convert_alpha()
+    img.set_alpha(255, pygame.RLEACCEL)
+    return img
+
+# Quadrado vermelho usado quando a imagem não existe ou não pôde ser lida
+def imagem_reserva(fallback_rect=None):
     w, h = fallback_rect if fallback_rect else (48,48)
     s = pygame.Surface((w,h), pygame.SRCALPHA)
     s.fill((180, 80, 80, 255))
     return s
 
-# Carrega som usando o fallback seguro (load_sound_safe) — sempre retorna algo seguro (Sound ou SilentSound)
-def carregar_som(nome):
-    for p in _possible_sound_paths(nome):
-        try:
-            # load_sound_safe aceita Path e fará fallback se o arquivo não existir ou mixer estiver off
-            return load_sound_safe(p)
-        except Exception:
-            pass
-    # caso nenhum caminho funcione, tenta carregar um path padrão (vai produzir SilentSound)
-    return load_sound_safe(DIR_SOM / nome)
-
-
-# partículas
-class Particula:
-    def __init__(self, x, y):
-        # posição inicial com pequena variação aleatória
-        self.x = x + random.uniform(-6,6)
-        self.y = y + random.uniform(-6,6)
-
-        # direção e velocidade aleatória
-        angulo = random.uniform(0, math.pi*2)
-        velocidade = random.uniform(80, 220)
-        self.vx = math.cos(angulo) * velocidade
-        self.vy = math.sin(angulo) * velocidade
-
-        # tempo de vida da partícula (com variação)
-        self.vida = random.uniform(VIDA_PARTICULA*0.6, VIDA_PARTICULA*1.1)
-        self.idade = 0.0
-
-        # tamanho e cor da partícula
-        self.tamanho = random.uniform(2.0, 5.0)
-        self.cor = (255, 215, 100)  # amarelo dourado
-
-    def atualizar(self, dt):
-        # aumenta idade da partícula
-        self.idade += dt
-        if self.idade < self.vida:
-            # desaceleração gradual
-            self.vx *= (1.0 - 3.0*dt)
-            self.vy *= (1.0 - 3.0*dt)
-
-            # gravidade puxando para baixo
-            self.vy += 140 * dt
-
-            # atualiza posição
-            self.x += self.vx * dt
-            self.y += self.vy * dt
-
-    def desenhar(self, tela):
-        # só desenha se ainda estiver "viva"
-        if self.idade >= self.vida:
-            return
-
-        # transparência proporcional ao tempo de vida
-        alpha = int(255 * (1 - (self.idade / self.vida)))
-
-        # cria superfície temporária para desenhar a partícula
-        s = pygame.Surface((int(self.tamanho*2), int(self.tamanho*2)), flags=pygame.SRCALPHA)
-        pygame.draw.circle(s, (*self.cor, alpha), (int(self.tamanho), int(self.tamanho)), int(self.tamanho))
-
-        # desenha na tela na posição correta
-        tela.blit(s, (int(self.x - self.tamanho), int(self.y - self.tamanho)))
-
 
 class Jogador:
-    def __init__(self, x, y, imagem):
+    def __init__(self, x, y, imagem, cronometro=None):
         # posição inicial e sprite
         self.x = x; self.y = y
+        self.x_ant = x; self.y_ant = y   # posição no tick anterior (interpolação)
+        self.cronometro = cronometro or CronometroReal()
         self.imagem = imagem
         self.rect = self.imagem.get_rect(center=(x,y))
 
@@ -192,9 +247,12 @@ class Jogador:
 
         # estado de movimento
         self.movendo = False
+        # paredes (navegacao.MapaObstaculos); None = sem colisão
+        self.obstaculos = None
 
         # controle de dano
         self.ultimo_dano = -999  # timestamp do último dano recebido
+        self.inicio_invencivel = self.cronometro.agora()  # início da invulnerabilidade de spawn
 
     def atualizar(self, dt, teclas):
         dx = dy = 0
@@ -210,12 +268,16 @@ class Jogador:
         # aplica movimento normalizado
         if dx or dy:
             norm = math.hypot(dx, dy)
+            x0, y0 = self.x, self.y
             self.x += (dx / norm) * VEL_JOGADOR * dt
             self.y += (dy / norm) * VEL_JOGADOR * dt
+            if self.obstaculos is not None:
+                # desliza ao longo da parede em vez de atravessá-la
+                self.x, self.y = self.obstaculos.resolver_ponto(x0, y0, self.x, self.y, RAIO_COLISAO)
 
-        # limites da tela
-        self.x = max(16, min(LARGURA - 16, self.x))
-        self.y = max(16, min(ALTURA - 16, self.y))
+        # limites do mundo
+        self.x = max(16, min(MUNDO_LARGURA - 16, self.x))
+        self.y = max(16, min(MUNDO_ALTURA - 16, self.y))
         self.rect.center = (int(self.x), int(self.y))
 
     def pode_ping(self, agora):
@@ -241,14 +303,17 @@ class Jogador:
     def registrar_dano(self, agora):
         self.ultimo_dano = agora
 
-    def desenhar(self, tela, agora):
+    def desenhar(self, tela, agora, interp=1.0, camera=(0, 0)):
+        # interp: fração entre o tick anterior (0) e o atual (1); camera: canto da tela no mundo
+        x = self.x_ant + (self.x - self.x_ant) * interp - camera[0]
+        y = self.y_ant + (self.y - self.y_ant) * interp - camera[1]
         # piscamento visual se invencível (piscando)
-        invencivel = (now := time.time()) - jogo.tempo_inicial_invicivel < INVULNERABILIDADE_INICIAL
-        pos_dano = (now - self.ultimo_dano) < COOLDOWN_DANO
+        invencivel = (agora - self.inicio_invencivel) < INVULNERABILIDADE_INICIAL
+        pos_dano = (agora - self.ultimo_dano) < COOLDOWN_DANO
         alpha = 255
         if invencivel or pos_dano:
             # piscar baseado em seno
-            t = math.sin(time.time() * 20.0)
+            t = math.sin(agora * 20.0)
             alpha = 180 if t > 0.3 else 60
 
         # aplica transparência
@@ -257,76 +322,90 @@ class Jogador:
         arr = pygame.Surface(self.imagem.get_size(), pygame.SRCALPHA)
         arr.fill((255,255,255,alpha))
         surf.blit(arr, (0,0), special_flags=pygame.BLEND_RGBA_MULT)
-        tela.blit(surf, surf.get_rect(center=(int(self.x), int(self.y))))
+        tela.blit(surf, surf.get_rect(center=(int(x), int(y))))
 
 
 class Inimigo:
-    def __init__(self, x, y, imagem, pontos_patrulha=None):
-        self.x = x; self.y = y
+    # "visão" de um índice do MotorInimigos: os dados ficam nos arrays do motor
+    def __init__(self, x, y, imagem, pontos_patrulha=None, motor=None, cronometro=None):
+        self.cronometro = cronometro or CronometroReal()
+        if motor is None:
+            # inimigo avulso (compatibilidade): ganha um motor só para ele
+            motor = novo_motor_inimigos()
+        self.motor = motor
         self.imagem = imagem
-        self.rect = imagem.get_rect(center=(x,y))
-        self.estado = EstadoInimigo.PATRULHA
-        self.pontos_patrulha = pontos_patrulha or [(x,y)]
-        self.idx_alvo = 0
-        self.pos_alerta = None
-        self.timer_alerta = 0.0
-        self.velocidade = VEL_INIMIGO
-        self.vivo = True
-        self.revelado_ate = 0.0
-
-    def atualizar(self, dt, pos_jogador, inimigos, atraido=False):
-        if not self.vivo: return
-        px, py = pos_jogador
+        self.i = motor.adicionar(x, y, pontos_patrulha)
 
-        # mudança de estado
-        if atraido:
-            self.estado = EstadoInimigo.PERSEGUIR
-        else:
-            if self.estado == EstadoInimigo.PERSEGUIR:
-                self.estado = EstadoInimigo.INVESTIGAR
-                self.pos_alerta = (px, py)
-                self.timer_alerta = 2.4
-
-        # separação entre inimigos (evita sobreposição)
-        sep_fx = sep_fy = 0.0
-        for outro in inimigos:
-            if outro is self or not outro.vivo: continue
-            dx = self.x - outro.x
-            dy = self.y - outro.y
-            dist = math.hypot(dx, dy)
-            if dist > 0 and dist < DIST_SEPARACAO_INIMIGO:
-                empurrar = (DIST_SEPARACAO_INIMIGO - dist) / DIST_SEPARACAO_INIMIGO
-                nx = dx / dist
-                ny = dy / dist
-                sep_fx += nx * empurrar * FORCA_SEPARACAO_INIMIGO
-                sep_fy += ny * empurrar * FORCA_SEPARACAO_INIMIGO
-
-        # comportamento por estado
-        if self.estado == EstadoInimigo.PATRULHA:
-            tx, ty = self.pontos_patrulha[self.idx_alvo]
-            self.mover_para(tx, ty, dt, self.velocidade)
-            if math.hypot(self.x - tx, self.y - ty) < 8:
-                self.idx_alvo = (self.idx_alvo + 1) % len(self.pontos_patrulha)
-        elif self.estado == EstadoInimigo.INVESTIGAR:
-            if self.pos_alerta:
-                tx, ty = self.pos_alerta
-                self.mover_para(tx, ty, dt, VEL_INIMIGO_ALERTA)
-                if math.hypot(self.x - tx, self.y - ty) < 10:
-                    self.timer_alerta -= dt
-                    if self.timer_alerta <= 0:
-                        self.estado = EstadoInimigo.PATRULHA
-                        self.pos_alerta = None
-        elif self.estado == EstadoInimigo.PERSEGUIR:
-            self.mover_para(px, py, dt, VEL_INIMIGO_ALERTA)
-
-        # aplica separação
-        self.x += sep_fx * dt
-        self.y += sep_fy * dt
-
-        # limites da tela
-        self.x = max(8, min(LARGURA-8, self.x))
-        self.y = max(8, min(ALTURA-8, self.y))
-        self.rect.center = (int(self.x), int(self.y))
+    # posição e estado lidos/escritos direto nos arrays
+    @property
+    def x(self): return float(self.motor.x[self.i])
+    @x.setter
+    def x(self, v): self.motor.x[self.i] = v
+
+    @property
+    def y(self): return float(self.motor.y[self.i])
+    @y.setter
+    def y(self, v): self.motor.y[self.i] = v
+
+    @property
+    def estado(self): return EstadoInimigo(int(self.motor.estado[self.i]))
+    @estado.setter
+    def estado(self, v): self.motor.estado[self.i] = v.value
+
+    @property
+    def idx_alvo(self): return int(self.motor.idx_alvo[self.i])
+    @idx_alvo.setter
+    def idx_alvo(self, v): self.motor.idx_alvo[self.i] = v
+
+    @property
+    def pos_alerta(self):
+        if not self.motor.tem_alerta[self.i]:
+            return None
+        return (float(self.motor.alerta_x[self.i]), float(self.motor.alerta_y[self.i]))
+    @pos_alerta.setter
+    def pos_alerta(self, pos):
+        self.motor.tem_alerta[self.i] = pos is not None
+        if pos is not None:
+            self.motor.alerta_x[self.i], self.motor.alerta_y[self.i] = pos
+
+    @property
+    def timer_alerta(self): return float(self.motor.timer_alerta[self.i])
+    @timer_alerta.setter
+    def timer_alerta(self, v): self.motor.timer_alerta[self.i] = v
+
+    @property
+    def velocidade(self): return float(self.motor.velocidade[self.i])
+    @velocidade.setter
+    def velocidade(self, v): self.motor.velocidade[self.i] = v
+
+    @property
+    def vivo(self): return bool(self.motor.vivo[self.i])
+    @vivo.setter
+    def vivo(self, v): self.motor.vivo[self.i] = v
+
+    @property
+    def revelado_ate(self): return float(self.motor.revelado_ate[self.i])
+    @revelado_ate.setter
+    def revelado_ate(self, v): self.motor.revelado_ate[self.i] = v
+
+    @property
+    def pontos_patrulha(self):
+        k = int(self.motor.n_pontos[self.i])
+        return [tuple(p) for p in self.motor.pontos[self.i, :k].tolist()]
+    @pontos_patrulha.setter
+    def pontos_patrulha(self, pontos): self.motor.definir_pontos(self.i, list(pontos))
+
+    @property
+    def rect(self):
+        return self.imagem.get_rect(center=(int(self.x), int(self.y)))
+
+    def atualizar(self, dt, pos_jogador, inimigos=None, atraido=False, grade=None):
+        # compatibilidade: avança só este inimigo; o jogo usa motor.step() para todos de uma vez
+        # (inimigos/grade são ignorados: o motor já conhece os vizinhos)
+        if not self.vivo: return
+        ativos = np.zeros(self.motor.n, dtype=bool)
+        ativos[self.i] = True
+        self.motor.step(dt, pos_jogador, atraido, ativos)
 
     def mover_para(self, tx, ty, dt, speed):
         dx = tx - self.x
@@ -343,46 +422,69 @@ class Inimigo:
         self.pos_alerta = pos_revelacao
         self.timer_alerta = 2.6
 
-    def desenhar(self, tela, agora):
+    def desenhar(self, tela, agora, interp=1.0, camera=(0, 0)):
+        m = self.motor
+        x = m.x_ant[self.i] + (m.x[self.i] - m.x_ant[self.i]) * interp - camera[0]
+        y = m.y_ant[self.i] + (m.y[self.i] - m.y_ant[self.i]) * interp - camera[1]
         revelado = (self.revelado_ate and agora <= self.revelado_ate)
         if revelado:
-            pulse = 1.0 + 0.25 * math.sin(time.time() * 10.0)
+            pulse = 1.0 + 0.25 * math.sin(agora * 10.0)
             r = int((max(self.imagem.get_width(), self.imagem.get_height())//2 + 8) * pulse)
-            s = pygame.Surface((r*2, r*2), pygame.SRCALPHA)
             alpha = int(160 * (1 - ((self.revelado_ate - agora) / PING_DURACAO)))
-            pygame.draw.circle(s, (180,220,255, max(60, alpha)), (r, r), r, width=3)
-            tela.blit(s, (int(self.x - r), int(self.y - r)))
-        tela.blit(self.imagem, self.imagem.get_rect(center=(int(self.x), int(self.y))))
+            atlas.desenhar(tela, atlas.anel(r, max(60, alpha), 3, (180,220,255)), x, y)
+        tela.blit(self.imagem, self.imagem.get_rect(center=(int(x), int(y))))
 
 # jogo
 class JogoEco:
-    def __init__(self):
-        pygame.init()
+    # cronometro: fonte de tempo (padrão: relógio simulado, avançado um tick fixo por vez em rodar());
+    # sem_audio: usa SilentSound em tudo; seed: semente de toda a aleatoriedade da simulação
+    def __init__(self, cronometro=None, sem_audio=False, seed=None):
+        self.cronometro = cronometro or CronometroSimulado()
+        self.sem_audio = sem_audio
+        # a lógica só usa self.rng / self.rng_np: mesma semente + mesmas teclas = mesma partida.
+        # Efeitos puramente visuais usam geradores próprios, para o desenho não mexer na sequência.
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.rng = random.Random(self.seed)
+        self.rng_np = np.random.default_rng(self.seed)
+        self.rng_visual = random.Random()
+        # gravador de sessão (replay.py); None = não grava
+        self.gravador = None
+        # só os subsistemas usados, cada um uma única vez (pygame.init() ligaria todos)
+        iniciar_video()
         # evita exception se já inicializado/ambiente sem áudio
-        try:
-            pygame.mixer.init()
-        except Exception:
-            pass
-
-        self.tela = pygame.display.set_mode((LARGURA, ALTURA))
-        pygame.display.set_caption("ECO DE LUZ")
+        audio_ok = False if sem_audio else iniciar_audio()
+
+        with perfil_inicio.etapa("vídeo (set_mode)"):
+            # janela de tamanho fixo (sem RESIZABLE): imagens preparadas e camadas valem a sessão inteira
+            self.tela = pygame.display.set_mode((LARGURA, ALTURA))
+            pygame.display.set_caption("ECO DE LUZ")
+        # regiões da tela alteradas no quadro; o menu só é redesenhado quando precisa
+        self.regioes = RegioesSujas((LARGURA, ALTURA))
+        self.camadas = CacheCamadas()
+        self._estado_desenhado = None
+        self._menu_sujo = True
+        self._caixa_perfil = None   # última caixa do perfilador na tela (F3)
         self.relogio = pygame.time.Clock()
+        # fração do próximo tick já decorrida quando o quadro é desenhado (1.0 = estado atual)
+        self.interp = 1.0
         self.estado = EstadoJogo.MENU
 
-        self.img_jogador = carregar_imagem("jogador.png", (48,48))
-        self.img_inimigo = carregar_imagem("inimigo.png", (48,48))
-        self.img_fundo = carregar_imagem("fundo.png", (LARGURA, ALTURA))
-        self.img_item = carregar_imagem("item.png", (24,24))
+        # imagens e sons são lidos/decodificados em threads enquanto o menu já aparece;
+        # a conversão para o formato da tela é feita na thread principal (_receber_assets)
+        self._inicio_init = time.perf_counter()
+        self._primeiro_quadro_ms = None
+        self._inicio_registrado = False
+        self.assets = CarregadorAssets(DIR_ASSETS)
+        for atributo, (nome, tamanho, opaco) in IMAGENS_JOGO.items():
+            setattr(self, atributo, None)
+            self._agendar_imagem(atributo, nome, tamanho, opaco)
 
-        # Carrega sons via fallback seguro (retorna Sound ou SilentSound)
-        self.snd_ping = carregar_som("ping.wav")  # tentar ping.wav; carregar_som já aplica fallback
-        # self.snd_ping2 = carregar_som("ping2.wav")  # se quiser alternativa
-        self.snd_ambiente = carregar_som("ambiente.wav")
-        self.snd_perigo = carregar_som("perigo.wav")
-        self.snd_passo = carregar_som("passo.wav")
+        # até os sons chegarem, os atributos tocam em silêncio
+        for atributo, nome in SONS_JOGO.items():
+            setattr(self, atributo, SilentSound(nome))
 
         # Cria canais apenas se o mixer estiver disponível; caso contrário, deixamos None
-        if PYGAME_MIXER_OK:
+        if audio_ok:
             try:
                 self.canal_ambiente = pygame.mixer.Channel(0)
                 self.canal_sfx = pygame.mixer.Channel(1)
@@ -393,50 +495,157 @@ class JogoEco:
             self.canal_ambiente = None
             self.canal_sfx = None
 
-        # Toca ambiente se possível (com canal quando disponível)
-        if self.snd_ambiente:
-            if self.canal_ambiente:
-                try:
-                    self.canal_ambiente.play(self.snd_ambiente, loops=-1)
-                    self.canal_ambiente.set_volume(0.45)
-                except Exception:
-                    # fallback: usar play direto no objeto (SilentSound ou Sound)
-                    try:
-                        self.snd_ambiente.play(loops=-1)
-                    except Exception:
-                        pass
-            else:
-                try:
-                    self.snd_ambiente.play(loops=-1)
-                except Exception:
-                    pass
-
-        # AudioManager: não usamos som de movimento em loop (passamos None), mas habilitamos som de passo com cooldown
-        # step_cooldown definido para 0.32s para replicar seu timing anterior
-        # --- ÁUDIO DE MOVIMENTO (loop contínuo, sem bips) ---
+        # AudioManager: o som de movimento (loop contínuo, sem bips) entra quando for decodificado
+        # --- ÁUDIO DE MOVIMENTO ---
         self.audio = AudioManager(
-            movement_sound=DIR_SOM / "movimento.wav",  # som contínuo
-            step_sound=None                            # nenhum som de passo
+            movement_sound=None,   # trocado por snd_movimento em _agendar_sons
+            step_sound=None        # nenhum som de passo
         )
+        self._sons_atributos = {}   # caminho do WAV -> atributos snd_* que o usam
+        if not sem_audio:
+            self._agendar_sons()
+        # o que reiniciar_jogo precisa esperar antes da primeira partida
+        self._assets_jogo = list(IMAGENS_JOGO) + [k for k, v in self._sons_atributos.items() if v]
 
         # flag interna para detectar início/fim do movimento
         self._audio_movendo = False
 
 
-        self.particulas = []
-        self.reiniciar_jogo()
-        self.overlay_escuro = pygame.Surface((LARGURA, ALTURA), flags=pygame.SRCALPHA)
+        self.particulas = SistemaParticulas(vida=VIDA_PARTICULA, rng=self.rng_np)
+        # grade espacial dos inimigos, reconstruída a cada quadro em atualizar()
+        self.grade_inimigos = GradeEspacial(DIST_SEPARACAO_INIMIGO)
+        # itens vivos (com grade espacial própria, atualizada ao criar/coletar)
+        self.itens = ArmazemItens(PING_RAIO // 4)
+        # posições livres para o respawn de itens (grade de ocupação)
+        self.amostrador_spawn = AmostradorSpawn(LARGURA, ALTURA, margem=40)
+        self.motor_inimigos = novo_motor_inimigos()
+        # quem roda em cada tick (nível de detalhe da IA); contagem por nível em agendador_ia.contagem
+        self.agendador_ia = AgendadorIA(PING_RAIO, NIVEIS_IA, PERIODO_IA_LONGE)
+        # cobertura de luz (pings + jogador), refeita uma vez por quadro; cobre só a área da tela
+        self.cobertura = GradeCobertura(LARGURA, ALTURA)
+        # mundo em chunks e a câmera que segue o jogador; a tela inicial é montada à mão
+        self.camera = Camera(LARGURA, ALTURA, MUNDO_LARGURA, MUNDO_ALTURA)
+        self.mundo = Mundo(self.seed, TAM_CHUNK, *CHUNKS_MUNDO, raio_carga=RAIO_CARGA_CHUNKS,
+                           max_fundos=MAX_FUNDOS_CHUNK, area_inicial=(0, 0, LARGURA, ALTURA))
+        # paredes (geradas pela semente em reiniciar_jogo) e os campos de fluxo até os alvos
+        self.obstaculos = MapaObstaculos(MUNDO_LARGURA, MUNDO_ALTURA, TAM_TILE)
+        self.campos_fluxo = CamposFluxo(self.obstaculos, RAIO_CAMPO_TILES, raio_colisao=RAIO_COLISAO)
+        self._obstaculos_seed = None
+        self.mundo.obstaculos = self.obstaculos
+        self.motor_inimigos.obstaculos = self.obstaculos
+        self.motor_inimigos.navegacao = self.campos_fluxo
+        self.motor_inimigos.raio_colisao = RAIO_COLISAO
+        self._origem_inimigos = {}   # índice no motor -> chunk de onde o inimigo veio
+        self._origem_itens = {}      # índice no armazém -> (cx, cy, k) do item de chunk
+        self.efeitos_fim = EfeitosFim(LARGURA, ALTURA)
+        self.mapa_luz = MapaLuz(*self.tela.get_size(), fracao=FRACAO_MAPA_LUZ, suavidade=SUAVIDADE_LUZ)
+        # a partida (jogador, inimigos, itens) só é montada em reiniciar_jogo, ao apertar ENTER
+
+    def _agendar_imagem(self, atributo, nome, tamanho, opaco):
+        caminho = self.assets.encontrar(_possible_image_paths(nome))
+
+        def ler():
+            # thread de carregamento: só lê e decodifica o arquivo
+            if caminho is None:
+                return None
+            try:
+                return pygame.image.load(str(caminho))
+            except Exception:
+                return None
+
+        def finalizar(img):
+            # thread principal: escala e converte para o formato da tela
+            with perfil_inicio.etapa("assets (conversão)"):
+                img = preparar_imagem(img if img is not None else imagem_reserva(), tamanho, opaco)
+            setattr(self, atributo, img)
+            return img
+
+        self.assets.carregar(atributo, ler, finalizar)
+
+    def _agendar_sons(self):
+        # todos os WAVs da pasta vão para o banco de sons; os usados no jogo também viram atributos
+        for atributo, nome in SONS_JOGO.items():
+            caminho = self.assets.encontrar(_possible_sound_paths(nome)) or DIR_SOM / nome
+            self._sons_atributos.setdefault(str(caminho), []).append(atributo)
+        for p in self.assets.arquivos(DIR_SOM, ".wav"):
+            self._sons_atributos.setdefault(str(p), [])
+
+        for chave, atributos in self._sons_atributos.items():
+            def ler(caminho=chave):
+                inicio = time.perf_counter()
+                snd = load_sound_safe(caminho)
+                return snd, (time.perf_counter() - inicio) * 1000.0
+
+            def finalizar(resultado, caminho=chave, atributos=atributos):
+                snd, ms = resultado
+                banco.guardar(caminho, snd, ms)
+                for atributo in atributos:
+                    setattr(self, atributo, snd)
+                    if atributo == "snd_ambiente":
+                        self._tocar_ambiente()
+                    elif atributo == "snd_movimento":
+                        self.audio.movement_sound = snd
+                return snd
+
+            self.assets.carregar(chave, ler, finalizar)
+
+    def _receber_assets(self, nomes=None, bloquear=False):
+        # finaliza (na thread principal) os assets que já foram lidos
+        if self.assets.pendentes:
+            self.assets.receber(nomes, bloquear)
+        if not self._inicio_registrado and not self.assets.pendentes and self._primeiro_quadro_ms is not None:
+            self._inicio_registrado = True
+            perfil_inicio.registrar("assets (segundo plano)", self.assets.concluido_ms)
+            print(f"ECO: menu na tela em {self._primeiro_quadro_ms:.0f} ms; "
+                  f"{len(self.assets.resultados)} assets prontos em {self.assets.concluido_ms:.0f} ms")
+
+    def perfilar_inicio(self):
+        """--profile-startup: desenha o primeiro quadro, espera todos os assets e mostra onde o tempo foi."""
+        with perfil_inicio.etapa("primeiro quadro (menu)"):
+            self.desenhar()
+        self._primeiro_quadro_ms = (time.perf_counter() - self._inicio_init) * 1000.0
+        self._receber_assets(bloquear=True)
+        total = (time.perf_counter() - _INICIO_IMPORT) * 1000.0
+        print("inicialização (etapas em segundo plano se sobrepõem às outras):")
+        print(perfil_inicio.relatorio(total))
+
+    def _tocar_ambiente(self):
+        # Toca ambiente se possível (com canal quando disponível)
+        if self.canal_ambiente:
+            try:
+                self.canal_ambiente.play(self.snd_ambiente, loops=-1)
+                self.canal_ambiente.set_volume(0.45)
+            except Exception:
+                # fallback: usar play direto no objeto (SilentSound ou Sound)
+                try:
+                    self.snd_ambiente.play(loops=-1)
+                except Exception:
+                    pass
+        else:
+            try:
+                self.snd_ambiente.play(loops=-1)
+            except Exception:
+                pass
 
     def reiniciar_jogo(self):
-        self.jogador = Jogador(LARGURA//2, ALTURA//2, self.img_jogador)
-        self.itens_max = 8           # máximo de itens no mapa ao mesmo tempo
-        self.tempo_proximo_respawn = time.time() + 6.0   # primeiro respawn em 6s
+        # espera só pelos assets da partida; os demais continuam carregando em segundo plano
+        self._receber_assets(self._assets_jogo, bloquear=True)
+        agora = self.cronometro.agora()
+        self.jogador = Jogador(LARGURA//2, ALTURA//2, self.img_jogador, self.cronometro)
+        if self._obstaculos_seed != self.seed:
+            # mesma semente, mesmas paredes: só refaz quando ela muda
+            self.obstaculos.gerar(self.seed, TAM_CHUNK, area_livre=(0, 0, LARGURA, ALTURA))
+            self.campos_fluxo.limpar()
+            self._obstaculos_seed = self.seed
+        self.jogador.obstaculos = self.obstaculos
+        self.itens_max = 8           # máximo de itens de respawn no mapa ao mesmo tempo (os dos chunks não contam)
+        self.tempo_proximo_respawn = agora + 6.0   # primeiro respawn em 6s
         self.respawn_interval = 6.0  # respawn a cada 6s
 
         def spawn_seguro(x, y):
             min_dist = 160
             if math.hypot(x - self.jogador.x, y - self.jogador.y) < min_dist:
-                angle = random.uniform(0, math.pi*2)
+                angle = self.rng.uniform(0, math.pi*2)
                 x = self.jogador.x + math.cos(angle) * min_dist
                 y = self.jogador.y + math.sin(angle) * min_dist
                 x = max(40, min(LARGURA-40, x))
@@ -447,27 +656,80 @@ class JogoEco:
         e2x, e2y = spawn_seguro(LARGURA-140, ALTURA-180)
         e3x, e3y = spawn_seguro(480, 340)
 
-        e1 = Inimigo(e1x, e1y, self.img_inimigo, pontos_patrulha=[(e1x,e1y),(e1x+140,e1y-40),(e1x+140,e1y+40)])
-        e2 = Inimigo(e2x, e2y, self.img_inimigo, pontos_patrulha=[(e2x,e2y),(e2x-140,e2y-40),(e2x-80,e2y+40)])
-        e3 = Inimigo(e3x, e3y, self.img_inimigo, pontos_patrulha=[(e3x-60,e3y),(e3x+60,e3y)])
+        self.motor_inimigos.limpar()
+        self.agendador_ia.limpar()
+        m = self.motor_inimigos
+        e1 = Inimigo(e1x, e1y, self.img_inimigo, pontos_patrulha=[(e1x,e1y),(e1x+140,e1y-40),(e1x+140,e1y+40)], motor=m, cronometro=self.cronometro)
+        e2 = Inimigo(e2x, e2y, self.img_inimigo, pontos_patrulha=[(e2x,e2y),(e2x-140,e2y-40),(e2x-80,e2y+40)], motor=m, cronometro=self.cronometro)
+        e3 = Inimigo(e3x, e3y, self.img_inimigo, pontos_patrulha=[(e3x-60,e3y),(e3x+60,e3y)], motor=m, cronometro=self.cronometro)
         self.inimigos = [e1, e2, e3]
 
-        self.itens = [{"pos": (200, 150), "coletado": False},{"pos": (600, 420), "coletado": False}]
+        self.itens.limpar()
+        self.itens.adicionar(200, 150)
+        self.itens.adicionar(600, 420)
+
+        # chunks em volta da tela inicial ganham a população gerada pela semente
+        self.mundo.reiniciar(self.seed)
+        self._origem_inimigos.clear()
+        self._origem_itens.clear()
+        self.camera.centrar(self.jogador.x, self.jogador.y)
+        self._atualizar_chunks()
         self.pings = []
-        self.tempo_inicio = time.time()
+        self.tempo_inicio = agora
         self.pontuacao = 0
         self.vida_jogador = VIDA_INICIAL
         self.ultimo_tempo_passo = 0.0
-        self.tempo_inicial_invicivel = time.time()
+        self.tempo_inicial_invicivel = agora
+        self.jogador.inicio_invencivel = agora
         self.tempo_ultimo_dano = -999  # timestamp do último dano global (redundante com jogador.ultimo_dano)
 
-    def rodar(self):
+    def rodar(self, fps_render=FPS_RENDER):
+        # simulação em ticks fixos de PASSO_SIM; o desenho roda no ritmo de fps_render
+        # e interpola entre os dois últimos ticks. Quedas de quadro só pioram o visual.
+        acumulado = 0.0
         while True:
-            dt = self.relogio.tick(FPS) / 1000.0
-            self.tratar_eventos()
-            if self.estado == EstadoJogo.JOGANDO:
-                self.atualizar(dt)
+            acumulado += self.relogio.tick(fps_render) / 1000.0
+            # depois de um travamento longo, descarta o atraso em vez de tentar recuperar tudo
+            acumulado = min(acumulado, PASSO_SIM * MAX_PASSOS_POR_QUADRO)
+            self._receber_assets()
+            with perfilador.escopo("eventos"):
+                self.tratar_eventos()
+            while acumulado >= PASSO_SIM:
+                self.passo_simulacao()
+                acumulado -= PASSO_SIM
+            self.interp = acumulado / PASSO_SIM
             self.desenhar()
+            perfilador.proximo_quadro()
+            if self._primeiro_quadro_ms is None:
+                self._primeiro_quadro_ms = (time.perf_counter() - self._inicio_init) * 1000.0
+
+    def passo_simulacao(self, teclas=None):
+        """Um tick fixo: avança o relógio do jogo em PASSO_SIM e atualiza a lógica."""
+        if teclas is None:
+            teclas = pygame.key.get_pressed()
+        if self.gravador is not None:
+            self.gravador.tick(teclas)
+        self.cronometro.avancar(PASSO_SIM)
+        if self.estado == EstadoJogo.JOGANDO:
+            self.atualizar(PASSO_SIM, teclas)
+        if self.gravador is not None:
+            self.gravador.hash(self.hash_estado())
+
+    def hash_estado(self):
+        """Resumo (8 bytes) do estado da simulação, para comparar uma partida com o replay dela."""
+        h = hashlib.blake2b(digest_size=8)
+        h.update(struct.pack("<bd", self.estado.value, self.cronometro.agora()))
+        if hasattr(self, "jogador"):
+            h.update(struct.pack("<ddii", self.jogador.x, self.jogador.y, self.pontuacao, self.vida_jogador))
+            m = self.motor_inimigos
+            for arr in (m.x, m.y, m.estado, m.vivo):
+                h.update(arr[:m.n].tobytes())
+            h.update(repr(self.pings).encode())
+            vivos = self.itens.indices()
+            h.update(vivos.tobytes())
+            h.update(self.itens.x[vivos].tobytes())
+            h.update(self.itens.y[vivos].tobytes())
+        return h.digest()
 # A função abaixo teve ajuda do ChatGPT:
     def tratar_eventos(self):
         for evento in pygame.event.get():
@@ -480,69 +742,96 @@ class JogoEco:
                     pass
                 pygame.quit()
                 sys.exit()
+            elif evento.type == pygame.VIDEOEXPOSE:
+                # a janela precisa ser repintada por inteiro
+                self.regioes.marcar_tudo()
+                self._menu_sujo = True
             elif evento.type == pygame.KEYDOWN:
-                if self.estado == EstadoJogo.MENU:
-                    if evento.key == pygame.K_RETURN:
-                        self.reiniciar_jogo()
-                        self.estado = EstadoJogo.JOGANDO
-                    elif evento.key == pygame.K_ESCAPE:
-                        pygame.quit()
-                        sys.exit()
-                elif self.estado == EstadoJogo.JOGANDO:
-                    if evento.key == pygame.K_ESCAPE:
-                        self.estado = EstadoJogo.MENU
-                    elif evento.key == pygame.K_SPACE:
-                        agora = time.time()
-                        if self.jogador.pode_ping(agora):
-                            qtd_pings = self.jogador.fazer_ping(agora)
-                            self.pings.append((self.jogador.x, self.jogador.y, agora))
-                            # tocar ping (seguro mesmo sem mixer)
-                            try:
-                                self.snd_ping.play()
-                            except Exception:
-                                pass
-                            for inimigo in self.inimigos:
-                                dist = math.hypot(inimigo.x - self.jogador.x, inimigo.y - self.jogador.y)
-                                if dist <= PING_RAIO + 60:
-                                    inimigo.ao_ser_revelado((self.jogador.x, self.jogador.y))
-                                    inimigo.revelado_ate = agora + PING_DURACAO
-                            if qtd_pings >= MAX_PINGS_ATRAIR:
-                                for inimigo in self.inimigos:
-                                    inimigo.estado = EstadoInimigo.PERSEGUIR
-                elif self.estado == EstadoJogo.FIM:
-                    if evento.key == pygame.K_RETURN:
-                        self.reiniciar_jogo()
-                        # tocar ambiente novamente com segurança
-                        if self.canal_ambiente:
-                            try:
-                                self.canal_ambiente.play(self.snd_ambiente, loops=-1)
-                                self.canal_ambiente.set_volume(0.45)
-                            except Exception:
-                                try:
-                                    self.snd_ambiente.play(loops=-1)
-                                except Exception:
-                                    pass
-                        else:
-                            try:
-                                self.snd_ambiente.play(loops=-1)
-                            except Exception:
-                                pass
-                        self.estado = EstadoJogo.JOGANDO
-                    elif evento.key == pygame.K_ESCAPE:
-                        if self.canal_ambiente:
-                            try:
-                                self.canal_ambiente.fadeout(400)
-                            except Exception:
-                                try:
-                                    self.snd_ambiente.stop()
-                                except Exception:
-                                    pass
-                        self.estado = EstadoJogo.MENU
-
-    def atualizar(self, dt):
-        teclas = pygame.key.get_pressed()
+                if evento.key == pygame.K_F3:
+                    # F3 liga/desliga o perfilador; não é tecla de jogo (não vai para a gravação)
+                    self.alternar_perfilador()
+                else:
+                    self.tratar_tecla(evento.key)
+
+    def alternar_perfilador(self):
+        perfilador.ligar(not perfilador.ativo)
+        # a caixa de tempos some/aparece: a tela inteira precisa ser repintada
+        self._caixa_perfil = None
+        self.regioes.marcar_tudo()
+        self._menu_sujo = True
+
+    # teclas pressionadas (separado de tratar_eventos para a simulação headless poder injetar teclas)
+    def tratar_tecla(self, tecla):
+        if self.gravador is not None:
+            self.gravador.evento(tecla)
+        if self.estado == EstadoJogo.MENU:
+            if tecla == pygame.K_RETURN:
+                self.reiniciar_jogo()
+                self.estado = EstadoJogo.JOGANDO
+            elif tecla == pygame.K_ESCAPE:
+                pygame.quit()
+                sys.exit()
+        elif self.estado == EstadoJogo.JOGANDO:
+            if tecla == pygame.K_ESCAPE:
+                self.estado = EstadoJogo.MENU
+            elif tecla == pygame.K_SPACE:
+                agora = self.cronometro.agora()
+                if self.jogador.pode_ping(agora):
+                    qtd_pings = self.jogador.fazer_ping(agora)
+                    self.pings.append((self.jogador.x, self.jogador.y, agora))
+                    # tocar ping (seguro mesmo sem mixer)
+                    try:
+                        self.snd_ping.play()
+                    except Exception:
+                        pass
+                    self._reconstruir_grade_inimigos()
+                    for inimigo in self.grade_inimigos.consultar(self.jogador.x, self.jogador.y, PING_RAIO + 60):
+                        inimigo.ao_ser_revelado((self.jogador.x, self.jogador.y))
+                        inimigo.revelado_ate = agora + PING_DURACAO
+                    if qtd_pings >= MAX_PINGS_ATRAIR:
+                        m = self.motor_inimigos
+                        m.estado[:m.n] = EstadoInimigo.PERSEGUIR.value
+        elif self.estado == EstadoJogo.FIM:
+            if tecla == pygame.K_RETURN:
+                self.reiniciar_jogo()
+                # tocar ambiente novamente com segurança
+                if self.canal_ambiente:
+                    try:
+                        self.canal_ambiente.play(self.snd_ambiente, loops=-1)
+                        self.canal_ambiente.set_volume(0.45)
+                    except Exception:
+                        try:
+                            self.snd_ambiente.play(loops=-1)
+                        except Exception:
+                            pass
+                else:
+                    try:
+                        self.snd_ambiente.play(loops=-1)
+                    except Exception:
+                        pass
+                self.estado = EstadoJogo.JOGANDO
+            elif tecla == pygame.K_ESCAPE:
+                if self.canal_ambiente:
+                    try:
+                        self.canal_ambiente.fadeout(400)
+                    except Exception:
+                        try:
+                            self.snd_ambiente.stop()
+                        except Exception:
+                            pass
+                self.estado = EstadoJogo.MENU
+
+    # teclas: estado das teclas (padrão: pygame.key.get_pressed()); a simulação headless injeta o seu
+    def atualizar(self, dt, teclas=None):
+        if teclas is None:
+            teclas = pygame.key.get_pressed()
+        # posições do tick anterior, usadas para interpolar o desenho
+        # (as dos inimigos são guardadas no passo deles, só para quem roda neste tick)
+        self.jogador.x_ant, self.jogador.y_ant = self.jogador.x, self.jogador.y
         self.jogador.atualizar(dt, teclas)
-        now = time.time()
+        now = self.cronometro.agora()
+        with perfilador.escopo("chunks"):
+            self._atualizar_chunks()
 
         # passos: usa AudioManager.try_step() (cooldown interno) para evitar bips por frame
         # --- ÁUDIO: loop enquanto se move ---
@@ -558,16 +847,37 @@ class JogoEco:
 
 
         self.pings = [(x,y,t) for (x,y,t) in self.pings if now - t <= PING_DURACAO]
+        self._atualizar_cobertura()
 
         attracted = self.jogador.qtd_pings_recentes >= MAX_PINGS_ATRAIR
 
-        for inimigo in self.inimigos:
-            inimigo.atualizar(dt, (self.jogador.x, self.jogador.y), self.inimigos, attracted)
+        with perfilador.escopo("inimigos"):
+            # um único passo vetorizado para os inimigos da vez (os longe e em patrulha rodam
+            # em fatias, com o dt acumulado); atraídos, todos rodam e passam a perseguir
+            # quem está na luz de um ping também roda sempre (pode aparecer na tela)
+            m = self.motor_inimigos
+            pos = (self.jogador.x, self.jogador.y)
+            dts, ativos = self.agendador_ia.agendar(m, dt, pos, now, todos=attracted,
+                                                    revelados=self.cobertura.revelados(m.x[:m.n], m.y[:m.n]))
+            m.guardar_anteriores(ativos)
+            m.step(dts, pos, attracted, ativos)
+            # depois do movimento, a grade passa a valer para colisão e respawn
+            self._reconstruir_grade_inimigos()
 
         invencivel_spawn = (now - self.tempo_inicial_invicivel) < INVULNERABILIDADE_INICIAL
 
+        with perfilador.escopo("colisao"):
+            self._colisoes(now, invencivel_spawn)
+        with perfilador.escopo("coleta"):
+            self._coletar_itens(now)
+        with perfilador.escopo("respawn"):
+            self._respawn_itens(now)
+        with perfilador.escopo("particulas"):
+            self.particulas.atualizar(dt)
+
+    def _colisoes(self, now, invencivel_spawn):
         # colisões: usar jogador.pode_levar_dano para respeitar cooldown e invencibilidade
-        for inimigo in self.inimigos:
+        for inimigo in self.grade_inimigos.consultar(self.jogador.x, self.jogador.y, 36):
             if inimigo.vivo:
                 if math.hypot(inimigo.x - self.jogador.x, inimigo.y - self.jogador.y) < 36:
                     if self.jogador.pode_levar_dano(now, invencivel_spawn):
@@ -577,8 +887,7 @@ class JogoEco:
                         self.tempo_ultimo_dano = now
                         # empurra inimigo para longe para evitar hits múltiplos
                         ang = math.atan2(inimigo.y - self.jogador.y, inimigo.x - self.jogador.x)
-                        inimigo.x += math.cos(ang) * 60
-                        inimigo.y += math.sin(ang) * 60
+                        self._empurrar_inimigo(inimigo, ang, 60)
                         inimigo.estado = EstadoInimigo.PATRULHA
                         # tocar som de perigo de forma segura
                         try:
@@ -598,103 +907,174 @@ class JogoEco:
                     else:
                         # se não pode levar dano (invencível), empurra inimigo levemente e não causa dano
                         ang = math.atan2(inimigo.y - self.jogador.y, inimigo.x - self.jogador.x)
-                        inimigo.x += math.cos(ang) * 30
-                        inimigo.y += math.sin(ang) * 30
-
-        # coleta de itens (apenas se revelados por ping)
-        for item in self.itens:
-            if not item["coletado"]:
-                if self.is_revealed(item["pos"], now):
-                    ix, iy = item["pos"]
-                    if math.hypot(ix - self.jogador.x, iy - self.jogador.y) < 28:
-                        item["coletado"] = True
-                        self.pontuacao += 1
-                        for _ in range(QTD_PARTICULAS):
-                            self.particulas.append(Particula(ix, iy))
-        # respawn: se houver menos itens não-coletados que o máximo e já passou do tempo, adiciona um
-        nao_coletados = [it for it in self.itens if not it["coletado"]]
-        if len(nao_coletados) < self.itens_max and time.time() >= self.tempo_proximo_respawn:
-            # tenta spawnar 1 novo item em posição segura (reusa lógica do gerar_itens_aleatorios)
-            def tentar_spawn_um():
-                for _ in range(40):
-                    x = random.randint(40, LARGURA - 40)
-                    y = random.randint(40, ALTURA - 40)
-                    if math.hypot(x - self.jogador.x, y - self.jogador.y) < 140:
-                        continue
-                    ok = True
-                    for inim in self.inimigos:
-                        if math.hypot(x - inim.x, y - inim.y) < 100:
-                            ok = False
-                            break
-                    if not ok:
-                        continue
-                    if any(math.hypot(x - it["pos"][0], y - it["pos"][1]) < 60 for it in self.itens if not it["coletado"]):
-                        continue
-                    return {"pos": (x, y), "coletado": False}
-                return None
-            novo = tentar_spawn_um()
+                        self._empurrar_inimigo(inimigo, ang, 30)
+
+    def _empurrar_inimigo(self, inimigo, ang, distancia):
+        # em passos de meio tile, cada um resolvido contra as paredes:
+        # o empurrão não atravessa parede fina nem deixa o inimigo dentro de uma (ou fora do mundo)
+        passos = max(1, math.ceil(distancia / (TAM_TILE / 2)))
+        dx = math.cos(ang) * distancia / passos
+        dy = math.sin(ang) * distancia / passos
+        x, y = inimigo.x, inimigo.y
+        for _ in range(passos):
+            x, y = self.obstaculos.resolver_ponto(x, y, x + dx, y + dy, RAIO_COLISAO)
+        inimigo.x, inimigo.y = x, y
+
+    def _coletar_itens(self, now):
+        # coleta de itens (apenas se revelados por ping); o item coletado sai do armazém
+        for i in self.itens.consultar(self.jogador.x, self.jogador.y, 28):
+            ix, iy = self.itens.pos(i)
+            if self.is_revealed((ix, iy), now):
+                if math.hypot(ix - self.jogador.x, iy - self.jogador.y) < 28:
+                    self.itens.remover(i)
+                    origem = self._origem_itens.pop(i, None)
+                    if origem is not None:
+                        self.mundo.coletados.add(origem)
+                    self.pontuacao += 1
+                    self.particulas.emitir(ix, iy, QTD_PARTICULAS)
+
+    def _respawn_itens(self, now):
+        # respawn: se houver menos itens de respawn que o máximo e já passou do tempo, adiciona um
+        # (os itens dos chunks vêm e vão com a área carregada e não ocupam vagas do limite)
+        soltos = len(self.itens) - len(self._origem_itens)
+        if soltos < self.itens_max and now >= self.tempo_proximo_respawn:
+            # sorteia 1 novo item entre as células livres: longe do jogador, dos inimigos e dos outros itens
+            m = self.motor_inimigos
+            a = self.amostrador_spawn
+            vivos = self.itens.indices()
+            # fora das paredes e dentro da tela atual
+            origem = self.camera.origem_para(self.jogador.x, self.jogador.y)
+            novo = a.amostrar(self.rng, [
+                (self.jogador.x, self.jogador.y, DIST_SPAWN_JOGADOR),
+                (m.x[:m.n][m.vivo[:m.n]], m.y[:m.n][m.vivo[:m.n]], DIST_SPAWN_INIMIGO),
+                (self.itens.x[vivos], self.itens.y[vivos], DIST_SPAWN_ITEM),
+            ], origem=origem, permitido=self.obstaculos.livres_na_grade(origem, a.colunas, a.linhas, a.celula))
+            # None = não há espaço livre agora; tenta de novo no próximo intervalo
             if novo:
-                self.itens.append(novo)
-            self.tempo_proximo_respawn = time.time() + self.respawn_interval
-        for p in self.particulas:
-            p.atualizar(dt)
-        self.particulas = [p for p in self.particulas if p.idade < p.vida]
+                self.itens.adicionar(*novo)
+            self.tempo_proximo_respawn = now + self.respawn_interval
+
+    def _reconstruir_grade_inimigos(self):
+        # a grade só responde consultas em volta do jogador (colisão e ping): guarda só quem está perto
+        m = self.motor_inimigos
+        r = PING_RAIO + 60 + DIST_SEPARACAO_INIMIGO
+        perto = (np.abs(m.x[:m.n] - self.jogador.x) <= r) & (np.abs(m.y[:m.n] - self.jogador.y) <= r)
+        vivos = np.flatnonzero(m.vivo[:m.n] & perto)
+        self.grade_inimigos.reconstruir_arrays([self.inimigos[i] for i in vivos.tolist()], m.x[vivos], m.y[vivos])
+
+    def _atualizar_cobertura(self, pos_jogador=None):
+        # não refaz nada se nenhum ping mudou e o jogador não se mexeu
+        # (fora da tela nada é desenhado nem coletado, então a grade cobre só a tela)
+        # pos_jogador: centro da luz do jogador; a simulação usa a do tick, o desenho a interpolada
+        if pos_jogador is None:
+            pos_jogador = (self.jogador.x, self.jogador.y)
+        self.cobertura.reconstruir(self.pings, PING_RAIO, pos_jogador, RAIO_LUZ_JOGADOR,
+                                   origem=self.camera.origem_para(*pos_jogador))
+
+    # --- chunks do mundo ---
+    def _atualizar_chunks(self):
+        # a câmera da simulação vem da posição do jogador no tick (o desenho interpola a sua)
+        origem = self.camera.origem_para(self.jogador.x, self.jogador.y)
+        self.mundo.atualizar(origem, self.camera.largura, self.camera.altura,
+                             self._carregar_chunk, self._descarregar_chunk)
+
+    def _novo_inimigo(self, x, y, pontos):
+        # o motor reaproveita índices livres: self.inimigos[i] é sempre a visão do índice i
+        inimigo = Inimigo(x, y, self.img_inimigo, pontos_patrulha=pontos, motor=self.motor_inimigos,
+                          cronometro=self.cronometro)
+        if inimigo.i < len(self.inimigos):
+            self.inimigos[inimigo.i] = inimigo
+        else:
+            self.inimigos.append(inimigo)
+        return inimigo.i
+
+    def _carregar_chunk(self, chunk, inimigos, itens):
+        for x, y, pontos in inimigos:
+            self._origem_inimigos[self._novo_inimigo(x, y, pontos)] = chunk
+        for k, x, y in itens:
+            self._origem_itens[self.itens.adicionar(x, y)] = (*chunk, k)
+        return chunk
+
+    def _descarregar_chunk(self, chunk, _):
+        # inimigos que andaram até um chunk ainda carregado passam a pertencer a ele
+        m = self.motor_inimigos
+        for i, origem in list(self._origem_inimigos.items()):
+            if origem != chunk:
+                continue
+            atual = self.mundo.chunk_de(m.x[i], m.y[i])
+            if atual in self.mundo.ativos:
+                self._origem_inimigos[i] = atual
+            else:
+                del self._origem_inimigos[i]
+                m.remover(i)
+        for i, (cx, cy, k) in list(self._origem_itens.items()):
+            if (cx, cy) == chunk:
+                del self._origem_itens[i]
+                self.itens.remover(i)
 
     def is_revealed(self, pos, agora):
-        px, py = pos
-        for (x,y,t) in self.pings:
-            if math.hypot(px - x, py - y) <= PING_RAIO:
-                return True
-        return False
+        # consulta O(1) na grade de cobertura montada neste quadro
+        return self.cobertura.revelado(*pos)
 
     def desenhar(self):
+        if self.estado != self._estado_desenhado:
+            # troca de tela: tudo precisa ser desenhado e apresentado de novo
+            self._estado_desenhado = self.estado
+            self._menu_sujo = True
         if self.estado == EstadoJogo.MENU:
             self.desenhar_menu()
         elif self.estado == EstadoJogo.JOGANDO:
             self.desenhar_jogo()
         elif self.estado == EstadoJogo.FIM:
             self.desenhar_fim()
-        pygame.display.flip()
+        if perfilador.ativo:
+            caixa = perfilador.desenhar(self.tela)
+            if caixa != self._caixa_perfil:
+                # a caixa mudou de tamanho: o que estava embaixo dela precisa voltar
+                self._caixa_perfil = caixa
+                self._menu_sujo = True
+            self.regioes.marcar(caixa)
+        # update(rects) das regiões marcadas, ou flip() se a área suja for grande
+        with perfilador.escopo("apresentar"):
+            self.regioes.apresentar()
 
     def desenhar_menu(self):
-        self.tela.fill((8,8,18))
-        fonte_titulo = pygame.font.SysFont("arial", 64)
-        titulo = fonte_titulo.render("ECO DE LUZ", True, (220,220,255))
-        self.tela.blit(titulo, titulo.get_rect(center=(LARGURA//2, 90)))
-
-        fonte_h = pygame.font.SysFont("arial", 20)
-        linhas = [
-            "Objetivo: Explore emitindo ecos (clarões) para revelar itens e inimigos.",
-            "Itens revelados têm um brilho e uma seta aponta para o item mais próximo.",
-            "",
-            "Controles:",
-            "  - Mover: WASD ou setas",
-            "  - Ping / Clarão/ Eco: ESPAÇO",
-            "  - Iniciar jogo: ENTER",
-            "  - Sair: ESC no menu",
-            "",
-            "Vida: começa com 3 vidas. ",
-            
-            "Após levar dano há um curto tempo sem levar dano, para evitar perdas rápidas.",
-        ]
+        # o menu é estático: depois de desenhado uma vez, nada muda até trocar de tela
+        if not self._menu_sujo:
+            return
+        self._menu_sujo = False
+        self.regioes.marcar_tudo()
+        # a tela do menu inteira é uma camada; só é refeita se a janela ou os textos mudarem
+        tamanho = self.tela.get_size()
+        menu = self.camadas.camada("menu", (tamanho, tuple(LINHAS_MENU), RODAPE_MENU),
+                                   lambda: self._construir_menu(tamanho))
+        self.tela.blit(menu, (0, 0))
+
+    def _construir_menu(self, tamanho):
+        largura, altura = tamanho
+        surf = pygame.Surface(tamanho).convert()
+        surf.fill((8,8,18))
+        titulo = texto("ECO DE LUZ", 64, (220,220,255))
+        surf.blit(titulo, titulo.get_rect(center=(largura//2, 90)))
+
         y = 170
-        for linha in linhas:
-            txt = fonte_h.render(linha, True, (210,210,230))
-            self.tela.blit(txt, (80, y))
+        for linha in LINHAS_MENU:
+            txt = texto(linha, 20, (210,210,230))
+            surf.blit(txt, (80, y))
             y += 26
 
-        fonte_footer = pygame.font.SysFont("arial", 18)
-        rodape = fonte_footer.render("Pressione ENTER para começar  —  ESPAÇO para emitir eco durante o jogo", True, (200,200,220))
-        self.tela.blit(rodape, rodape.get_rect(center=(LARGURA//2, ALTURA - 40)))
+        rodape = texto(RODAPE_MENU, 18, (200,200,220))
+        surf.blit(rodape, rodape.get_rect(center=(largura//2, altura - 40)))
+        return surf
 
     def desenhar_particulas(self):
-        for p in self.particulas:
-            p.desenhar(self.tela)
+        self.particulas.desenhar(self.tela, self.camera.origem)
 
     def _desenhar_seta_para(self, alvo_pos):
         # desenha uma seta na borda apontando para alvo_pos (x,y)
-        ax, ay = alvo_pos
-        cx, cy = self.jogador.x, self.jogador.y
+        # posições convertidas para a tela
+        ax, ay = self.camera.para_tela(*alvo_pos)
+        cx, cy = self.camera.para_tela(self.jogador.x, self.jogador.y)
         dx = ax - cx
         dy = ay - cy
         ang = math.atan2(dy, dx)
@@ -716,341 +1096,313 @@ class JogoEco:
         p3 = (px + math.cos(ang - 2.2) * size, py + math.sin(ang - 2.2) * size)
         pygame.draw.polygon(self.tela, (255,200,80), [p1,p2,p3])
         # label "ITEM"
-        fonte = pygame.font.SysFont("arial", 16)
-        lbl = fonte.render("ITEM", True, (255,200,80))
+        lbl = texto("ITEM", 16, (255,200,80))
         self.tela.blit(lbl, (px+10, py-10))
 
-    def desenhar_jogo(self):
-        self.tela.fill((0,0,0))
-        try:
-            self.tela.blit(pygame.transform.scale(self.img_fundo, (LARGURA, ALTURA)), (0,0))
-        except Exception:
-            pass
+    def _construir_hud(self, ping_pronto, barra_w, barra_h):
+        # camada do HUD com origem em (12, 10)
+        txt = texto(f"Pontuação: {self.pontuacao}   Vida: {self.vida_jogador}", 20, (240,240,240))
+        label = texto("PING (ESPAÇO) - pronto" if ping_pronto else "PING (ESPAÇO) - recarregando", 20, (220,220,220))
+        largura = max(txt.get_width(), barra_w + 8 + label.get_width())
+        altura = max(26 + barra_h, 24 + label.get_height())
+        surf = pygame.Surface((largura, altura), pygame.SRCALPHA)
+        # textos sobre área transparente: BLEND_RGBA_MAX preserva o antialias
+        surf.blit(txt, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+        pygame.draw.rect(surf, (60,60,60), (0, 26, barra_w, barra_h))
+        surf.blit(label, (barra_w + 8, 24), special_flags=pygame.BLEND_RGBA_MAX)
+        return surf
 
-        now = time.time()
+    def desenhar_jogo(self):
+        # a câmera segue a posição interpolada do jogador; tudo abaixo é desenhado com (x - cx, y - cy)
+        # (a mesma posição do sprite em Jogador.desenhar, também usada para a luz do jogador)
+        j = self.jogador
+        jx = j.x_ant + (j.x - j.x_ant) * self.interp
+        jy = j.y_ant + (j.y - j.y_ant) * self.interp
+        self.camera.centrar(jx, jy)
+        cam = self.camera.origem
+        cx, cy = cam
+        # os fundos dos chunks visíveis são opacos e cobrem a tela inteira, então não precisa de fill()
+        with perfilador.escopo("fundo"):
+            self.mundo.desenhar_fundo(self.tela, self.camera, self.img_fundo)
+
+        now = self.cronometro.agora()
+        self._atualizar_cobertura((jx, jy))
 
         # desenhar itens: se revelados, mostrar halo + label; se fora da tela, seta aponta para o mais próximo revelado
-        itens_revelados = []
-        for item in self.itens:
-            if item["coletado"]:
-                continue
-            ix, iy = item["pos"]
-            revelado = self.is_revealed((ix, iy), now)
-            if revelado:
-                itens_revelados.append(item)
-                # halo pulsante
-                pulse = 1.0 + 0.25 * math.sin(time.time() * 7.0)
-                r = int(18 * pulse)
-                s = pygame.Surface((r*2, r*2), pygame.SRCALPHA)
-                alpha = int(160 * (0.6 + 0.4 * (1 - ( (now - max(t for (x,y,t) in self.pings if True) - now) ) ))) if self.pings else 140
-                pygame.draw.circle(s, (255,215,100,140), (r, r), r)
-                self.tela.blit(s, (int(ix - r), int(iy - r)))
+        with perfilador.escopo("itens"):
+            # só os itens vivos e revelados (consulta vetorizada na grade de cobertura)
+            vivos = self.itens.indices()
+            revelados = vivos[self.cobertura.revelados(self.itens.x[vivos], self.itens.y[vivos])]
+            itens_revelados = [self.itens.pos(i) for i in revelados.tolist()]
+            # halo pulsante
+            pulse = 1.0 + 0.25 * math.sin(now * 7.0)
+            halo = atlas.halo(int(18 * pulse), 140, (255,215,100))
+            lbl = texto("ITEM", 14, (255,215,100))
+            for ix, iy in itens_revelados:
+                if not self.camera.visivel(ix, iy, 40):
+                    continue
+                ix -= cx; iy -= cy
+                atlas.desenhar(self.tela, halo, ix, iy)
                 # ícone do item
                 try:
                     self.tela.blit(self.img_item, self.img_item.get_rect(center=(int(ix), int(iy))))
                 except Exception:
                     pygame.draw.rect(self.tela, (200,180,20), (int(ix-12), int(iy-12), 24, 24))
                 # rótulo
-                fonte = pygame.font.SysFont("arial", 14)
-                lbl = fonte.render("ITEM", True, (255,215,100))
                 self.tela.blit(lbl, (int(ix - lbl.get_width()//2), int(iy - 26)))
-            else:
-                # se não revelado, não desenha
-                pass
 
         # desenhar inimigos: visíveis por ping posicional ou por revelado_ate
-        for inimigo in self.inimigos:
-            pos_revelada = self.is_revealed((inimigo.x, inimigo.y), now)
-            marcado = (inimigo.revelado_ate and now <= inimigo.revelado_ate)
-            if pos_revelada or marcado:
-                inimigo.desenhar(self.tela, now)
-
-        # desenhar jogador (usa estado global 'jogo' para acessar invencibilidade)
-        self.jogador.desenhar(self.tela, now)
+        with perfilador.escopo("sprites"):
+            m = self.motor_inimigos
+            xs = m.x[:m.n]; ys = m.y[:m.n]
+            pos_revelada = self.cobertura.revelados(xs, ys)
+            marcado = (m.revelado_ate[:m.n] > 0) & (now <= m.revelado_ate[:m.n])
+            # só os que estão na tela (com folga para o sprite e o anel)
+            na_tela = ((xs > cx - 64) & (xs < cx + self.camera.largura + 64)
+                       & (ys > cy - 64) & (ys < cy + self.camera.altura + 64))
+            # quem roda em fatias anda o passo de vários ticks de uma vez: a fração espalha o movimento
+            fracoes = self.agendador_ia.fracoes(self.interp, m.n)
+            for i in np.flatnonzero((pos_revelada | marcado) & na_tela & m.vivo[:m.n]):
+                self.inimigos[i].desenhar(self.tela, now, fracoes[i], cam)
+
+            # desenhar jogador
+            self.jogador.desenhar(self.tela, now, self.interp, cam)
 
         # desenhar pings visuais
-        for (x,y,t) in self.pings:
-            age = now - t
-            frac = age / PING_DURACAO
-            if frac < 1.0:
-                radius = int(PING_RAIO * (1 - frac*0.35))
-                alpha = int(200 * (1 - frac))
-                s = pygame.Surface((radius*2, radius*2), pygame.SRCALPHA)
-                pygame.draw.circle(s, (180,220,255,alpha), (radius, radius), radius, width=3)
-                self.tela.blit(s, (x-radius, y-radius))
-                cp = pygame.Surface((48,48), pygame.SRCALPHA)
-                pygame.draw.circle(cp, (180,220,255,int(200*(1-frac))), (24,24), int(14*(1-frac)), width=2)
-                self.tela.blit(cp, (x-24, y-24))
-
-        # overlay escura com furos
-        self.overlay_escuro.fill((0,0,0,220))
-        for (x,y,t) in self.pings:
-            age = now - t
-            frac = age / PING_DURACAO
-            if frac < 1.0:
-                radius = int(PING_RAIO * (1 - frac*0.25))
-                pygame.draw.circle(self.overlay_escuro, (0,0,0,0), (int(x), int(y)), radius)
-        pygame.draw.circle(self.overlay_escuro, (0,0,0,0), (int(self.jogador.x), int(self.jogador.y)), 28)
-        self.tela.blit(self.overlay_escuro, (0,0))
+        with perfilador.escopo("aneis"):
+            for (x,y,t) in self.pings:
+                age = now - t
+                frac = age / PING_DURACAO
+                if frac < 1.0:
+                    radius = int(PING_RAIO * (1 - frac*0.35))
+                    alpha = int(200 * (1 - frac))
+                    atlas.desenhar(self.tela, atlas.anel(radius, alpha, 3, (180,220,255)), x - cx, y - cy)
+                    atlas.desenhar(self.tela, atlas.anel(int(14*(1-frac)), alpha, 2, (180,220,255)), x - cx, y - cy)
+
+        # névoa escura: mesmas luzes (pings + jogador) e raios usados pela grade de cobertura
+        with perfilador.escopo("nevoa"):
+            luzes = [(x - cx, y - cy, PING_RAIO) for (x, y, t) in self.pings]
+            luzes.append((jx - cx, jy - cy, RAIO_LUZ_JOGADOR))
+            self.mapa_luz.desenhar(self.tela, luzes)
 
         # partículas por cima
-        self.desenhar_particulas()
-
-        # HUD
-        fonte = pygame.font.SysFont("arial", 20)
-        txt = fonte.render(f"Pontuação: {self.pontuacao}   Vida: {self.vida_jogador}", True, (240,240,240))
-        self.tela.blit(txt, (12, 10))
-
-        ping_pronto = (time.time() - self.jogador.ultimo_ping) >= PING_INTERVALO
-        cooldown_frac = min(1.0, max(0.0, (time.time() - self.jogador.ultimo_ping) / PING_INTERVALO))
-        barra_w = 140; barra_h = 12
-        bx = 12; by = 36
-        pygame.draw.rect(self.tela, (60,60,60), (bx, by, barra_w, barra_h))
-        inner_w = int(barra_w * cooldown_frac)
-        pygame.draw.rect(self.tela, (120,200,255), (bx, by, inner_w, barra_h))
-        label = fonte.render("PING (ESPAÇO) - pronto" if ping_pronto else "PING (ESPAÇO) - recarregando", True, (220,220,220))
-        self.tela.blit(label, (bx + barra_w + 8, by - 2))
-
-        # aviso invulnerabilidade spawn ou pós-dano
-        now = time.time()
-        invencivel_spawn = (now - self.tempo_inicial_invicivel) < INVULNERABILIDADE_INICIAL
-        pós_dano = (now - self.jogador.ultimo_dano) < COOLDOWN_DANO
-        if invencivel_spawn:
-            segundos_rest = INVULNERABILIDADE_INICIAL - (now - self.tempo_inicial_invicivel)
-            aviso = fonte.render(f"INVULNERÁVEL {segundos_rest:.1f}s (spawn seguro)", True, (255, 205, 80))
-            self.tela.blit(aviso, (12, 64))
-        elif pós_dano:
-            segundos_rest = COOLDOWN_DANO - (now - self.jogador.ultimo_dano)
-            aviso = fonte.render(f"INVULNERÁVEL (após dano) {segundos_rest:.1f}s", True, (255, 140, 80))
-            self.tela.blit(aviso, (12, 64))
-
-        # seta indicando o item revelado mais próximo (quando há pings ativos)
-        # encontrar itens revelados e não coletados
-        if self.pings:
-            itens_visiveis = [it for it in self.itens if (not it["coletado"]) and self.is_revealed(it["pos"], now)]
-            if itens_visiveis:
+        with perfilador.escopo("desenho_particulas"):
+            self.desenhar_particulas()
+
+        # HUD: pontuação, fundo da barra e rótulo do ping formam uma camada
+        # refeita só quando pontuação, vida ou o estado do ping mudam
+        with perfilador.escopo("hud"):
+            ping_pronto = (now - self.jogador.ultimo_ping) >= PING_INTERVALO
+            cooldown_frac = min(1.0, max(0.0, (now - self.jogador.ultimo_ping) / PING_INTERVALO))
+            barra_w = 140; barra_h = 12
+            bx = 12; by = 36
+            hud = self.camadas.camada("hud", (self.pontuacao, self.vida_jogador, ping_pronto),
+                                      lambda: self._construir_hud(ping_pronto, barra_w, barra_h))
+            self.tela.blit(hud, (bx, 10))
+            inner_w = int(barra_w * cooldown_frac)
+            pygame.draw.rect(self.tela, (120,200,255), (bx, by, inner_w, barra_h))
+
+            # aviso invulnerabilidade spawn ou pós-dano
+            invencivel_spawn = (now - self.tempo_inicial_invicivel) < INVULNERABILIDADE_INICIAL
+            pós_dano = (now - self.jogador.ultimo_dano) < COOLDOWN_DANO
+            if invencivel_spawn:
+                segundos_rest = INVULNERABILIDADE_INICIAL - (now - self.tempo_inicial_invicivel)
+                aviso = texto(f"INVULNERÁVEL {segundos_rest:.1f}s (spawn seguro)", 20, (255, 205, 80))
+                self.tela.blit(aviso, (12, 64))
+            elif pós_dano:
+                segundos_rest = COOLDOWN_DANO - (now - self.jogador.ultimo_dano)
+                aviso = texto(f"INVULNERÁVEL (após dano) {segundos_rest:.1f}s", 20, (255, 140, 80))
+                self.tela.blit(aviso, (12, 64))
+
+            # seta indicando o item revelado mais próximo (quando há pings ativos)
+            # reaproveita os itens revelados encontrados ao desenhar os itens
+            if self.pings and itens_revelados:
                 # escolher o item não-coletado mais próximo ao jogador
-                nearest = min(itens_visiveis, key=lambda it: math.hypot(it["pos"][0]-self.jogador.x, it["pos"][1]-self.jogador.y))
-                self._desenhar_seta_para(nearest["pos"])
+                nearest = min(itens_revelados, key=lambda p: math.hypot(p[0]-self.jogador.x, p[1]-self.jogador.y))
+                self._desenhar_seta_para(nearest)
+
+        # fundo e névoa cobrem a tela toda a cada quadro
+        self.regioes.marcar_tudo()
+
+    def _construir_titulo_fim(self, tam_t):
+        titulo = texto("FIM DE JOGO", tam_t, (255,220,220), bold=True)
+        sh = texto("FIM DE JOGO", tam_t, (40,20,30), bold=True)
+        surf = pygame.Surface((titulo.get_width()+6, titulo.get_height()+6), pygame.SRCALPHA)
+        surf.blit(sh, (6, 6), special_flags=pygame.BLEND_RGBA_MAX)
+        surf.blit(titulo, (0, 0))
+        return surf
+
+    def _construir_finale_fim(self):
+        finale = texto("MUITO BEM! Pressione ENTER para tentar novamente.", 20, (255,240,220), bold=True)
+        surf = pygame.Surface((finale.get_width()+40, finale.get_height()+18), pygame.SRCALPHA)
+        pygame.draw.rect(surf, (255,230,120,80), surf.get_rect(), border_radius=8)
+        surf.blit(finale, (20, 8))
+        return surf
+
+    def _construir_botoes_fim(self):
+        # desenha os dois botões e a dica numa Surface do tamanho da tela e recorta a área usada
+        surf = pygame.Surface((LARGURA, ALTURA), pygame.SRCALPHA)
+        # botão RECOMEÇAR (ENTER)
+        btn_w, btn_h = 360, 52
+        bx = LARGURA//2 - btn_w//2
+        by = int(ALTURA*0.55)
+        btn_surf = pygame.Surface((btn_w, btn_h), pygame.SRCALPHA)
+        pygame.draw.rect(btn_surf, (255,130,80), (0,0,btn_w,btn_h), border_radius=12)
+        txtb = texto("PRESS ENTER — RECOMEÇAR", 20, (30,20,10), bold=True)
+        btn_surf.blit(txtb, txtb.get_rect(center=(btn_w//2, btn_h//2)))
+        # glow desenhado direto na camada (draw grava o alpha como está, sem misturar)
+        pygame.draw.rect(surf, (255,160,90,90), (bx-9, by-9, btn_w+18, btn_h+18), border_radius=14)
+        surf.blit(btn_surf, (bx, by))
+
+        # --- AUMENTEI A CAIXA DO MENU (ESC) AQUI ---
+        # botão MENU (ESC) grande e proeminente
+        btn2_w, btn2_h = 340, 64   # aumentado
+        bx2 = LARGURA//2 - btn2_w//2
+        by2 = by + btn_h + 20
+        # fundo com leve gradiente/retângulo arredondado
+        btn2_surf = pygame.Surface((btn2_w, btn2_h), pygame.SRCALPHA)
+        pygame.draw.rect(btn2_surf, (70,70,110), (0,0,btn2_w,btn2_h), border_radius=14)
+        # uma borda sutil
+        pygame.draw.rect(btn2_surf, (110,110,150), (2,2,btn2_w-4,btn2_h-4), width=2, border_radius=12)
+        # texto maior e centralizado
+        t2 = texto("ESC — VOLTAR AO MENU", 20, (240,240,240), bold=True)
+        btn2_surf.blit(t2, ( (btn2_w - t2.get_width())//2, (btn2_h - t2.get_height())//2 ))
+        # glow e blit
+        pygame.draw.rect(surf, (100,100,150,70), (bx2-9, by2-9, btn2_w+18, btn2_h+18), border_radius=16)
+        surf.blit(btn2_surf, (bx2, by2))
+
+        # dica sutil abaixo do menu
+        dica = texto("Dica: Explore áreas escuras — alguns itens estão escondidos!", 14, (200,200,210))
+        # BLEND_RGBA_MAX copia o texto para a área transparente sem escurecer o antialias
+        surf.blit(dica, (LARGURA//2 - dica.get_width()//2, by2 + btn2_h + 12), special_flags=pygame.BLEND_RGBA_MAX)
+        usado = surf.get_bounding_rect()
+        return surf.subsurface(usado).copy(), usado.topleft
 
  # Código abaixo foi utilizado ajuda do ChatGPT:
     def desenhar_fim(self):
         # função robusta e defensiva — evita que exceções fechem o jogo
+        # o fundo pulsa na tela inteira, então o quadro todo muda
+        self.regioes.marcar_tudo()
         try:
             # --- garantir inicialização de estado usado ---
             if not getattr(self, "_fim_started", False):
                 self._fim_started = True
-                self._fim_start_time = time.time()
-                self._confetes = []
-                cores = [(255,90,90),(255,200,70),(120,220,140),(120,180,255),(200,120,255)]
-                for i in range(60):
-                    x = random.uniform(0, LARGURA)
-                    y = random.uniform(-80, -10)
-                    vx = random.uniform(-60, 60)
-                    vy = random.uniform(80, 240)
-                    rot = random.uniform(0, math.pi*2)
-                    vrot = random.uniform(-4, 4)
-                    cor = random.choice(cores)
-                    size = random.uniform(6, 14)
-                    self._confetes.append({"x": x, "y": y, "vx": vx, "vy": vy, "rot": rot, "vrot": vrot, "col": cor, "size": size, "t": 0.0})
-
-                self._burst = []
-                for i in range(3):
-                    cx = random.uniform(LARGURA*0.25, LARGURA*0.75)
-                    cy = random.uniform(ALTURA*0.25, ALTURA*0.45)
-                    for k in range(18):
-                        ang = random.uniform(0, math.pi*2)
-                        s = random.uniform(80, 260)
-                        self._burst.append({"x": cx, "y": cy, "vx": math.cos(ang)*s, "vy": math.sin(ang)*s, "life": random.uniform(0.6,1.3), "age": 0.0, "col": random.choice(cores)})
-
+                self._fim_start_time = self.cronometro.agora()
+                self.efeitos_fim.reiniciar()
                 self._display_score = 0
                 self._score_anim_len = 1.6
-                self._float_bits = []
 
             # tempo e dt seguros
-            now = time.time()
+            now = self.cronometro.agora()
             last = getattr(self, "_fim_last_time", now)
             dt = min(1/30.0, max(0.0, now - last))
             self._fim_last_time = now
 
-            # atualizar confetes (simples física)
-            for c in self._confetes:
-                c["t"] += dt
-                c["vy"] += 320 * dt
-                c["x"] += c["vx"] * dt
-                c["y"] += c["vy"] * dt
-                c["rot"] += c["vrot"] * dt
-                if c["y"] > ALTURA + 40:
-                    c["y"] = random.uniform(-60, -10)
-                    c["x"] = random.uniform(0, LARGURA)
-                    c["vy"] = random.uniform(80, 180)
-                    c["vx"] = random.uniform(-60, 60)
-
-            # atualizar burst
-            novos_burst = []
-            for b in getattr(self, "_burst", []):
-                b["age"] += dt
-                b["x"] += b["vx"] * dt
-                b["y"] += b["vy"] * dt
-                b["vx"] *= (1.0 - 2.0*dt)
-                b["vy"] *= (1.0 - 2.0*dt)
-                if b["age"] < b.get("life", 0.5):
-                    novos_burst.append(b)
-            self._burst = novos_burst
-
-            # --- desenhar fundo animado ---
-            try:
-                self.tela.fill((8,6,18))
-            except Exception:
-                raise
-
-            grad = pygame.Surface((LARGURA, ALTURA), flags=pygame.SRCALPHA)
-            pulse = 1.0 + 0.08 * math.sin((now - getattr(self, "_fim_start_time", now)) * 2.6)
-            grd_r = int(max(LARGURA, ALTURA) * (0.6 * max(0.01, pulse)))
-            pygame.draw.circle(grad, (30,30,80,160), (LARGURA//2, int(ALTURA*0.38)), grd_r)
-            pygame.draw.circle(grad, (40,18,30,120), (LARGURA//2, int(ALTURA*0.75)), int(grd_r*0.6))
-            self.tela.blit(grad, (0,0))
-
-            # desenhar confetes
-            for c in self._confetes:
-                w = max(2, int(c["size"]*1.6))
-                h = max(2, int(c["size"]*0.9))
-                surf = pygame.Surface((w, h), pygame.SRCALPHA)
-                pygame.draw.rect(surf, c["col"], (0,0,w,h))
-                try:
-                    rs = pygame.transform.rotate(surf, math.degrees(c["rot"]))
-                    self.tela.blit(rs, (int(c["x"]-rs.get_width()/2), int(c["y"]-rs.get_height()/2)))
-                except Exception:
-                    pygame.draw.circle(self.tela, c["col"], (int(max(0,min(LARGURA,c["x"]))), int(max(0,min(ALTURA,c["y"])))), 2)
+            # confetes, explosões e brilhos: arrays atualizados de uma vez
+            efeitos = self.efeitos_fim
+            efeitos.atualizar(dt)
+
+            # --- desenhar fundo animado (degradê guardado por passo do pulso) ---
+            with perfilador.escopo("fim_fundo"):
+                pulse = 1.0 + 0.08 * math.sin((now - getattr(self, "_fim_start_time", now)) * 2.6)
+                if self.tela.get_size() != (LARGURA, ALTURA):
+                    self.tela.fill((8,6,18))
+                self.tela.blit(efeitos.fundo(pulse), (0,0))
 
-            # desenhar bursts
-            for b in self._burst:
-                alpha = int(255 * max(0.0, 1.0 - (b["age"]/b.get("life",1.0))))
-                s = pygame.Surface((6,6), pygame.SRCALPHA)
-                s.fill((*b["col"], alpha))
-                self.tela.blit(s, (int(b["x"])-3, int(b["y"])-3))
+                # confetes (sprites já rotacionados) e explosões
+                efeitos.desenhar_confetes(self.tela)
+                efeitos.desenhar_explosoes(self.tela)
 
             # título principal
-            elapsed = now - getattr(self, "_fim_start_time", now)
-            pop_scale = 1.0 + 0.12 * math.exp(-elapsed*2.5) * math.cos(elapsed*8.0)
-            fonte_t = pygame.font.SysFont("arial", max(12, int(64 * pop_scale)), bold=True)
-            titulo = fonte_t.render("FIM DE JOGO", True, (255,220,220))
-            tit_rect = titulo.get_rect(center=(LARGURA//2, int(ALTURA*0.18)))
-            sh = fonte_t.render("FIM DE JOGO", True, (40,20,30))
-            self.tela.blit(sh, (tit_rect.x+6, tit_rect.y+6))
-            self.tela.blit(titulo, tit_rect)
-
-            # pontuação contada com easing
-            target = int(getattr(self, "pontuacao", 0))
-            t = min(1.0, elapsed / getattr(self, "_score_anim_len", 1.6))
-            ease = t * t * (3 - 2 * t)
-            cur = getattr(self, "_display_score", 0)
-            new = int(cur + (target - cur) * (0.06 + 0.9 * ease))
-            self._display_score = max(0, new)
-            fonte_score = pygame.font.SysFont("arial", 40, bold=True)
-            score_txt = fonte_score.render(f"PONTUAÇÃO: {self._display_score}", True, (255,245,200))
-            self.tela.blit(score_txt, score_txt.get_rect(center=(LARGURA//2, int(ALTURA*0.32))))
-
-            # selo brilhante
-            shine = 1.0 + 0.15 * math.sin((now - getattr(self, "_fim_start_time", now)) * 4.0)
-            selo_s = max(80, int(140 * shine))
-            selo = pygame.Surface((selo_s, selo_s), pygame.SRCALPHA)
-            pygame.draw.circle(selo, (255,240,200,140), (selo_s//2, selo_s//2), selo_s//2)
-            pygame.draw.circle(selo, (255,200,70,200), (selo_s//2, selo_s//2), selo_s//2 - 8, width=6)
-            try:
-                self.tela.blit(selo, (int(LARGURA*0.12), int(ALTURA*0.22)))
-            except Exception:
-                pass
+            with perfilador.escopo("fim_textos"):
+                elapsed = now - getattr(self, "_fim_start_time", now)
+                pop_scale = 1.0 + 0.12 * math.exp(-elapsed*2.5) * math.cos(elapsed*8.0)
+                tam_t = max(12, int(64 * pop_scale))
+                # título + sombra numa camada (só muda enquanto o "pop" altera o tamanho da fonte)
+                titulo = self.camadas.camada("fim_titulo", tam_t, lambda: self._construir_titulo_fim(tam_t))
+                tit_rect = texto("FIM DE JOGO", tam_t, (255,220,220), bold=True).get_rect(center=(LARGURA//2, int(ALTURA*0.18)))
+                self.tela.blit(titulo, tit_rect)
+
+                # pontuação contada com easing
+                target = int(getattr(self, "pontuacao", 0))
+                t = min(1.0, elapsed / getattr(self, "_score_anim_len", 1.6))
+                ease = t * t * (3 - 2 * t)
+                cur = getattr(self, "_display_score", 0)
+                new = int(cur + (target - cur) * (0.06 + 0.9 * ease))
+                self._display_score = max(0, new)
+                score_txt = texto(f"PONTUAÇÃO: {self._display_score}", 40, (255,245,200), bold=True)
+                self.tela.blit(score_txt, score_txt.get_rect(center=(LARGURA//2, int(ALTURA*0.32))))
+
+                # selo brilhante
+                shine = 1.0 + 0.15 * math.sin((now - getattr(self, "_fim_start_time", now)) * 4.0)
+                selo_s = max(80, int(140 * shine))
+                selo = efeitos.selo(selo_s)
+                try:
+                    self.tela.blit(selo, (int(LARGURA*0.12), int(ALTURA*0.22)))
+                except Exception:
+                    pass
 
-            # ---- REMOVIDO: tempo/estatísticas (solicitado) ----
-            # (antes aqui era desenhado "Tempo: Xm Ys  ·  Itens: N" — removido conforme pedido)
-
-            # botão RECOMEÇAR (ENTER)
-            btn_w, btn_h = 360, 52
-            bx = LARGURA//2 - btn_w//2
-            by = int(ALTURA*0.55)
-            btn_surf = pygame.Surface((btn_w, btn_h), pygame.SRCALPHA)
-            pygame.draw.rect(btn_surf, (255,130,80), (0,0,btn_w,btn_h), border_radius=12)
-            txtb = pygame.font.SysFont("arial", 20, bold=True).render("PRESS ENTER — RECOMEÇAR", True, (30,20,10))
-            btn_surf.blit(txtb, txtb.get_rect(center=(btn_w//2, btn_h//2)))
-            glow = pygame.Surface((btn_w+18, btn_h+18), pygame.SRCALPHA)
-            pygame.draw.rect(glow, (255,160,90,90), (0,0,btn_w+18,btn_h+18), border_radius=14)
-            self.tela.blit(glow, (bx-9, by-9))
-            self.tela.blit(btn_surf, (bx, by))
-
-            # --- AUMENTEI A CAIXA DO MENU (ESC) AQUI ---
-            # botão MENU (ESC) grande e proeminente
-            btn2_w, btn2_h = 340, 64   # aumentado
-            bx2 = LARGURA//2 - btn2_w//2
-            by2 = by + btn_h + 20
-            # fundo com leve gradiente/retângulo arredondado
-            btn2_surf = pygame.Surface((btn2_w, btn2_h), pygame.SRCALPHA)
-            pygame.draw.rect(btn2_surf, (70,70,110), (0,0,btn2_w,btn2_h), border_radius=14)
-            # uma borda sutil
-            pygame.draw.rect(btn2_surf, (110,110,150), (2,2,btn2_w-4,btn2_h-4), width=2, border_radius=12)
-            # texto maior e centralizado
-            t2font = pygame.font.SysFont("arial", 20, bold=True)
-            t2 = t2font.render("ESC — VOLTAR AO MENU", True, (240,240,240))
-            btn2_surf.blit(t2, ( (btn2_w - t2.get_width())//2, (btn2_h - t2.get_height())//2 ))
-            # glow e blit
-            glow2 = pygame.Surface((btn2_w+18, btn2_h+18), pygame.SRCALPHA)
-            pygame.draw.rect(glow2, (100,100,150,70), (0,0,btn2_w+18,btn2_h+18), border_radius=16)
-            self.tela.blit(glow2, (bx2-9, by2-9))
-            self.tela.blit(btn2_surf, (bx2, by2))
-
-            # dica sutil abaixo do menu
-            dica = pygame.font.SysFont("arial", 14).render("Dica: Explore áreas escuras — alguns itens estão escondidos!", True, (200,200,210))
-            self.tela.blit(dica, (LARGURA//2 - dica.get_width()//2, by2 + btn2_h + 12))
+                # ---- REMOVIDO: tempo/estatísticas (solicitado) ----
+                # (antes aqui era desenhado "Tempo: Xm Ys  ·  Itens: N" — removido conforme pedido)
+
+                # botões RECOMEÇAR / MENU e a dica: camada estática
+                botoes, pos_botoes = self.camadas.camada("fim_botoes", self.tela.get_size(), self._construir_botoes_fim)
+                self.tela.blit(botoes, pos_botoes)
 
             # floating bits decorativos
-            if len(self._float_bits) < 8 and random.random() < 0.08:
-                self._float_bits.append({"x": random.uniform(LARGURA*0.78, LARGURA*0.94), "y": random.uniform(ALTURA*0.25, ALTURA*0.6), "vy": random.uniform(-8, -30), "alpha": 255, "t": 0})
-            nb = []
-            for b in self._float_bits:
-                b["t"] += dt
-                b["y"] += b["vy"] * dt
-                b["alpha"] = max(0, b["alpha"] - 80 * dt)
-                if b["alpha"] > 6:
-                    nb.append(b)
-            self._float_bits = nb
-            for b in self._float_bits:
-                s = pygame.Surface((8,8), pygame.SRCALPHA)
-                s.fill((255,230,150,int(b["alpha"])))
-                self.tela.blit(s, (int(b["x"]), int(b["y"])))
-
-            # partículas leves sobre selo
-            for i in range(6):
-                rx = LARGURA*0.12 + random.uniform(-18,18)
-                ry = ALTURA*0.22 + random.uniform(-18,18)
-                pygame.draw.circle(self.tela, (255,255,200,80), (int(rx), int(ry)), random.randint(1,3))
+            with perfilador.escopo("fim_brilhos"):
+                efeitos.desenhar_brilhos(self.tela)
+
+                # partículas leves sobre selo
+                for i in range(6):
+                    rx = LARGURA*0.12 + self.rng_visual.uniform(-18,18)
+                    ry = ALTURA*0.22 + self.rng_visual.uniform(-18,18)
+                    pygame.draw.circle(self.tela, (255,255,200,80), (int(rx), int(ry)), self.rng_visual.randint(1,3))
 
             # efeito final de texto quando a contagem terminou
             if elapsed > getattr(self, "_score_anim_len", 1.6) + 0.2:
-                pulse2 = 1.0 + 0.08 * math.sin((now - getattr(self, "_fim_start_time", now)) * 6.0)
-                finale = pygame.font.SysFont("arial", 20, bold=True).render("MUITO BEM! Pressione ENTER para tentar novamente.", True, (255,240,220))
-                rectf = finale.get_rect(center=(LARGURA//2, int(ALTURA*0.48)))
-                glow2 = pygame.Surface((rectf.width+40, rectf.height+18), pygame.SRCALPHA)
-                pygame.draw.rect(glow2, (255,230,120,80), (0,0,rectf.width+40, rectf.height+18), border_radius=8)
-                self.tela.blit(glow2, (rectf.x-20, rectf.y-8))
-                self.tela.blit(finale, rectf)
+                finale = self.camadas.camada("fim_finale", None, self._construir_finale_fim)
+                self.tela.blit(finale, finale.get_rect(center=(LARGURA//2, int(ALTURA*0.48))))
 
         except Exception as e:
             # Se ocorrer qualquer exceção aqui, desenha fallback simples e imprime erro no console (rode pelo terminal para ver traceback)
             try:
                 self.tela.fill((0,0,0))
-                fonte = pygame.font.SysFont("arial", 36, bold=True)
-                err = fonte.render("FIM DE JOGO", True, (240,240,240))
+                err = texto("FIM DE JOGO", 36, (240,240,240), bold=True)
                 self.tela.blit(err, err.get_rect(center=(LARGURA//2, ALTURA//2 - 20)))
-                fonte2 = pygame.font.SysFont("arial", 18)
-                msg = fonte2.render("Ocorreu um erro ao desenhar a tela final. Veja o terminal.", True, (220,180,180))
+                msg = texto("Ocorreu um erro ao desenhar a tela final. Veja o terminal.", 18, (220,180,180))
                 self.tela.blit(msg, msg.get_rect(center=(LARGURA//2, ALTURA//2 + 20)))
             except Exception:
                 pass
             import traceback
             traceback.print_exc()
-# Expor variável global para o método Jogador.desenhar que usamos (pequeno atalho)
-jogo = None
-
 if __name__ == "__main__":
-    jogo = JogoEco()
-    jogo.rodar()
+    parser = argparse.ArgumentParser(description="ECO DE LUZ")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="mede imports, vídeo, fontes, áudio e assets na inicialização e sai")
+    parser.add_argument("--seed", type=int, default=None, help="semente da partida")
+    parser.add_argument("--gravar", metavar="ARQUIVO", help="grava a sessão para replay (python replay.py ARQUIVO)")
+    parser.add_argument("--perfil", action="store_true", help="liga o perfilador de quadros (F3 alterna durante o jogo)")
+    parser.add_argument("--trace", metavar="ARQUIVO",
+                        help="ao sair, exporta os tempos dos escopos em JSON (chrome://tracing / Perfetto); implica --perfil")
+    args = parser.parse_args()
+    jogo = JogoEco(seed=args.seed)
+    if args.perfil or args.trace:
+        perfilador.ligar()
+    if args.profile_startup:
+        jogo.perfilar_inicio()
+        pygame.quit()
+    else:
+        if args.gravar:
+            from replay import Gravador
+            jogo.gravador = Gravador(jogo.seed, PASSO_SIM)
+        try:
+            jogo.rodar()
+        finally:
+            # rodar() só termina com sys.exit (QUIT/ESC): a gravação é salva na saída
+            if jogo.gravador is not None:
+                tamanho = jogo.gravador.salvar(args.gravar)
+                print(f"sessão gravada em {args.gravar} ({len(jogo.gravador.mascaras)} ticks, {tamanho} bytes)")
+            if args.trace:
+                eventos = perfilador.exportar_chrome(args.trace)
+                print(f"trace com {eventos} eventos salvo em {args.trace}")
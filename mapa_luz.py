@@ -0,0 +1,84 @@
+"""
+mapa_luz.py - mapa de luz em baixa resolução para a camada de escuridão
+
+A máscara de escuridão é calculada numa fração da resolução da tela (ex.:
+1/4 em cada eixo = 1/16 dos pixels), com borda suave em volta de cada luz,
+ampliada com smoothscale e misturada na tela com um único blit. Se nenhuma
+luz mudou desde o último quadro, a máscara pronta é reaproveitada.
+"""
+
+import numpy as np
+import pygame
+
+
+class MapaLuz:
+    """
+    Parâmetros:
+      largura, altura: tamanho da tela
+      fracao: fração da resolução usada para montar a máscara (0 < fracao <= 1)
+      suavidade: largura da borda suave (pixels de tela), centrada no raio de cada luz
+      alpha_escuro: opacidade da escuridão onde nenhuma luz alcança
+    """
+    def __init__(self, largura, altura, fracao=0.25, suavidade=16, alpha_escuro=220):
+        self.suavidade = float(suavidade)
+        self.alpha_escuro = alpha_escuro
+        self.redimensionar(largura, altura, fracao)
+
+    def redimensionar(self, largura, altura, fracao=None):
+        if fracao is not None:
+            self.fracao = fracao
+        self.largura = largura
+        self.altura = altura
+        self.colunas = max(1, int(round(largura * self.fracao)))
+        self.linhas = max(1, int(round(altura * self.fracao)))
+        # centro de cada pixel da máscara, em coordenadas de tela
+        self._px = (np.arange(self.colunas) + 0.5) * (largura / self.colunas)
+        self._py = (np.arange(self.linhas) + 0.5) * (altura / self.linhas)
+        self._luz = np.zeros((self.colunas, self.linhas), dtype=np.float32)   # (x, y), como o surfarray
+        self._baixa = pygame.Surface((self.colunas, self.linhas), pygame.SRCALPHA)
+        self._baixa.fill((0, 0, 0, self.alpha_escuro))
+        self._mascara = None
+        self._chave = None
+        self.reconstrucoes = 0
+
+    def _acender(self, x, y, raio):
+        # intensidade 1 até raio - s/2, cai linearmente até 0 em raio + s/2
+        s = self.suavidade
+        alcance = raio + s / 2
+        escala_x = self.colunas / self.largura
+        escala_y = self.linhas / self.altura
+        c0 = max(0, int((x - alcance) * escala_x)); c1 = min(self.colunas, int((x + alcance) * escala_x) + 1)
+        l0 = max(0, int((y - alcance) * escala_y)); l1 = min(self.linhas, int((y + alcance) * escala_y) + 1)
+        if c0 >= c1 or l0 >= l1:
+            return
+        dx = self._px[c0:c1] - x
+        dy = self._py[l0:l1] - y
+        dist = np.sqrt(dx[:, None] ** 2 + dy[None, :] ** 2)
+        if s > 0:
+            intensidade = np.clip((alcance - dist) / s, 0.0, 1.0)
+        else:
+            intensidade = (dist <= raio).astype(np.float32)
+        bloco = self._luz[c0:c1, l0:l1]
+        np.maximum(bloco, intensidade, out=bloco)
+
+    def mascara(self, luzes):
+        """
+        Retorna a Surface SRCALPHA (tamanho da tela) com a escuridão.
+        luzes: lista de (x, y, raio)
+        """
+        chave = tuple((int(x), int(y), int(r)) for (x, y, r) in luzes)
+        if self._mascara is not None and chave == self._chave:
+            return self._mascara
+        self._chave = chave
+        self._luz[:] = 0.0
+        for (x, y, r) in luzes:
+            self._acender(x, y, r)
+        alpha = pygame.surfarray.pixels_alpha(self._baixa)
+        alpha[:] = (self.alpha_escuro * (1.0 - self._luz)).astype(np.uint8)
+        del alpha   # libera o lock da Surface
+        self._mascara = pygame.transform.smoothscale(self._baixa, (self.largura, self.altura))
+        self.reconstrucoes += 1
+        return self._mascara
+
+    def desenhar(self, tela, luzes):
+        tela.blit(self.mascara(luzes), (0, 0))
@@ -0,0 +1,265 @@
+"""
+motor_inimigos.py - simulação vetorizada (NumPy) de todos os inimigos
+
+Os dados ficam em arrays paralelos (struct-of-arrays): um índice por inimigo.
+Um único step(dt) avança patrulha / investigação / perseguição, a separação
+entre vizinhos e o limite da tela para todos de uma vez, sem chamar métodos
+Python por inimigo. A classe Inimigo em main.py é só uma "visão" de um índice.
+Com paredes (obstaculos), quem investiga ou persegue segue o campo de fluxo
+do seu alvo (navegacao.CamposFluxo) e ninguém atravessa tile bloqueado.
+step() aceita um dt por inimigo e uma máscara de ativos, para que só uma
+parte deles rode em cada tick (agendador_ia.AgendadorIA).
+"""
+
+import numpy as np
+
+from espacial import pares_proximos
+
+# Mesmos valores de EstadoInimigo (main.py), guardados como int8
+PATRULHA = 1
+INVESTIGAR = 2
+PERSEGUIR = 3
+
+
+class MotorInimigos:
+    """
+    Armazena e simula os inimigos.
+    Parâmetros:
+      largura, altura: limites da área onde os inimigos podem andar
+      velocidade: velocidade padrão de patrulha
+      velocidade_alerta: velocidade ao investigar/perseguir
+      dist_separacao, forca_separacao: regra de afastamento entre inimigos
+      margem: distância mínima até a borda
+    """
+    def __init__(self, largura, altura, velocidade=70, velocidade_alerta=120,
+                 dist_separacao=48, forca_separacao=40, margem=8, capacidade=16):
+        self.largura = largura
+        self.altura = altura
+        self.velocidade_padrao = float(velocidade)
+        self.velocidade_alerta = float(velocidade_alerta)
+        self.dist_separacao = float(dist_separacao)
+        self.forca_separacao = float(forca_separacao)
+        self.margem = margem
+        self.obstaculos = None   # navegacao.MapaObstaculos (None = campo aberto)
+        self.navegacao = None    # navegacao.CamposFluxo usado por quem investiga/persegue
+        self.raio_colisao = 14   # meia largura da caixa testada contra as paredes
+        self.n = 0
+        self._livres = []   # índices < n de inimigos removidos, reaproveitados por adicionar()
+        self._alocar(max(1, capacidade), 3)
+
+    def _alocar(self, capacidade, max_pontos):
+        # cria (ou aumenta) os arrays preservando os n primeiros inimigos
+        antigos = getattr(self, "x", None)
+        n = self.n
+
+        novo = lambda forma, dtype, valor=0: np.full(forma, valor, dtype=dtype)
+        campos = {
+            "x": novo(capacidade, np.float64),
+            "y": novo(capacidade, np.float64),
+            # posição no tick anterior (interpolação do desenho)
+            "x_ant": novo(capacidade, np.float64),
+            "y_ant": novo(capacidade, np.float64),
+            "estado": novo(capacidade, np.int8, PATRULHA),
+            "idx_alvo": novo(capacidade, np.int32),
+            "alerta_x": novo(capacidade, np.float64),
+            "alerta_y": novo(capacidade, np.float64),
+            "tem_alerta": novo(capacidade, np.bool_, False),
+            "timer_alerta": novo(capacidade, np.float64),
+            "vivo": novo(capacidade, np.bool_, False),
+            "revelado_ate": novo(capacidade, np.float64),
+            "velocidade": novo(capacidade, np.float64, self.velocidade_padrao),
+            "n_pontos": novo(capacidade, np.int32, 1),
+            # sobe a cada adicionar() na vaga: quem guarda estado por índice percebe a troca de inimigo
+            "geracao": novo(capacidade, np.int64),
+        }
+        pontos = novo((capacidade, max_pontos, 2), np.float64)
+        if antigos is not None:
+            for nome, arr in campos.items():
+                arr[:n] = getattr(self, nome)[:n]
+            mp = self.pontos.shape[1]
+            pontos[:n, :mp] = self.pontos[:n]
+        for nome, arr in campos.items():
+            setattr(self, nome, arr)
+        self.pontos = pontos
+
+    @property
+    def capacidade(self):
+        return len(self.x)
+
+    def limpar(self):
+        """Remove todos os inimigos (mantém a memória já alocada)."""
+        self.n = 0
+        self._livres.clear()
+        self.vivo[:] = False
+
+    def adicionar(self, x, y, pontos_patrulha=None):
+        """Cria um inimigo e retorna o índice dele nos arrays."""
+        pontos = list(pontos_patrulha or [(x, y)])
+        if self._livres:
+            i = self._livres.pop()
+        else:
+            if self.n >= self.capacidade:
+                self._alocar(self.capacidade * 2, self.pontos.shape[1])
+            i = self.n
+            self.n += 1
+        self.x[i] = self.x_ant[i] = x
+        self.y[i] = self.y_ant[i] = y
+        self.estado[i] = PATRULHA
+        self.idx_alvo[i] = 0
+        self.tem_alerta[i] = False
+        self.timer_alerta[i] = 0.0
+        self.vivo[i] = True
+        self.revelado_ate[i] = 0.0
+        self.velocidade[i] = self.velocidade_padrao
+        self.geracao[i] += 1
+        self.definir_pontos(i, pontos)
+        return i
+
+    def remover(self, i):
+        """Tira o inimigo i da simulação; o índice volta a ficar livre para adicionar()."""
+        if self.vivo[i]:
+            self.vivo[i] = False
+            self._livres.append(i)
+
+    @property
+    def vivos(self):
+        return self.n - len(self._livres)
+
+    def guardar_anteriores(self, ativos=None):
+        """
+        Copia as posições atuais para x_ant/y_ant (chamado antes de cada tick).
+        ativos: máscara (n,) opcional; quem fica parado neste tick mantém o x_ant do seu último passo
+        """
+        n = self.n
+        if ativos is None:
+            self.x_ant[:n] = self.x[:n]
+            self.y_ant[:n] = self.y[:n]
+        else:
+            self.x_ant[:n][ativos] = self.x[:n][ativos]
+            self.y_ant[:n][ativos] = self.y[:n][ativos]
+
+    def definir_pontos(self, i, pontos):
+        """Troca a rota de patrulha do inimigo i."""
+        if len(pontos) > self.pontos.shape[1]:
+            self._alocar(self.capacidade, len(pontos))
+        self.pontos[i, :len(pontos)] = pontos
+        self.n_pontos[i] = len(pontos)
+        self.idx_alvo[i] %= len(pontos)
+
+    def step(self, dt, pos_jogador, atraido=False, ativos=None):
+        """
+        Avança todos os inimigos vivos.
+        dt: float, ou array (n,) com um dt por inimigo
+        ativos: máscara booleana (n,) opcional; só esses inimigos são atualizados
+        """
+        n = self.n
+        if n == 0:
+            return
+        px, py = pos_jogador
+        x = self.x[:n]; y = self.y[:n]
+        estado = self.estado[:n]
+        vivo = self.vivo[:n]
+        mask = vivo if ativos is None else (vivo & ativos)
+        if not mask.any():
+            return
+        if np.ndim(dt):
+            dt = np.asarray(dt, dtype=np.float64)[:n]
+
+        # mudança de estado
+        if atraido:
+            estado[mask] = PERSEGUIR
+        else:
+            parou = mask & (estado == PERSEGUIR)
+            if parou.any():
+                estado[parou] = INVESTIGAR
+                self.alerta_x[:n][parou] = px
+                self.alerta_y[:n][parou] = py
+                self.tem_alerta[:n][parou] = True
+                self.timer_alerta[:n][parou] = 2.4
+
+        # separação entre os inimigos deste passo (posições do início do passo);
+        # com 'ativos', quem ficou de fora não entra nos pares: o custo acompanha os ativos
+        sep_fx = np.zeros(n)
+        sep_fy = np.zeros(n)
+        idx_vivos = np.flatnonzero(mask)
+        if len(idx_vivos) > 1:
+            i, j, dx, dy, dist = pares_proximos(x[idx_vivos], y[idx_vivos], self.dist_separacao)
+            ok = dist > 0
+            i = i[ok]; dx = dx[ok]; dy = dy[ok]; dist = dist[ok]
+            if len(i):
+                fator = (self.dist_separacao - dist) / self.dist_separacao * self.forca_separacao / dist
+                sep_fx[idx_vivos] = np.bincount(i, weights=dx * fator, minlength=len(idx_vivos))
+                sep_fy[idx_vivos] = np.bincount(i, weights=dy * fator, minlength=len(idx_vivos))
+
+        # alvo e velocidade conforme o estado
+        patrulha = mask & (estado == PATRULHA)
+        investiga = mask & (estado == INVESTIGAR) & self.tem_alerta[:n]
+        persegue = mask & (estado == PERSEGUIR)
+
+        idx_alvo = self.idx_alvo[:n]
+        linhas = np.arange(n)
+        tx = self.pontos[linhas, idx_alvo, 0]
+        ty = self.pontos[linhas, idx_alvo, 1]
+        tx = np.where(investiga, self.alerta_x[:n], tx)
+        ty = np.where(investiga, self.alerta_y[:n], ty)
+        tx = np.where(persegue, px, tx)
+        ty = np.where(persegue, py, ty)
+        vel = np.where(patrulha, self.velocidade[:n], self.velocidade_alerta)
+        anda = patrulha | investiga | persegue
+
+        # mover_para vetorizado
+        x_ini = x.copy(); y_ini = y.copy()
+        dx = tx - x
+        dy = ty - y
+        dist = np.hypot(dx, dy)
+        move = anda & (dist > 1)
+        passo = np.zeros(n)
+        np.divide(vel * dt, dist, out=passo, where=move)
+        np.minimum(passo, 1.0, out=passo)   # dt acumulado grande não passa do alvo
+        ux = dx * passo
+        uy = dy * passo
+        if self.navegacao is not None:
+            self._seguir_campos(investiga | persegue, move, tx, ty, vel * dt, ux, uy)
+        x += ux
+        y += uy
+
+        # chegada no ponto de patrulha / no local do alerta
+        dist = np.hypot(x - tx, y - ty)
+        chegou = patrulha & (dist < 8)
+        if chegou.any():
+            idx_alvo[chegou] = (idx_alvo[chegou] + 1) % self.n_pontos[:n][chegou]
+        perto = investiga & (dist < 10)
+        if perto.any():
+            timer = self.timer_alerta[:n]
+            timer[perto] -= dt[perto] if np.ndim(dt) else dt
+            fim = perto & (timer <= 0)
+            estado[fim] = PATRULHA
+            self.tem_alerta[:n][fim] = False
+
+        # aplica separação e limites da tela
+        x[mask] += (sep_fx * dt)[mask]
+        y[mask] += (sep_fy * dt)[mask]
+        m = self.margem
+        np.clip(x, m, self.largura - m, out=x, where=mask)
+        np.clip(y, m, self.altura - m, out=y, where=mask)
+        if self.obstaculos is not None:
+            # quem entraria numa parede desliza pelo eixo livre (ou fica onde estava)
+            idx = np.flatnonzero(mask)
+            x[idx], y[idx] = self.obstaculos.resolver(x_ini[idx], y_ini[idx], x[idx], y[idx], self.raio_colisao)
+
+    def _seguir_campos(self, alerta, move, tx, ty, deslocamento, ux, uy):
+        # um campo por alvo distinto (tile do alvo); os inimigos indo para ele leem a direção do tile onde estão
+        idx = np.flatnonzero(alerta & move)
+        if len(idx) == 0:
+            return
+        t = self.obstaculos.tile
+        alvos = np.stack([np.floor(ty[idx] / t), np.floor(tx[idx] / t)], axis=1)
+        _, grupo = np.unique(alvos, axis=0, return_inverse=True)
+        grupo = grupo.ravel()
+        for g in range(grupo.max() + 1):
+            sel = idx[grupo == g]
+            k = sel[0]
+            dx, dy, ok = self.navegacao.direcoes(self.x[sel], self.y[sel], tx[k], ty[k])
+            sel = sel[ok]
+            ux[sel] = dx[ok] * deslocamento[sel]
+            uy[sel] = dy[ok] * deslocamento[sel]
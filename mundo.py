@@ -0,0 +1,222 @@
+"""
+mundo.py - mundo maior que a tela: câmera e chunks gerados sob demanda
+
+O mundo tem coordenadas próprias; a Camera diz qual retângulo dele aparece
+na tela e converte posições do mundo para a tela. O mundo é dividido em
+chunks quadrados. Cada chunk é gerado a partir da semente da partida e das
+suas coordenadas, sempre do mesmo jeito:
+  - a população (inimigos com rota de patrulha e itens) entra quando o chunk
+    chega perto da câmera e sai quando ele fica longe;
+  - o fundo (Surface) é desenhado na primeira vez que aparece e fica num
+    cache LRU com tamanho máximo.
+Assim memória e custo por quadro dependem da área visível, não do tamanho do
+mundo.
+"""
+
+import random
+from collections import OrderedDict
+
+import pygame
+
+
+class Camera:
+    """
+    Parâmetros:
+      largura, altura: tamanho da tela (área visível do mundo)
+      mundo_largura, mundo_altura: limites do mundo (a câmera não passa das bordas)
+    """
+    def __init__(self, largura, altura, mundo_largura, mundo_altura):
+        self.largura = largura
+        self.altura = altura
+        self.mundo_largura = mundo_largura
+        self.mundo_altura = mundo_altura
+        self.x = 0.0   # canto superior esquerdo da tela, em coordenadas do mundo
+        self.y = 0.0
+
+    def origem_para(self, x, y):
+        """Canto superior esquerdo de uma tela centrada em (x, y), sem sair do mundo."""
+        ox = min(max(x - self.largura / 2, 0.0), max(0.0, self.mundo_largura - self.largura))
+        oy = min(max(y - self.altura / 2, 0.0), max(0.0, self.mundo_altura - self.altura))
+        return int(ox), int(oy)
+
+    def centrar(self, x, y):
+        self.x, self.y = self.origem_para(x, y)
+
+    @property
+    def origem(self):
+        return (self.x, self.y)
+
+    def para_tela(self, x, y):
+        return (x - self.x, y - self.y)
+
+    def visivel(self, x, y, margem=0):
+        return (self.x - margem <= x < self.x + self.largura + margem
+                and self.y - margem <= y < self.y + self.altura + margem)
+
+
+class Mundo:
+    """
+    Parâmetros:
+      seed: semente da partida (a mesma semente gera os mesmos chunks)
+      tamanho_chunk: lado de cada chunk em pixels
+      colunas, linhas: quantidade de chunks do mundo
+      raio_carga: chunks além da área visível que continuam com população carregada
+      max_fundos: quantos fundos de chunk ficam guardados (LRU)
+      area_inicial: retângulo (x, y, l, a) da área montada à mão em reiniciar_jogo (sem população gerada)
+    """
+    def __init__(self, seed, tamanho_chunk=512, colunas=16, linhas=16, raio_carga=1,
+                 max_fundos=24, area_inicial=None):
+        self.seed = seed
+        self.tamanho_chunk = tamanho_chunk
+        self.colunas = colunas
+        self.linhas = linhas
+        self.raio_carga = raio_carga
+        self.max_fundos = max_fundos
+        self.area_inicial = pygame.Rect(area_inicial) if area_inicial else None
+        self.povoar = True          # False: os chunks não ganham inimigos/itens (ex.: benchmark)
+        self.obstaculos = None      # navegacao.MapaObstaculos: paredes no fundo, população fora delas
+        self.ativos = {}            # (cx, cy) -> o que ao_carregar devolveu
+        self.coletados = set()      # (cx, cy, k): itens de chunk já coletados (não voltam)
+        self._fundos = OrderedDict()
+        self._base = None           # (id da imagem, tamanho) -> fundo base escalado
+        self._intervalo = None
+
+    @property
+    def largura(self):
+        return self.tamanho_chunk * self.colunas
+
+    @property
+    def altura(self):
+        return self.tamanho_chunk * self.linhas
+
+    def reiniciar(self, seed=None):
+        """Nova partida: esquece chunks carregados e itens coletados (os fundos continuam valendo)."""
+        if seed is not None and seed != self.seed:
+            self.seed = seed
+            self._fundos.clear()
+        self.ativos.clear()
+        self.coletados.clear()
+        self._intervalo = None
+
+    def chunk_de(self, x, y):
+        return (int(x // self.tamanho_chunk), int(y // self.tamanho_chunk))
+
+    def _chunks_no_retangulo(self, x, y, largura, altura, margem=0):
+        t = self.tamanho_chunk
+        c0 = max(0, int(x // t) - margem); c1 = min(self.colunas - 1, int((x + largura - 1) // t) + margem)
+        l0 = max(0, int(y // t) - margem); l1 = min(self.linhas - 1, int((y + altura - 1) // t) + margem)
+        return c0, c1, l0, l1
+
+    def _rng(self, cx, cy, uso):
+        # semente em texto: o random do Python a transforma de forma estável entre execuções
+        return random.Random(f"{self.seed}:{cx}:{cy}:{uso}")
+
+    # --- população ---
+    def populacao(self, cx, cy):
+        """
+        Inimigos e itens do chunk, sempre os mesmos para a mesma semente.
+        Retorna (inimigos, itens): [(x, y, pontos_patrulha)], [(k, x, y)]
+        """
+        if not self.povoar:
+            return [], []
+        t = self.tamanho_chunk
+        x0, y0 = cx * t, cy * t
+        if self.area_inicial and self.area_inicial.colliderect((x0, y0, t, t)):
+            return [], []
+        rng = self._rng(cx, cy, "populacao")
+        livre = (lambda x, y: self.obstaculos.livre(x, y, 16)) if self.obstaculos else (lambda x, y: True)
+        inimigos = []
+        for _ in range(rng.randint(0, 2)):
+            x = x0 + rng.uniform(48, t - 48)
+            y = y0 + rng.uniform(48, t - 48)
+            pontos = [(x, y)] + [(x + rng.uniform(-140, 140), y + rng.uniform(-100, 100))
+                                 for _ in range(rng.randint(1, 2))]
+            # os sorteios acontecem sempre; só o que caiu numa parede é descartado
+            if livre(x, y):
+                inimigos.append((x, y, [p for p in pontos if livre(*p)]))
+        itens = []
+        for k in range(rng.randint(0, 2)):
+            x = x0 + rng.uniform(40, t - 40)
+            y = y0 + rng.uniform(40, t - 40)
+            if (cx, cy, k) not in self.coletados and livre(x, y):
+                itens.append((k, x, y))
+        return inimigos, itens
+
+    def atualizar(self, origem, largura, altura, ao_carregar, ao_descarregar):
+        """
+        Carrega os chunks perto da tela com origem 'origem' e descarrega os que ficaram longe.
+        ao_carregar(chunk, inimigos, itens) -> dados guardados em ativos[chunk]
+        ao_descarregar(chunk, dados)
+        Só trabalha quando o conjunto de chunks próximos muda.
+        """
+        intervalo = self._chunks_no_retangulo(origem[0], origem[1], largura, altura, self.raio_carga)
+        if intervalo == self._intervalo:
+            return False
+        self._intervalo = intervalo
+        c0, c1, l0, l1 = intervalo
+        perto = {(cx, cy) for cx in range(c0, c1 + 1) for cy in range(l0, l1 + 1)}
+        # ordem fixa: o resultado não pode depender da ordem de um set
+        for chunk in sorted(set(self.ativos) - perto):
+            ao_descarregar(chunk, self.ativos.pop(chunk))
+        for chunk in sorted(perto - set(self.ativos)):
+            self.ativos[chunk] = ao_carregar(chunk, *self.populacao(*chunk))
+        return True
+
+    # --- fundo ---
+    def _fundo_base(self, imagem):
+        chave = (id(imagem), self.tamanho_chunk)
+        if self._base is None or self._base[0] != chave:
+            t = self.tamanho_chunk
+            base = imagem
+            if base is not None and base.get_size() != (t, t):
+                base = pygame.transform.smoothscale(base, (t, t))
+                if pygame.display.get_surface() is not None:
+                    base = base.convert()
+            self._base = (chave, base)
+            # fundos feitos com a base anterior (ou sem ela) ficaram velhos
+            self._fundos.clear()
+        return self._base[1]
+
+    def fundo(self, cx, cy, imagem):
+        """Surface opaca do chunk (gerada na primeira vez, depois servida do LRU)."""
+        chave = (cx, cy)
+        s = self._fundos.get(chave)
+        if s is not None:
+            self._fundos.move_to_end(chave)
+            return s
+        t = self.tamanho_chunk
+        base = self._fundo_base(imagem)
+        s = pygame.Surface((t, t))
+        if base is not None:
+            s.blit(base, (0, 0))
+        else:
+            s.fill((6, 8, 14))
+        # detalhes do chunk (pedras e poeira), sempre iguais para a mesma semente
+        rng = self._rng(cx, cy, "fundo")
+        for _ in range(rng.randint(6, 14)):
+            r = rng.randint(6, 26)
+            cor = (rng.randint(18, 34), rng.randint(20, 38), rng.randint(28, 48))
+            pygame.draw.circle(s, cor, (rng.randint(0, t), rng.randint(0, t)), r)
+        for _ in range(rng.randint(20, 40)):
+            v = rng.randint(40, 90)
+            s.set_at((rng.randrange(t), rng.randrange(t)), (v, v, v + 20))
+        if self.obstaculos is not None:
+            # paredes: tiles bloqueados que caem neste chunk
+            o = self.obstaculos
+            por_chunk = t // o.tile
+            bloco = o.bloqueado[cy * por_chunk:(cy + 1) * por_chunk, cx * por_chunk:(cx + 1) * por_chunk]
+            for l, c in zip(*bloco.nonzero()):
+                r = (int(c) * o.tile, int(l) * o.tile, o.tile, o.tile)
+                s.fill((52, 58, 76), r)
+                pygame.draw.rect(s, (84, 92, 118), r, 2)
+        self._fundos[chave] = s
+        if len(self._fundos) > self.max_fundos:
+            self._fundos.popitem(last=False)
+        return s
+
+    def desenhar_fundo(self, tela, camera, imagem):
+        """Desenha os fundos dos chunks que a câmera vê (cobre a tela inteira)."""
+        c0, c1, l0, l1 = self._chunks_no_retangulo(camera.x, camera.y, camera.largura, camera.altura)
+        t = self.tamanho_chunk
+        tela.blits([(self.fundo(cx, cy, imagem), (int(cx * t - camera.x), int(cy * t - camera.y)))
+                    for cy in range(l0, l1 + 1) for cx in range(c0, c1 + 1)], doreturn=False)
@@ -0,0 +1,273 @@
+"""
+navegacao.py - obstáculos em tiles e campos de fluxo compartilhados
+
+MapaObstaculos é uma grade de tiles (bloqueado ou livre) do mundo inteiro,
+gerada a partir da semente: paredes retas espalhadas pelos chunks, fora da
+área inicial. Responde "este ponto / esta caixa está livre?" para arrays de
+posições.
+
+CamposFluxo calcula, para cada alvo (um ping, o jogador perseguido...), uma
+busca em largura a partir do tile do alvo numa janela em volta dele e guarda,
+em cada tile, a direção que leva ao alvo contornando as paredes. O campo fica
+em cache até o alvo mudar de tile, e qualquer número de inimigos lê a própria
+direção em O(1): o custo depende de quantos alvos existem, não de quantos
+inimigos andam até eles.
+Uso: dx, dy, ok = campos.direcoes(xs, ys, alvo_x, alvo_y)
+"""
+
+import random
+from collections import OrderedDict
+
+import numpy as np
+
+
+class MapaObstaculos:
+    """
+    Parâmetros:
+      largura, altura: tamanho do mundo em pixels
+      tile: lado de cada tile em pixels
+    """
+    def __init__(self, largura, altura, tile=32):
+        self.tile = tile
+        self.colunas = -(-largura // tile)
+        self.linhas = -(-altura // tile)
+        self.bloqueado = np.zeros((self.linhas, self.colunas), dtype=bool)
+
+    def gerar(self, seed, tamanho_chunk, area_livre=None, paredes_por_chunk=(1, 4)):
+        """
+        Refaz as paredes a partir da semente (sempre as mesmas para a mesma semente).
+        area_livre: retângulo (x, y, l, a) que fica sem paredes (a tela inicial)
+        """
+        self.bloqueado[:] = False
+        por_chunk = tamanho_chunk // self.tile
+        rng = random.Random(f"{seed}:obstaculos")
+        for cy in range(0, self.linhas, por_chunk):
+            for cx in range(0, self.colunas, por_chunk):
+                for _ in range(rng.randint(*paredes_por_chunk)):
+                    comprimento = rng.randint(3, por_chunk - 4)
+                    c = cx + rng.randint(1, por_chunk - 2)
+                    l = cy + rng.randint(1, por_chunk - 2)
+                    if rng.random() < 0.5:
+                        self.bloqueado[l, c:c + comprimento] = True
+                    else:
+                        self.bloqueado[l:l + comprimento, c] = True
+        if area_livre is not None:
+            x, y, lg, al = area_livre
+            t = self.tile
+            self.bloqueado[y // t:-(-(y + al) // t), x // t:-(-(x + lg) // t)] = False
+
+    def bloqueados(self, xs, ys):
+        """True onde o ponto cai num tile bloqueado (fora do mundo também conta como bloqueado)."""
+        c = np.floor(np.asarray(xs, dtype=np.float64) / self.tile).astype(np.intp)
+        l = np.floor(np.asarray(ys, dtype=np.float64) / self.tile).astype(np.intp)
+        fora = (c < 0) | (c >= self.colunas) | (l < 0) | (l >= self.linhas)
+        res = np.ones(np.shape(c), dtype=bool)
+        dentro = ~fora
+        res[dentro] = self.bloqueado[l[dentro], c[dentro]]
+        return res
+
+    def bloqueados_caixa(self, xs, ys, raio):
+        """Como bloqueados(), mas testando os quatro cantos de uma caixa de lado 2*raio."""
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        # os quatro cantos numa única consulta
+        cantos = self.bloqueados(np.stack([xs - raio, xs + raio, xs - raio, xs + raio]),
+                                 np.stack([ys - raio, ys - raio, ys + raio, ys + raio]))
+        return cantos.any(axis=0)
+
+    def livre(self, x, y, raio=0):
+        """Versão escalar de bloqueados_caixa() (sem NumPy: barata para um ponto só)."""
+        t = self.tile
+        for px in (x - raio, x + raio):
+            for py in (y - raio, y + raio):
+                c = int(px // t); l = int(py // t)
+                if not (0 <= c < self.colunas and 0 <= l < self.linhas) or self.bloqueado[l, c]:
+                    return False
+        return True
+
+    def resolver_ponto(self, x0, y0, x1, y1, raio):
+        """resolver() para um ponto só (o jogador)."""
+        if self.livre(x1, y1, raio):
+            return x1, y1
+        if self.livre(x0, y1, raio):
+            return x0, y1
+        if self.livre(x1, y0, raio):
+            return x1, y0
+        return x0, y0
+
+    def livres_na_grade(self, origem, colunas, linhas, celula):
+        """Máscara (linhas x colunas) das células de 'celula' px, a partir de 'origem', sem parede."""
+        ox, oy = origem
+        xs = ox + (np.arange(colunas) + 0.5) * celula
+        ys = oy + (np.arange(linhas) + 0.5) * celula
+        gx, gy = np.meshgrid(xs, ys)
+        return ~self.bloqueados_caixa(gx, gy, celula / 2)
+
+    def resolver(self, x0, y0, x1, y1, raio):
+        """
+        Movimento de (x0, y0) para (x1, y1) sem entrar em parede: desliza no eixo livre
+        ou fica parado. Arrays (ou números); retorna (x, y).
+        """
+        x0 = np.asarray(x0, dtype=np.float64); y0 = np.asarray(y0, dtype=np.float64)
+        x1 = np.asarray(x1, dtype=np.float64); y1 = np.asarray(y1, dtype=np.float64)
+        bate = self.bloqueados_caixa(x1, y1, raio)
+        if not np.any(bate):
+            return x1, y1
+        so_y = bate & ~self.bloqueados_caixa(x0, y1, raio)            # mantém x antigo
+        so_x = bate & ~so_y & ~self.bloqueados_caixa(x1, y0, raio)    # mantém y antigo
+        parado = bate & ~so_y & ~so_x
+        x = np.where(so_y | parado, x0, x1)
+        y = np.where(so_x | parado, y0, y1)
+        return x, y
+
+
+class CampoFluxo:
+    # direções (dx, dy) normalizadas para o alvo numa janela de tiles em volta dele
+    __slots__ = ("l0", "c0", "dx", "dy", "alcancado")
+
+    def __init__(self, l0, c0, dx, dy, alcancado):
+        self.l0 = l0
+        self.c0 = c0
+        self.dx = dx
+        self.dy = dy
+        self.alcancado = alcancado
+
+
+class CamposFluxo:
+    """
+    Parâmetros:
+      obstaculos: MapaObstaculos
+      raio_tiles: metade do lado da janela da busca (tiles); fora dela o inimigo anda em linha reta
+      max_campos: campos guardados em cache (LRU)
+      raio_colisao: meia largura da caixa do inimigo; a busca passa só por tiles onde ela cabe
+    """
+    def __init__(self, obstaculos, raio_tiles=24, max_campos=32, raio_colisao=0):
+        self.obstaculos = obstaculos
+        self.raio_tiles = raio_tiles
+        self.raio_colisao = raio_colisao
+        self.max_campos = max_campos
+        self._campos = OrderedDict()   # (linha, coluna) do alvo -> CampoFluxo
+        self.calculados = 0            # campos calculados desde o início (para ajuste/benchmark)
+
+    def limpar(self):
+        """Esquece todos os campos (ex.: depois que as paredes mudaram)."""
+        self._campos.clear()
+
+    def __len__(self):
+        return len(self._campos)
+
+    def campo(self, x, y):
+        """Campo de fluxo para o alvo em (x, y); recalculado só quando o alvo muda de tile."""
+        t = self.obstaculos.tile
+        chave = (int(y // t), int(x // t))
+        c = self._campos.get(chave)
+        if c is not None:
+            self._campos.move_to_end(chave)
+            return c
+        c = self._calcular(*chave)
+        self._campos[chave] = c
+        if len(self._campos) > self.max_campos:
+            self._campos.popitem(last=False)
+        return c
+
+    def _calcular(self, la, ca):
+        self.calculados += 1
+        obst = self.obstaculos
+        r = self.raio_tiles
+        l0 = max(0, la - r); l1 = min(obst.linhas, la + r + 1)
+        c0 = max(0, ca - r); c1 = min(obst.colunas, ca + r + 1)
+        livre = ~obst.bloqueado[l0:l1, c0:c1]
+        # paredes engordadas pela caixa do inimigo: de qualquer ponto de um tile "folgado"
+        # a caixa não encosta em parede, então quem segue o campo nunca fica preso num canto
+        k = -(-int(self.raio_colisao) // obst.tile)
+        folgado = ~self._engordar(obst, l0, l1, c0, c1, k)
+        h, w = livre.shape
+        dist = np.full((h, w), np.inf)
+        al, ac = la - l0, ca - c0
+        if 0 <= al < h and 0 <= ac < w:
+            # o alvo (e o que está livre logo em volta dele) conta como passagem mesmo encostado numa parede
+            perto = np.zeros((h, w), dtype=bool)
+            perto[max(0, al - k - 1):al + k + 2, max(0, ac - k - 1):ac + k + 2] = True
+            folgado |= livre & perto
+            folgado[al, ac] = True
+            dist[al, ac] = 0.0
+            fronteira = np.zeros((h, w), dtype=bool)
+            fronteira[al, ac] = True
+            self._ondas(fronteira, folgado, dist, 0)
+            # depois, os tiles livres encostados nas paredes recebem a distância do vizinho folgado
+            # (o campo ali aponta para longe da parede), sem abrir caminho pelas frestas
+            # (a engorda inclui as diagonais: até 2k passos em 4 direções)
+            for _ in range(2 * k):
+                self._encostar(livre, dist)
+        alcancado = np.isfinite(dist)
+
+        # direção = descida do gradiente da distância (diferenças centrais: diagonais suaves);
+        # vizinho bloqueado ou fora da janela vale "um a mais" que o tile, o que afasta das paredes
+        d = np.where(alcancado, dist, np.nan)
+        borda = np.pad(d, 1, constant_values=np.nan)
+        centro = d
+        def vizinho(v):
+            return np.where(np.isnan(v), centro + 1.0, v)
+        esq = vizinho(borda[1:-1, :-2]); dir_ = vizinho(borda[1:-1, 2:])
+        cima = vizinho(borda[:-2, 1:-1]); baixo = vizinho(borda[2:, 1:-1])
+        gx = esq - dir_
+        gy = cima - baixo
+        norma = np.hypot(gx, gy)
+        ok = alcancado & (norma > 0)
+        dx = np.zeros((h, w)); dy = np.zeros((h, w))
+        dx[ok] = gx[ok] / norma[ok]
+        dy[ok] = gy[ok] / norma[ok]
+        return CampoFluxo(l0, c0, dx, dy, alcancado)
+
+    @staticmethod
+    def _engordar(obst, l0, l1, c0, c1, k):
+        # tiles da janela a até k tiles (inclusive na diagonal) de uma parede; fora do mundo conta como parede
+        b = np.pad(obst.bloqueado, k, constant_values=True)[l0:l1 + 2 * k, c0:c1 + 2 * k]
+        h, w = l1 - l0, c1 - c0
+        res = np.zeros((h, w), dtype=bool)
+        for dl in range(2 * k + 1):
+            for dc in range(2 * k + 1):
+                res |= b[dl:dl + h, dc:dc + w]
+        return res
+
+    @staticmethod
+    def _encostar(livre, dist):
+        # um passo: tile livre ainda sem distância ganha (menor vizinho alcançado) + 1
+        borda = np.pad(dist, 1, constant_values=np.inf)
+        menor = np.minimum(np.minimum(borda[:-2, 1:-1], borda[2:, 1:-1]),
+                           np.minimum(borda[1:-1, :-2], borda[1:-1, 2:]))
+        novo = livre & np.isinf(dist) & np.isfinite(menor)
+        dist[novo] = menor[novo] + 1.0
+
+    @staticmethod
+    def _ondas(fronteira, passavel, dist, passo):
+        # busca em largura como frentes de onda: cada passo expande a fronteira em 4 direções
+        while fronteira.any():
+            passo += 1
+            viz = np.zeros_like(fronteira)
+            viz[1:, :] |= fronteira[:-1, :]
+            viz[:-1, :] |= fronteira[1:, :]
+            viz[:, 1:] |= fronteira[:, :-1]
+            viz[:, :-1] |= fronteira[:, 1:]
+            fronteira = viz & passavel & np.isinf(dist)
+            dist[fronteira] = passo
+
+    def direcoes(self, xs, ys, alvo_x, alvo_y):
+        """
+        Direções (dx, dy) unitárias de cada posição para o alvo, pelo campo de fluxo.
+        ok: False onde o campo não ajuda (fora da janela, sem caminho ou já no tile do alvo).
+        """
+        c = self.campo(alvo_x, alvo_y)
+        t = self.obstaculos.tile
+        l = np.floor(np.asarray(ys) / t).astype(np.intp) - c.l0
+        col = np.floor(np.asarray(xs) / t).astype(np.intp) - c.c0
+        h, w = c.dx.shape
+        dentro = (l >= 0) & (l < h) & (col >= 0) & (col < w)
+        dx = np.zeros(len(l)); dy = np.zeros(len(l))
+        li = l[dentro]; ci = col[dentro]
+        dx[dentro] = c.dx[li, ci]
+        dy[dentro] = c.dy[li, ci]
+        ok = dentro.copy()
+        ok[dentro] = c.alcancado[li, ci]
+        ok &= (dx != 0) | (dy != 0)
+        return dx, dy, ok
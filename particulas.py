@@ -0,0 +1,116 @@
+"""
+particulas.py - sistema de partículas com pool fixo em arrays NumPy
+
+Substitui uma lista de objetos Particula: as partículas vivas ocupam as
+primeiras 'n' posições dos arrays, a física (arrasto, gravidade, idade) é
+aplicada a todas de uma vez e o desenho usa sprites pré-renderizados
+(por tamanho e nível de transparência) enviados num único Surface.blits().
+"""
+
+import numpy as np
+import pygame
+
+NIVEIS_ALPHA = 16   # quantos níveis de transparência ficam pré-renderizados
+
+
+class SistemaParticulas:
+    """
+    Parâmetros:
+      capacidade: máximo de partículas vivas ao mesmo tempo (as excedentes são descartadas)
+      vida: tempo de vida médio de cada partícula (segundos)
+      cor: cor RGB das partículas
+      rng: numpy.random.Generator usado nas variações aleatórias
+    """
+    def __init__(self, capacidade=8192, vida=0.6, cor=(255, 215, 100), rng=None):
+        self.capacidade = capacidade
+        self.vida_base = vida
+        self.cor = cor
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.n = 0
+        self.x = np.zeros(capacidade)
+        self.y = np.zeros(capacidade)
+        self.vx = np.zeros(capacidade)
+        self.vy = np.zeros(capacidade)
+        self.vida = np.zeros(capacidade)
+        self.idade = np.zeros(capacidade)
+        self.tamanho = np.zeros(capacidade)
+        self._sprites = None
+
+    def __len__(self):
+        return self.n
+
+    def limpar(self):
+        self.n = 0
+
+    def emitir(self, x, y, qtd):
+        """Cria 'qtd' partículas saindo de (x, y) em direções aleatórias."""
+        qtd = min(qtd, self.capacidade - self.n)
+        if qtd <= 0:
+            return
+        a, b = self.n, self.n + qtd
+        rng = self.rng
+        # posição inicial com pequena variação aleatória
+        self.x[a:b] = x + rng.uniform(-6, 6, qtd)
+        self.y[a:b] = y + rng.uniform(-6, 6, qtd)
+        # direção e velocidade aleatória
+        angulo = rng.uniform(0, np.pi*2, qtd)
+        velocidade = rng.uniform(80, 220, qtd)
+        self.vx[a:b] = np.cos(angulo) * velocidade
+        self.vy[a:b] = np.sin(angulo) * velocidade
+        # tempo de vida (com variação) e tamanho
+        self.vida[a:b] = rng.uniform(self.vida_base*0.6, self.vida_base*1.1, qtd)
+        self.idade[a:b] = 0.0
+        self.tamanho[a:b] = rng.uniform(2.0, 5.0, qtd)
+        self.n = b
+
+    def atualizar(self, dt):
+        n = self.n
+        if n == 0:
+            return
+        idade = self.idade[:n]
+        idade += dt
+        vivas = idade < self.vida[:n]
+
+        # desaceleração gradual, gravidade e posição (só nas vivas)
+        arrasto = 1.0 - 3.0*dt
+        vx = self.vx[:n]; vy = self.vy[:n]
+        vx[vivas] *= arrasto
+        vy[vivas] *= arrasto
+        vy[vivas] += 140 * dt
+        self.x[:n][vivas] += vx[vivas] * dt
+        self.y[:n][vivas] += vy[vivas] * dt
+
+        # compacta: as vivas passam a ocupar as primeiras posições
+        k = int(vivas.sum())
+        if k < n:
+            for arr in (self.x, self.y, self.vx, self.vy, self.vida, self.idade, self.tamanho):
+                arr[:k] = arr[:n][vivas]
+            self.n = k
+
+    def _criar_sprites(self):
+        # um círculo por (raio, nível de alpha), montado uma vez só
+        sprites = {}
+        for raio in range(1, 6):
+            for nivel in range(NIVEIS_ALPHA):
+                alpha = int(255 * (nivel + 1) / NIVEIS_ALPHA)
+                s = pygame.Surface((raio*2, raio*2), flags=pygame.SRCALPHA)
+                pygame.draw.circle(s, (*self.cor, alpha), (raio, raio), raio)
+                sprites[(raio, nivel)] = s
+        return sprites
+
+    def desenhar(self, tela, deslocamento=(0, 0)):
+        # deslocamento: canto da câmera, subtraído das posições (mundo -> tela)
+        n = self.n
+        if n == 0:
+            return
+        if self._sprites is None:
+            self._sprites = self._criar_sprites()
+        # transparência proporcional ao tempo de vida, quantizada em NIVEIS_ALPHA
+        frac = 1.0 - self.idade[:n] / self.vida[:n]
+        niveis = np.clip((frac * NIVEIS_ALPHA).astype(np.int32), 0, NIVEIS_ALPHA - 1).tolist()
+        tam = self.tamanho[:n]
+        raios = np.clip(tam.astype(np.int32), 1, 5).tolist()
+        xs = (self.x[:n] - tam - deslocamento[0]).astype(np.int32).tolist()
+        ys = (self.y[:n] - tam - deslocamento[1]).astype(np.int32).tolist()
+        sprites = self._sprites
+        tela.blits([(sprites[(r, a)], (x, y)) for r, a, x, y in zip(raios, niveis, xs, ys)], doreturn=False)
@@ -0,0 +1,184 @@
+"""
+perfil.py - medição do tempo de inicialização e de cada quadro
+
+PerfilInicio acumula quanto tempo cada etapa da partida a frio levou
+(imports, vídeo, fontes, áudio, assets...). As etapas podem ser medidas com
+'with perfil_inicio.etapa("nome"):' ou registradas direto em milissegundos.
+O relatório é impresso pelo modo 'python main.py --profile-startup'.
+
+PerfiladorQuadro mede escopos nomeados do laço principal (eventos, inimigos,
+colisão, névoa, HUD...) num buffer circular, mostra p50/p99 na tela e exporta
+no formato trace-event do Chrome. Desligado, custa só uma chamada de função.
+"""
+
+import json
+import time
+from contextlib import contextmanager, nullcontext
+
+import numpy as np
+import pygame
+
+
+class PerfilInicio:
+    def __init__(self):
+        self.etapas = {}   # nome -> ms acumulados (na ordem em que apareceram)
+        self.contagens = {}
+
+    @contextmanager
+    def etapa(self, nome):
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.registrar(nome, (time.perf_counter() - inicio) * 1000.0)
+
+    def registrar(self, nome, ms):
+        self.etapas[nome] = self.etapas.get(nome, 0.0) + ms
+        self.contagens[nome] = self.contagens.get(nome, 0) + 1
+
+    def relatorio(self, total_ms=None):
+        """Texto com uma linha por etapa (ms, vezes e barra proporcional)."""
+        if not self.etapas:
+            return "nenhuma etapa medida"
+        maior = max(self.etapas.values()) or 1.0
+        linhas = []
+        for nome, ms in self.etapas.items():
+            barra = "#" * max(1, int(30 * ms / maior)) if ms > 0 else ""
+            linhas.append(f"  {nome:<28} {ms:8.1f} ms  x{self.contagens[nome]:<3} {barra}")
+        if total_ms is not None:
+            linhas.append(f"  {'total':<28} {total_ms:8.1f} ms")
+        return "\n".join(linhas)
+
+
+# perfil compartilhado da inicialização
+perfil_inicio = PerfilInicio()
+
+
+class _Escopo:
+    # reaproveitado a cada uso do mesmo nome (sem alocação por medição)
+    __slots__ = ("perfilador", "indice", "inicio")
+
+    def __init__(self, perfilador, indice):
+        self.perfilador = perfilador
+        self.indice = indice
+        self.inicio = 0.0
+
+    def __enter__(self):
+        self.inicio = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self.perfilador._registrar(self.indice, self.inicio, time.perf_counter())
+        return False
+
+
+_NULO = nullcontext()
+ATUALIZAR_SOBREPOSICAO = 15   # quadros entre recálculos dos percentis mostrados na tela
+
+
+class PerfiladorQuadro:
+    """
+    Mede escopos nomeados do laço principal ('with perfilador.escopo("névoa"): ...').
+    As amostras ficam num buffer circular de tamanho fixo (arrays NumPy). Desligado,
+    escopo() devolve sempre o mesmo contexto vazio.
+    Parâmetros:
+      capacidade: quantas amostras (escopos medidos) o buffer guarda
+    """
+    def __init__(self, capacidade=32768):
+        self.ativo = False
+        self.capacidade = capacidade
+        self._nome = np.zeros(capacidade, dtype=np.int16)
+        self._inicio = np.zeros(capacidade)
+        self._fim = np.zeros(capacidade)
+        self._quadro = np.zeros(capacidade, dtype=np.int32)
+        self._pos = 0          # total de amostras já gravadas (a posição é _pos % capacidade)
+        self.quadro = 0
+        self._nomes = []
+        self._escopos = {}
+        self._origem = time.perf_counter()
+        self._linhas = None
+        self._quadro_linhas = 0
+
+    def ligar(self, ativo=True):
+        self.ativo = ativo
+
+    def escopo(self, nome):
+        if not self.ativo:
+            return _NULO
+        e = self._escopos.get(nome)
+        if e is None:
+            e = _Escopo(self, len(self._nomes))
+            self._nomes.append(nome)
+            self._escopos[nome] = e
+        return e
+
+    def proximo_quadro(self):
+        self.quadro += 1
+
+    def _registrar(self, indice, inicio, fim):
+        i = self._pos % self.capacidade
+        self._nome[i] = indice
+        self._inicio[i] = inicio
+        self._fim[i] = fim
+        self._quadro[i] = self.quadro
+        self._pos += 1
+
+    def _amostras(self):
+        n = min(self._pos, self.capacidade)
+        if self._pos <= self.capacidade:
+            fatia = slice(0, n)
+            return self._nome[fatia], self._inicio[fatia], self._fim[fatia], self._quadro[fatia]
+        # buffer já deu a volta: reordena do mais antigo para o mais novo
+        ordem = np.roll(np.arange(self.capacidade), -(self._pos % self.capacidade))
+        return self._nome[ordem], self._inicio[ordem], self._fim[ordem], self._quadro[ordem]
+
+    def percentis(self, quadros=120):
+        """{nome: (p50_ms, p99_ms)} somando cada escopo por quadro, nos últimos 'quadros' quadros."""
+        nomes, inicios, fins, qs = self._amostras()
+        recentes = qs > self.quadro - quadros
+        res = {}
+        for idx, nome in enumerate(self._nomes):
+            sel = recentes & (nomes == idx)
+            if not sel.any():
+                continue
+            # um escopo pode rodar várias vezes no quadro (vários ticks): soma por quadro
+            q = qs[sel]
+            _, grupo = np.unique(q, return_inverse=True)
+            por_quadro = np.bincount(grupo, weights=(fins[sel] - inicios[sel])) * 1000.0
+            res[nome] = (float(np.percentile(por_quadro, 50)), float(np.percentile(por_quadro, 99)))
+        return res
+
+    def desenhar(self, tela, x=None, y=8):
+        """Sobreposição com p50/p99 por escopo. Retorna o Rect desenhado."""
+        from textos import texto
+        # os percentis são recalculados a cada ATUALIZAR_SOBREPOSICAO quadros, não a cada quadro
+        if self._linhas is None or self.quadro - self._quadro_linhas >= ATUALIZAR_SOBREPOSICAO:
+            self._linhas = [f"{nome:<18} p50 {p50:6.2f}  p99 {p99:6.2f} ms"
+                            for nome, (p50, p99) in self.percentis().items()] or ["perfilador: sem amostras"]
+            self._quadro_linhas = self.quadro
+        linhas = self._linhas
+        superficies = [texto(l, 14, (220,255,220), face="couriernew") for l in linhas]
+        largura = max(s.get_width() for s in superficies) + 12
+        altura = sum(s.get_height() for s in superficies) + 12
+        if x is None:
+            x = tela.get_width() - largura - 8
+        caixa = pygame.Rect(x, y, largura, altura)
+        tela.fill((0, 0, 0), caixa)
+        yy = y + 6
+        for s in superficies:
+            tela.blit(s, (x + 6, yy))
+            yy += s.get_height()
+        return caixa
+
+    def exportar_chrome(self, caminho):
+        """Grava as amostras do buffer no formato trace-event do Chrome (chrome://tracing, Perfetto)."""
+        nomes, inicios, fins, qs = self._amostras()
+        eventos = [{"name": self._nomes[n], "cat": "quadro", "ph": "X", "pid": 1, "tid": 1,
+                    "ts": (ini - self._origem) * 1e6, "dur": (fim - ini) * 1e6, "args": {"quadro": int(q)}}
+                   for n, ini, fim, q in zip(nomes.tolist(), inicios.tolist(), fins.tolist(), qs.tolist())]
+        with open(caminho, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": eventos, "displayTimeUnit": "ms"}, f)
+        return len(eventos)
+
+
+# perfilador compartilhado do laço principal (desligado por padrão)
+perfilador = PerfiladorQuadro()
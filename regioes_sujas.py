@@ -0,0 +1,77 @@
+"""
+regioes_sujas.py - atualização da tela só nas regiões que mudaram (dirty rects)
+
+Os métodos de desenho informam quais retângulos alteraram neste quadro;
+apresentar() junta os que se sobrepõem e chama pygame.display.update(rects).
+Se a área suja passar de uma fração da tela (ou se alguém marcou a tela
+inteira), faz um display.flip() normal. Em telas quase estáticas (menu) o
+custo de apresentar o quadro cai para quase zero.
+"""
+
+import pygame
+
+
+class RegioesSujas:
+    """
+    Parâmetros:
+      tamanho_tela: (largura, altura) da janela
+      limite: fração da área da tela a partir da qual vale mais a pena fazer flip()
+    """
+    def __init__(self, tamanho_tela, limite=0.5):
+        self.tela_rect = pygame.Rect((0, 0), tamanho_tela)
+        self.limite = limite
+        self._rects = []
+        self._tudo = False
+        # contadores para diagnóstico
+        self.flips = 0
+        self.updates = 0
+        self.quadros_vazios = 0
+
+    def marcar(self, rect):
+        """Informa que 'rect' (Rect ou (x, y, w, h)) mudou neste quadro."""
+        if self._tudo:
+            return
+        r = pygame.Rect(rect).clip(self.tela_rect)
+        if r.width and r.height:
+            self._rects.append(r)
+
+    def marcar_tudo(self):
+        """A tela inteira mudou (ex.: troca de estado, fundo animado)."""
+        self._tudo = True
+        self._rects.clear()
+
+    @staticmethod
+    def _mesclar(rects):
+        # junta retângulos que se sobrepõem até não sobrar nenhuma sobreposição
+        mesclados = []
+        for r in sorted(rects, key=lambda r: (r.x, r.y)):
+            r = r.copy()
+            mudou = True
+            while mudou:
+                mudou = False
+                for i, m in enumerate(mesclados):
+                    if r.colliderect(m):
+                        r.union_ip(mesclados.pop(i))
+                        mudou = True
+                        break
+            mesclados.append(r)
+        return mesclados
+
+    def apresentar(self):
+        """Envia o quadro para a janela e limpa as marcações."""
+        if self._tudo:
+            pygame.display.flip()
+            self.flips += 1
+        elif self._rects:
+            rects = self._mesclar(self._rects)
+            area = sum(r.width * r.height for r in rects)
+            if area > self.limite * self.tela_rect.width * self.tela_rect.height:
+                pygame.display.flip()
+                self.flips += 1
+            else:
+                pygame.display.update(rects)
+                self.updates += 1
+        else:
+            self.quadros_vazios += 1
+        self._tudo = False
+        self._rects.clear()
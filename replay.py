@@ -0,0 +1,232 @@
+"""
+replay.py - gravação de sessões e replay determinístico em velocidade máxima
+
+Com a mesma semente e as mesmas entradas, o JogoEco produz exatamente a mesma
+partida (o relógio é simulado e toda a aleatoriedade da lógica vem de
+jogo.rng / jogo.rng_np). O Gravador guarda, a cada tick da simulação, as
+teclas de movimento pressionadas e as teclas apertadas (KEYDOWN), além de um
+hash do estado depois do tick. O replayer roda o jogo sem janela, o mais
+rápido possível, e compara os hashes tick a tick.
+
+Formato do arquivo (little-endian):
+  "ECOR", versão (u8), semente (u64), passo (f64), ticks (u32),
+  quantidade de teclas (u8) + códigos (u32 cada),
+  tamanho (u32) + corpo compactado com zlib, tamanho (u32) + hashes (8 bytes por tick)
+O corpo só tem registros dos ticks em que algo mudou:
+  delta de ticks desde o registro anterior (varint), máscara de teclas (u8),
+  quantidade de KEYDOWNs (varint) + códigos das teclas (varint)
+
+Uso:
+  python main.py --gravar sessao.eco [--seed 42]
+  python replay.py sessao.eco [--repetir 5]
+"""
+
+import argparse
+import struct
+import sys
+import time
+import zlib
+
+import pygame
+
+MAGICO = b"ECOR"
+VERSAO = 1
+# teclas lidas por Jogador.atualizar (uma por bit da máscara)
+TECLAS = (pygame.K_w, pygame.K_UP, pygame.K_s, pygame.K_DOWN,
+          pygame.K_a, pygame.K_LEFT, pygame.K_d, pygame.K_RIGHT)
+
+
+def _varint(valor, saida):
+    while True:
+        b = valor & 0x7F
+        valor >>= 7
+        if valor:
+            saida.append(b | 0x80)
+        else:
+            saida.append(b)
+            return
+
+
+def _ler_varint(dados, pos):
+    valor = 0
+    desloc = 0
+    while True:
+        b = dados[pos]
+        pos += 1
+        valor |= (b & 0x7F) << desloc
+        if not b & 0x80:
+            return valor, pos
+        desloc += 7
+
+
+class Gravador:
+    """
+    Parâmetros:
+      seed: semente do JogoEco gravado
+      passo: duração de cada tick (PASSO_SIM)
+    """
+    def __init__(self, seed, passo):
+        self.seed = seed
+        self.passo = passo
+        self.mascaras = bytearray()   # uma por tick
+        self.eventos = {}             # tick -> [teclas apertadas antes dele]
+        self.hashes = bytearray()     # 8 bytes por tick
+        self._pendentes = []
+
+    def evento(self, tecla):
+        """KEYDOWN tratado pelo jogo; vale para o próximo tick."""
+        self._pendentes.append(int(tecla))
+
+    def tick(self, teclas):
+        """Chamado no início de cada tick com o estado das teclas (get_pressed ou equivalente)."""
+        mascara = 0
+        for bit, tecla in enumerate(TECLAS):
+            if teclas[tecla]:
+                mascara |= 1 << bit
+        if self._pendentes:
+            self.eventos[len(self.mascaras)] = self._pendentes
+            self._pendentes = []
+        self.mascaras.append(mascara)
+
+    def hash(self, digest):
+        self.hashes += digest
+
+    def codificar(self):
+        corpo = bytearray()
+        anterior_tick = 0
+        anterior_mascara = 0
+        for i, mascara in enumerate(self.mascaras):
+            eventos = self.eventos.get(i)
+            if mascara == anterior_mascara and not eventos:
+                continue
+            _varint(i - anterior_tick, corpo)
+            corpo.append(mascara)
+            _varint(len(eventos or ()), corpo)
+            for tecla in eventos or ():
+                _varint(tecla, corpo)
+            anterior_tick, anterior_mascara = i, mascara
+        compactado = zlib.compress(bytes(corpo), 9)
+        cab = MAGICO + struct.pack("<BQdIB", VERSAO, self.seed, self.passo, len(self.mascaras), len(TECLAS))
+        cab += struct.pack(f"<{len(TECLAS)}I", *TECLAS)
+        return (cab + struct.pack("<I", len(compactado)) + compactado
+                + struct.pack("<I", len(self.hashes)) + bytes(self.hashes))
+
+    def salvar(self, caminho):
+        dados = self.codificar()
+        with open(caminho, "wb") as f:
+            f.write(dados)
+        return len(dados)
+
+
+class Sessao:
+    """Sessão lida de um arquivo: semente, passo, teclas por tick, eventos e hashes."""
+    def __init__(self, seed, passo, teclas, mascaras, eventos, hashes):
+        self.seed = seed
+        self.passo = passo
+        self.teclas = teclas
+        self.mascaras = mascaras
+        self.eventos = eventos
+        self.hashes = hashes
+
+    def __len__(self):
+        return len(self.mascaras)
+
+    @classmethod
+    def carregar(cls, caminho):
+        with open(caminho, "rb") as f:
+            dados = f.read()
+        if dados[:4] != MAGICO:
+            raise ValueError(f"{caminho}: não é uma gravação do ECO")
+        versao, seed, passo, ticks, n_teclas = struct.unpack_from("<BQdIB", dados, 4)
+        if versao != VERSAO:
+            raise ValueError(f"{caminho}: versão {versao} não suportada")
+        pos = 4 + struct.calcsize("<BQdIB")
+        teclas = struct.unpack_from(f"<{n_teclas}I", dados, pos)
+        pos += 4 * n_teclas
+        (tam,) = struct.unpack_from("<I", dados, pos)
+        corpo = zlib.decompress(dados[pos + 4:pos + 4 + tam])
+        pos += 4 + tam
+        (tam,) = struct.unpack_from("<I", dados, pos)
+        hashes = dados[pos + 4:pos + 4 + tam]
+
+        # expande os registros delta em uma máscara por tick
+        mascaras = bytearray(ticks)
+        eventos = {}
+        p = 0
+        tick = 0
+        mascara = 0
+        while p < len(corpo):
+            delta, p = _ler_varint(corpo, p)
+            mascaras[tick:tick + delta] = bytes([mascara]) * delta
+            tick += delta
+            mascara = corpo[p]
+            p += 1
+            n, p = _ler_varint(corpo, p)
+            lista = []
+            for _ in range(n):
+                tecla, p = _ler_varint(corpo, p)
+                lista.append(tecla)
+            if lista:
+                eventos[tick] = lista
+        mascaras[tick:] = bytes([mascara]) * (ticks - tick)
+        return cls(seed, passo, teclas, mascaras, eventos, hashes)
+
+
+def reproduzir(sessao, verificar=True):
+    """
+    Roda a sessão sem janela, o mais rápido possível.
+    Retorna um dicionário com ticks, tempo, ticks/s e o primeiro tick divergente (ou None).
+    """
+    # importados aqui: simulacao liga o driver de vídeo "dummy", o que não pode
+    # acontecer quando este módulo é usado só para gravar pelo main.py
+    import main
+    from cronometro import CronometroSimulado
+    from simulacao import TeclasSimuladas
+
+    if abs(sessao.passo - main.PASSO_SIM) > 1e-12:
+        raise ValueError(f"gravação com passo {sessao.passo}, mas o jogo usa {main.PASSO_SIM}")
+    jogo = main.JogoEco(cronometro=CronometroSimulado(), sem_audio=True, seed=sessao.seed)
+    # TeclasSimuladas pré-montadas para cada máscara possível
+    por_mascara = {}
+    divergente = None
+    inicio = time.perf_counter()
+    for i, mascara in enumerate(sessao.mascaras):
+        for tecla in sessao.eventos.get(i, ()):
+            jogo.tratar_tecla(tecla)
+        teclas = por_mascara.get(mascara)
+        if teclas is None:
+            teclas = TeclasSimuladas(t for bit, t in enumerate(sessao.teclas) if mascara >> bit & 1)
+            por_mascara[mascara] = teclas
+        jogo.passo_simulacao(teclas)
+        if verificar and divergente is None and len(sessao.hashes) >= 8 * (i + 1):
+            if jogo.hash_estado() != sessao.hashes[8 * i:8 * (i + 1)]:
+                divergente = i
+    duracao = time.perf_counter() - inicio
+    return {
+        "ticks": len(sessao),
+        "segundos_jogo": len(sessao) * sessao.passo,
+        "segundos_reais": duracao,
+        "ticks_por_segundo": len(sessao) / duracao if duracao > 0 else float("inf"),
+        "divergente": divergente,
+        "pontuacao": getattr(jogo, "pontuacao", 0),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay headless de uma sessão gravada do ECO")
+    parser.add_argument("arquivo", help="gravação (python main.py --gravar arquivo)")
+    parser.add_argument("--repetir", type=int, default=1, help="quantas vezes rodar (carga de desempenho)")
+    parser.add_argument("--sem-verificar", action="store_true", help="não compara os hashes de estado")
+    args = parser.parse_args()
+    sessao = Sessao.carregar(args.arquivo)
+    falhou = False
+    for k in range(args.repetir):
+        r = reproduzir(sessao, not args.sem_verificar)
+        print(f"{r['ticks']} ticks ({r['segundos_jogo']:.0f}s de jogo) em {r['segundos_reais']:.2f}s "
+              f"— {r['ticks_por_segundo']:.0f} ticks/s, pontuação {r['pontuacao']}", end="")
+        if r["divergente"] is not None:
+            falhou = True
+            print(f" — DIVERGIU no tick {r['divergente']}")
+        else:
+            print(" — estado idêntico" if not args.sem_verificar else "")
+    sys.exit(1 if falhou else 0)
@@ -0,0 +1,92 @@
+"""
+simulacao.py - roda o jogo sem janela e sem som, em passo fixo, o mais rápido possível
+
+Usa o driver de vídeo "dummy" do SDL, SilentSound no lugar dos sons e um
+CronometroSimulado que só anda junto com a simulação. Um "bot" simples anda
+em direções aleatórias e emite pings, e o jogo é reiniciado sempre que
+termina. Serve para testes de resistência (soak) e ajustes de balanceamento.
+Uso: python simulacao.py --horas 2 --dt 0.0166 --seed 1
+"""
+
+import os
+
+# precisa ser definido antes do pygame abrir o display
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import random
+import time
+
+import pygame
+
+import main
+from cronometro import CronometroSimulado
+
+
+class TeclasSimuladas:
+    """Imita o retorno de pygame.key.get_pressed(): teclas[pygame.K_w] -> bool."""
+    def __init__(self, pressionadas=()):
+        self.pressionadas = set(pressionadas)
+
+    def __getitem__(self, tecla):
+        return tecla in self.pressionadas
+
+
+def criar_jogo_headless(cronometro=None, seed=None):
+    """Cria um JogoEco sem áudio, com relógio simulado, já no estado JOGANDO."""
+    cronometro = cronometro or CronometroSimulado()
+    jogo = main.JogoEco(cronometro=cronometro, sem_audio=True, seed=seed)
+    jogo.tratar_tecla(pygame.K_RETURN)   # sai do menu como o jogador faria
+    return jogo
+
+
+def rodar_headless(segundos, dt=1.0/main.FPS, seed=None, jogo=None):
+    """
+    Simula 'segundos' de jogo em passos fixos de 'dt'.
+    Retorna um dicionário com o resumo (tempo simulado, tempo real, pontuação...).
+    """
+    rng = random.Random(seed)
+    jogo = jogo or criar_jogo_headless(seed=seed)
+    cron = jogo.cronometro
+    direcoes = [(), (pygame.K_w,), (pygame.K_s,), (pygame.K_a,), (pygame.K_d,),
+                (pygame.K_w, pygame.K_a), (pygame.K_w, pygame.K_d),
+                (pygame.K_s, pygame.K_a), (pygame.K_s, pygame.K_d)]
+    teclas = TeclasSimuladas()
+    passos = int(segundos / dt)
+    partidas = 1
+    pontos_total = 0
+    inicio = time.perf_counter()
+    for i in range(passos):
+        # o bot troca de direção ~1x por segundo e pinga de vez em quando
+        if rng.random() < dt:
+            teclas = TeclasSimuladas(rng.choice(direcoes))
+        if rng.random() < dt * 0.8:
+            jogo.tratar_tecla(pygame.K_SPACE)
+        cron.avancar(dt)
+        jogo.atualizar(dt, teclas)
+        if jogo.estado == main.EstadoJogo.FIM:
+            pontos_total += jogo.pontuacao
+            partidas += 1
+            jogo.tratar_tecla(pygame.K_RETURN)
+    duracao = time.perf_counter() - inicio
+    return {
+        "segundos_simulados": passos * dt,
+        "segundos_reais": duracao,
+        "aceleracao": (passos * dt) / duracao if duracao > 0 else float("inf"),
+        "passos": passos,
+        "partidas": partidas,
+        "pontuacao_total": pontos_total + jogo.pontuacao,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulação headless do ECO em passo fixo")
+    parser.add_argument("--horas", type=float, default=0.0, help="horas de jogo simulado")
+    parser.add_argument("--segundos", type=float, default=60.0, help="segundos de jogo simulado (somado a --horas)")
+    parser.add_argument("--dt", type=float, default=1.0/main.FPS, help="passo fixo da simulação")
+    parser.add_argument("--seed", type=int, default=None, help="semente do bot")
+    args = parser.parse_args()
+    r = rodar_headless(args.horas * 3600 + args.segundos, args.dt, args.seed)
+    print(f"{r['segundos_simulados']:.0f}s simulados em {r['segundos_reais']:.2f}s "
+          f"({r['aceleracao']:.0f}x) — {r['partidas']} partidas, {r['pontuacao_total']} itens coletados")
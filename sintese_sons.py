@@ -0,0 +1,212 @@
+"""
+sintese_sons.py - gera os sons do jogo a partir de um único arquivo de especificação
+
+Cada som de assets/sons/sons.json é descrito por camadas (osciladores com
+envelope e modulação) somadas e escritas como WAV mono 16 bits. Tudo é
+calculado com NumPy sobre o vetor inteiro de amostras, sem laço por amostra.
+Um cache guarda o hash da especificação de cada som: só é refeito o que mudou
+(ou cujo WAV sumiu), e os sons independentes rodam em paralelo num pool de
+processos.
+
+Uso:
+  python sintese_sons.py              # refaz só o que mudou
+  python sintese_sons.py --tudo       # refaz todos
+  python sintese_sons.py ping.wav     # só os sons indicados
+
+Especificação de um som:
+  {"duracao": s, "volume": 0..1, "envelope": {...}, "passa_baixa": Hz, "camadas": [...]}
+Cada camada:
+  onda: seno | quadrada | serra | triangulo | ruido
+  freq, freq_fim (varredura linear), ganho, inicio, duracao, semente (ruído)
+  am: {"freq": Hz, "prof": fração}   modulação de amplitude
+  fm: {"freq": Hz, "prof": Hz}       vibrato
+  envelope: {"ataque": s, "queda": s, "sustentacao": 0..1, "liberacao": s}
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+import wave
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+DIR_SONS = Path("assets") / "sons"
+ARQ_SPEC = DIR_SONS / "sons.json"
+ARQ_CACHE = DIR_SONS / ".sintese_cache.json"
+VERSAO = 1   # mudar quando o algoritmo de síntese mudar (invalida o cache inteiro)
+
+
+def _envelope(n, taxa, env):
+    # ADSR: sobe em 'ataque', cai até 'sustentacao' em 'queda' e vai a zero nos últimos 'liberacao' s
+    if not env:
+        return None
+    t = np.arange(n) / taxa
+    dur = n / taxa
+    a = env.get("ataque", 0.0)
+    d = env.get("queda", 0.0)
+    s = env.get("sustentacao", 1.0)
+    r = env.get("liberacao", 0.0)
+    e = np.full(n, s, dtype=np.float64)
+    if a > 0:
+        sob = t < a
+        e[sob] = t[sob] / a
+    if d > 0:
+        caindo = (t >= a) & (t < a + d)
+        e[caindo] = 1.0 - (1.0 - s) * (t[caindo] - a) / d
+    if r > 0:
+        fim = t > dur - r
+        e[fim] *= np.clip((dur - t[fim]) / r, 0.0, 1.0)
+    return e
+
+
+def _camada(c, n, taxa):
+    t = np.arange(n) / taxa
+    f0 = c.get("freq", 440.0)
+    f1 = c.get("freq_fim", f0)
+    fm = c.get("fm")
+    if f1 == f0 and not fm:
+        fase = 2 * np.pi * f0 * t
+    else:
+        # frequência instantânea integrada: permite varredura e vibrato
+        freq = f0 + (f1 - f0) * (t / t[-1] if n > 1 else 0.0)
+        if fm:
+            freq = freq + fm["prof"] * np.sin(2 * np.pi * fm["freq"] * t)
+        fase = 2 * np.pi * np.concatenate(([0.0], np.cumsum(freq[:-1]) / taxa))
+
+    onda = c.get("onda", "seno")
+    if onda == "seno":
+        sinal = np.sin(fase)
+    elif onda == "quadrada":
+        sinal = np.sign(np.sin(fase))
+    elif onda == "serra":
+        sinal = 2.0 * ((fase / (2 * np.pi)) % 1.0) - 1.0
+    elif onda == "triangulo":
+        sinal = 2.0 * np.abs(2.0 * ((fase / (2 * np.pi)) % 1.0) - 1.0) - 1.0
+    elif onda == "ruido":
+        sinal = np.random.default_rng(c.get("semente", 0)).uniform(-1.0, 1.0, n)
+    else:
+        raise ValueError(f"onda desconhecida: {onda}")
+
+    am = c.get("am")
+    if am:
+        sinal = sinal * (1.0 + am["prof"] * np.sin(2 * np.pi * am["freq"] * t))
+    env = _envelope(n, taxa, c.get("envelope"))
+    if env is not None:
+        sinal = sinal * env
+    return sinal * c.get("ganho", 1.0)
+
+
+def _passa_baixa(sinal, taxa, corte):
+    # corta as frequências acima de 'corte' no domínio da frequência
+    espectro = np.fft.rfft(sinal)
+    espectro[np.fft.rfftfreq(len(sinal), 1.0 / taxa) > corte] = 0.0
+    return np.fft.irfft(espectro, len(sinal))
+
+
+def sintetizar(spec, taxa):
+    """Amostras int16 de um som a partir da especificação."""
+    n = int(taxa * spec["duracao"])
+    mistura = np.zeros(n, dtype=np.float64)
+    for c in spec.get("camadas", []):
+        inicio = int(c.get("inicio", 0.0) * taxa)
+        if inicio >= n:
+            continue
+        m = min(n - inicio, int(c["duracao"] * taxa) if "duracao" in c else n - inicio)
+        mistura[inicio:inicio + m] += _camada(c, m, taxa)
+    env = _envelope(n, taxa, spec.get("envelope"))
+    if env is not None:
+        mistura *= env
+    if "passa_baixa" in spec:
+        mistura = _passa_baixa(mistura, taxa, spec["passa_baixa"])
+    amp = int(32767 * spec.get("volume", 1.0))
+    # trunca em direção ao zero, como int() faria amostra a amostra
+    return np.clip(np.trunc(amp * mistura), -32768, 32767).astype("<i2")
+
+
+def _gerar_um(args):
+    nome, spec, taxa, pasta = args
+    inicio = time.perf_counter()
+    amostras = sintetizar(spec, taxa)
+    with wave.open(str(Path(pasta) / nome), "wb") as wav:
+        wav.setnchannels(1)       # mono
+        wav.setsampwidth(2)       # 16-bit
+        wav.setframerate(taxa)
+        wav.writeframes(amostras.tobytes())
+    return nome, (time.perf_counter() - inicio) * 1000.0
+
+
+def hash_spec(spec, taxa):
+    texto = json.dumps({"versao": VERSAO, "taxa": taxa, "spec": spec}, sort_keys=True)
+    return hashlib.sha1(texto.encode("utf-8")).hexdigest()
+
+
+def _ler_cache(caminho):
+    try:
+        with open(caminho, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def gerar(nomes=None, tudo=False, paralelo=True, arq_spec=ARQ_SPEC, pasta=None, arq_cache=None):
+    """
+    Gera os sons pedidos ('nomes'; padrão: todos da especificação) cuja especificação mudou.
+    Retorna (gerados, sem_mudanca, ms): lista de (nome, ms) e lista de nomes pulados.
+    """
+    arq_spec = Path(arq_spec)
+    pasta = Path(pasta) if pasta is not None else arq_spec.parent
+    arq_cache = Path(arq_cache) if arq_cache is not None else pasta / ARQ_CACHE.name
+    with open(arq_spec, encoding="utf-8") as f:
+        especificacao = json.load(f)
+    taxa = especificacao.get("taxa", 44100)
+    sons = especificacao["sons"]
+    desconhecidos = [n for n in (nomes or []) if n not in sons]
+    if desconhecidos:
+        raise KeyError(f"sons fora de {arq_spec}: {', '.join(desconhecidos)}")
+
+    pasta.mkdir(parents=True, exist_ok=True)
+    cache = _ler_cache(arq_cache)
+    hashes = {nome: hash_spec(sons[nome], taxa) for nome in (nomes or sons)}
+    pendentes = [n for n, h in hashes.items()
+                 if tudo or cache.get(n) != h or not (pasta / n).exists()]
+    sem_mudanca = [n for n in hashes if n not in pendentes]
+
+    inicio = time.perf_counter()
+    tarefas = [(n, sons[n], taxa, str(pasta)) for n in pendentes]
+    if paralelo and len(tarefas) > 1:
+        with ProcessPoolExecutor(max_workers=min(len(tarefas), os.cpu_count() or 1)) as pool:
+            gerados = list(pool.map(_gerar_um, tarefas))
+    else:
+        gerados = [_gerar_um(t) for t in tarefas]
+    ms = (time.perf_counter() - inicio) * 1000.0
+
+    if gerados:
+        cache.update({n: hashes[n] for n, _ in gerados})
+        with open(arq_cache, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2, sort_keys=True)
+    return gerados, sem_mudanca, ms
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gera os sons do ECO a partir de assets/sons/sons.json")
+    parser.add_argument("nomes", nargs="*", help="sons a gerar (padrão: todos)")
+    parser.add_argument("--tudo", action="store_true", help="ignora o cache e refaz tudo")
+    parser.add_argument("--sequencial", action="store_true", help="não usa o pool de processos")
+    parser.add_argument("--spec", default=str(ARQ_SPEC), help="arquivo de especificação")
+    parser.add_argument("--saida", help="pasta dos WAVs (padrão: a pasta da especificação)")
+    args = parser.parse_args(argv)
+
+    gerados, sem_mudanca, ms = gerar(args.nomes or None, args.tudo, not args.sequencial, args.spec, args.saida)
+    for nome, t in gerados:
+        print(f"  {nome:<20} {t:7.2f} ms")
+    print(f"{len(gerados)} gerados, {len(sem_mudanca)} sem mudança, {ms:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
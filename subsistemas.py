@@ -0,0 +1,55 @@
+"""
+subsistemas.py - inicialização preguiçosa e idempotente do pygame
+
+Nenhum módulo inicializa vídeo, fontes ou áudio ao ser importado. Cada
+subsistema é ligado na primeira vez que alguém precisa dele, uma vez só; as
+chamadas seguintes não fazem nada. O tempo de cada inicialização vai para o
+perfil de inicialização (perfil.py).
+Uso: if mixer_ok(): pygame.mixer.Sound(...)
+"""
+
+import threading
+
+import pygame
+
+from perfil import perfil_inicio
+
+_trava = threading.Lock()
+_audio = None   # None = ainda não tentou; True/False = resultado da tentativa
+
+
+def iniciar_video():
+    """Liga o subsistema de vídeo/eventos (necessário antes de set_mode)."""
+    if not pygame.display.get_init():
+        with perfil_inicio.etapa("vídeo (display.init)"):
+            pygame.display.init()
+
+
+def iniciar_fontes():
+    if not pygame.font.get_init():
+        with perfil_inicio.etapa("fontes (font.init)"):
+            pygame.font.init()
+
+
+def iniciar_audio():
+    """Tenta ligar o mixer uma única vez. Retorna True se o áudio está disponível."""
+    global _audio
+    if _audio is not None:
+        return _audio
+    with _trava:
+        if _audio is None:
+            with perfil_inicio.etapa("áudio (mixer.init)"):
+                try:
+                    if not pygame.mixer.get_init():
+                        pygame.mixer.init()
+                    _audio = True
+                except Exception as e:
+                    # mixer não inicializou (ex.: ambiente headless / sem áudio)
+                    print("Aviso: pygame.mixer não pôde inicializar:", e)
+                    _audio = False
+    return _audio
+
+
+def mixer_ok():
+    """True se o mixer está (ou pôde ser) inicializado; inicializa no primeiro uso."""
+    return iniciar_audio()
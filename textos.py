@@ -0,0 +1,58 @@
+"""
+textos.py - registro de fontes e cache de textos renderizados
+
+pygame.font.SysFont procura e constrói a fonte toda vez que é chamado, e
+Font.render gera uma Surface nova a cada chamada. Aqui cada (face, tamanho,
+negrito) é resolvido uma vez só, e as Surfaces de texto ficam num cache LRU
+indexado por (fonte, texto, cor): um texto que não muda custa só um blit.
+Uso: tela.blit(texto("ITEM", 16, (255,200,80)), pos)
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+from perfil import perfil_inicio
+from subsistemas import iniciar_fontes
+
+FACE_PADRAO = "arial"
+MAX_TEXTOS = 256   # quantas Surfaces de texto ficam guardadas
+
+_fontes = {}                 # (face, tamanho, negrito) -> pygame.font.Font
+_textos = OrderedDict()      # (face, tamanho, negrito, texto, cor) -> Surface
+estatisticas = {"acertos": 0, "falhas": 0}
+
+
+def fonte(tamanho, bold=False, face=FACE_PADRAO):
+    """Retorna a fonte (criada só na primeira vez que for pedida)."""
+    chave = (face, int(tamanho), bool(bold))
+    f = _fontes.get(chave)
+    if f is None:
+        iniciar_fontes()
+        # a primeira SysFont varre as fontes do sistema: costuma ser a parte cara
+        with perfil_inicio.etapa("fontes (SysFont)"):
+            f = pygame.font.SysFont(face, int(tamanho), bold=bool(bold))
+        _fontes[chave] = f
+    return f
+
+
+def texto(conteudo, tamanho, cor, bold=False, face=FACE_PADRAO):
+    """Retorna a Surface do texto já renderizado (com antialias), usando o cache LRU."""
+    chave = (face, int(tamanho), bool(bold), conteudo, tuple(cor))
+    s = _textos.get(chave)
+    if s is not None:
+        _textos.move_to_end(chave)
+        estatisticas["acertos"] += 1
+        return s
+    estatisticas["falhas"] += 1
+    s = fonte(tamanho, bold, face).render(conteudo, True, cor)
+    _textos[chave] = s
+    if len(_textos) > MAX_TEXTOS:
+        _textos.popitem(last=False)
+    return s
+
+
+def limpar():
+    """Esquece fontes e textos (ex.: depois de pygame.font.quit())."""
+    _fontes.clear()
+    _textos.clear()